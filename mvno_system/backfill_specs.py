@@ -0,0 +1,91 @@
+import argparse
+import os
+import sys
+import time
+
+# 프로젝트 루트 경로 추가 (mvno_system 폴더)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+from sqlalchemy import select, update
+
+from core.spec_parser import parse_specs, detail_value, SPEC_COLUMNS
+from storage.database import SessionLocal, CurrentPlan, Plan, init_db
+
+# 기존 plans 행의 스펙 숫자 컬럼 일괄 채우기 (price_int 재계산 포함)
+# current_plans 스냅샷은 끝에서 복사 원본(plan_id) 의 값으로 맞춘다 (다음 크롤링까지 이전 값이 남지 않도록)
+#
+#   python backfill_specs.py               # 스펙 컬럼이 비어 있는 행만
+#   python backfill_specs.py --all         # 전체 재파싱 (파서 규칙 변경 후)
+
+INT_COLUMNS = {'price_int', 'price_regular_int', 'price_promo_int', 'promo_months', 'voice_min', 'sms_count'}
+
+
+def backfill(chunk_size=5000, all_rows=False):
+    """id 순으로 chunk_size 행씩 읽어 파싱 후 기본키 기준 bulk update, 청크마다 커밋. 반환: 갱신 행 수"""
+    db = SessionLocal()
+    updated = 0
+    last_id = 0
+    try:
+        while True:
+            query = db.query(Plan.id, Plan.price, Plan.data_raw, Plan.details).filter(Plan.id > last_id)
+            if not all_rows:
+                query = query.filter(Plan.price_regular_int.is_(None), Plan.data_gb.is_(None))
+            rows = query.order_by(Plan.id).limit(chunk_size).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            frame = pd.DataFrame({
+                'price': [r.price for r in rows],
+                'data_raw': [r.data_raw for r in rows],
+                'voice': [detail_value(r.details, 'voice') for r in rows],
+                'sms': [detail_value(r.details, 'sms') for r in rows],
+            })
+            specs = parse_specs(frame).astype('object')
+            specs = specs.where(specs.notna(), None)
+            values = []
+            for plan_id, record in zip((r.id for r in rows), specs.to_dict('records')):
+                for name in INT_COLUMNS:
+                    if record[name] is not None:
+                        record[name] = int(record[name])
+                values.append({'id': plan_id, **record})
+
+            db.execute(update(Plan), values)
+            db.commit()
+            updated += len(values)
+            print(f"  {updated}행 처리 (id <= {last_id})")
+    finally:
+        db.close()
+    return updated
+
+
+def sync_current_plans():
+    """current_plans 의 스펙 컬럼을 복사 원본 관측 행(plan_id) 값으로 갱신 (1 트랜잭션). 반환: 갱신 행 수"""
+    db = SessionLocal()
+    try:
+        values = {
+            name: select(getattr(Plan, name)).where(Plan.id == CurrentPlan.plan_id).scalar_subquery()
+            for name in SPEC_COLUMNS
+        }
+        count = db.execute(
+            update(CurrentPlan).where(CurrentPlan.plan_id.isnot(None)).values(**values),
+            execution_options={'synchronize_session': False}
+        ).rowcount
+        db.commit()
+        return count
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='plans 스펙 숫자 컬럼 backfill')
+    parser.add_argument('--all', action='store_true', help='이미 채워진 행도 다시 파싱')
+    parser.add_argument('--chunk', type=int, default=5000)
+    args = parser.parse_args()
+
+    init_db()  # 새 컬럼/인덱스 보강
+    started = time.perf_counter()
+    count = backfill(args.chunk, args.all)
+    current = sync_current_plans()
+    print(f"=== {count}행 완료, current_plans {current}행 동기화 ({time.perf_counter() - started:.1f}s), 컬럼: {', '.join(SPEC_COLUMNS)} ===")
@@ -0,0 +1,138 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from playwright.async_api import async_playwright
+
+from core.platform_loader import PlatformLoader
+
+logger = logging.getLogger('browser_pool')
+
+class BrowserPool:
+    """
+    프로세스 전역 Chromium 풀
+    크롤러마다 브라우저를 새로 띄우지 않고, 미리 띄운 브라우저에서
+    격리된 BrowserContext 만 발급한다. (쿠키/스토리지는 컨텍스트 단위로 분리됨)
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(BrowserPool, cls).__new__(cls)
+            cls._instance.config = PlatformLoader().get_settings('browser_pool')
+            cls._instance.launches = 0  # 프로세스 시작 후 Chromium 실행 횟수 (벤치마크/리포트용)
+            cls._instance._reset()
+        return cls._instance
+
+    def _reset(self):
+        self._playwright = None
+        self._browsers = {}   # headless(bool) -> [Browser, ...]
+        self._leases = {}     # Browser -> 사용 중인 컨텍스트 수
+        self._lock = None
+        self._loop = None
+
+    @property
+    def max_browsers(self):
+        return max(1, int(self.config.get('max_browsers', 2)))
+
+    @property
+    def max_contexts_per_browser(self):
+        return max(1, int(self.config.get('max_contexts_per_browser', 6)))
+
+    def _bind_loop(self):
+        """이벤트 루프가 바뀌면(asyncio.run 재호출 등) 이전 루프의 객체는 재사용 불가"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._loop is not None:
+                logger.warning("이벤트 루프 변경 감지 - 브라우저 풀 재초기화")
+            self._reset()
+            self._loop = loop
+            self._lock = asyncio.Lock()
+
+    async def _launch(self, headless):
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+
+        browser = await self._playwright.chromium.launch(
+            headless=headless,
+            args=self.config.get('launch_args') or []
+        )
+        self.launches += 1
+        browser.on('disconnected', lambda b: self._discard(b))
+        self._browsers.setdefault(headless, []).append(browser)
+        self._leases[browser] = 0
+        logger.info(f"Chromium 실행 (headless={headless}, 현재 {len(self._browsers[headless])}/{self.max_browsers})")
+        return browser
+
+    def _discard(self, browser):
+        """크래시 등으로 끊긴 브라우저는 풀에서 제거 (다음 요청 시 재실행)"""
+        for browsers in self._browsers.values():
+            if browser in browsers:
+                browsers.remove(browser)
+        self._leases.pop(browser, None)
+
+    async def _acquire_browser(self, headless):
+        self._bind_loop()
+        async with self._lock:
+            browsers = [b for b in self._browsers.get(headless, []) if b.is_connected()]
+            self._browsers[headless] = browsers
+
+            # 가장 한가한 브라우저 선택, 모두 포화 상태이고 여유가 있으면 새로 실행
+            browser = min(browsers, key=lambda b: self._leases.get(b, 0)) if browsers else None
+            if browser is None or (
+                self._leases[browser] >= self.max_contexts_per_browser
+                and len(browsers) < self.max_browsers
+            ):
+                browser = await self._launch(headless)
+
+            self._leases[browser] += 1
+            return browser
+
+    def _release_browser(self, browser):
+        if browser in self._leases:
+            self._leases[browser] = max(0, self._leases[browser] - 1)
+
+    @asynccontextmanager
+    async def context(self, headless=True, **context_options):
+        """
+        격리된 BrowserContext 발급
+
+        Usage:
+            async with BrowserPool().context(headless=True, viewport=...) as context:
+                page = await context.new_page()
+        """
+        browser = await self._acquire_browser(headless)
+        try:
+            context = await browser.new_context(**context_options)
+        except Exception:
+            self._release_browser(browser)
+            raise
+
+        try:
+            yield context
+        finally:
+            self._release_browser(browser)
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"컨텍스트 종료 중 무시된 에러: {e}")
+
+    async def shutdown(self):
+        """모든 브라우저와 Playwright 드라이버 종료 (main/스케줄러 종료 시 호출)"""
+        if self._loop is None:
+            return
+
+        for browsers in list(self._browsers.values()):
+            for browser in list(browsers):
+                try:
+                    await browser.close()
+                except Exception as e:
+                    logger.debug(f"브라우저 종료 중 무시된 에러: {e}")
+
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.debug(f"Playwright 종료 중 무시된 에러: {e}")
+
+        self._reset()
+        logger.info("브라우저 풀 종료")
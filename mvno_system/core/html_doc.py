@@ -0,0 +1,93 @@
+import re
+
+from bs4 import BeautifulSoup, NavigableString
+
+# 브라우저 없이 서버 렌더링 HTML 을 파싱 (fetch_mode: http, fixture 서버)
+# 파싱은 html5lib (브라우저와 같은 트리: 닫히지 않은 p/li/td, table 아래 tbody 삽입 등),
+# CSS 셀렉터는 soupsieve (BeautifulSoup.select) - 셀렉터 YAML 을 page.query_selector 와 같은 의미로 사용
+
+SKIP_TEXT_TAGS = {'script', 'style', 'noscript', 'template', 'head'}
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt', 'fieldset',
+    'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'table',
+    'tbody', 'td', 'tfoot', 'th', 'thead', 'tr', 'ul'
+}
+
+
+class Node:
+    """BeautifulSoup 요소 래퍼 (select/select_one/text/get_attribute - Playwright ElementHandle 과 비슷한 사용법)"""
+    __slots__ = ('element',)
+
+    def __init__(self, element):
+        self.element = element
+
+    @property
+    def tag(self):
+        return self.element.name
+
+    @property
+    def attrs(self):
+        return self.element.attrs
+
+    @property
+    def parent(self):
+        parent = self.element.parent
+        return Node(parent) if parent is not None else None
+
+    def get_attribute(self, name, default=None):
+        return self.element.get(name, default)
+
+    def select(self, selector):
+        return select(self, selector)
+
+    def select_one(self, selector):
+        found = select(self, selector, limit=1)
+        return found[0] if found else None
+
+    def text(self):
+        """innerText 근사값: 블록 요소/br 은 줄바꿈, 줄 안의 공백은 하나로"""
+        parts = []
+        _collect_text(self.element, parts)
+        lines = (re.sub(r'[ \t\r\f\v\xa0]+', ' ', line).strip() for line in ''.join(parts).split('\n'))
+        return '\n'.join(line for line in lines if line)
+
+    def __eq__(self, other):
+        return isinstance(other, Node) and other.element is self.element
+
+    def __hash__(self):
+        return id(self.element)
+
+    def __repr__(self):
+        return f"<Node {self.tag} {self.attrs}>"
+
+
+def _collect_text(element, parts):
+    for child in element.children:
+        if isinstance(child, NavigableString):
+            if type(child) is NavigableString:   # 주석/CDATA/doctype 제외
+                parts.append(str(child).replace('\n', ' '))
+        elif child.name == 'br':
+            parts.append('\n')
+        elif child.name not in SKIP_TEXT_TAGS:
+            block = child.name in BLOCK_TAGS
+            if block:
+                parts.append('\n')
+            _collect_text(child, parts)
+            if block:
+                parts.append('\n')
+            elif child.name in ('td', 'th'):
+                parts.append('\t')
+
+
+def parse_html(text):
+    """HTML 문자열 -> 문서 Node (class 등 속성값은 문자열 그대로)"""
+    return Node(BeautifulSoup(text, 'html5lib', multi_valued_attributes=None))
+
+
+def select(root, selector, limit=None):
+    """
+    root 자손 중 selector 에 맞는 요소 (문서 순서, 쉼표로 여러 셀렉터 가능)
+    querySelectorAll 과 같이 조상 매칭은 root 바깥까지 허용한다.
+    """
+    return [Node(element) for element in root.element.select(selector, limit=limit or 0)]
@@ -0,0 +1,60 @@
+import asyncio
+import logging
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.platform_loader import PlatformLoader
+
+logger = logging.getLogger('http_client')
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+class HttpClient:
+    """
+    서버 렌더링 페이지용 프로세스 전역 HTTP 클라이언트 (fetch_mode: http)
+    keep-alive 커넥션 풀을 공유하고, 블로킹 요청은 스레드로 넘겨 이벤트 루프를 막지 않는다.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(HttpClient, cls).__new__(cls)
+            cls._instance.config = PlatformLoader().get_settings('http')
+            cls._instance._local = threading.local()
+        return cls._instance
+
+    @property
+    def timeout(self):
+        return float(self.config.get('timeout', 15))
+
+    def _session(self):
+        # requests.Session 은 스레드 안전하지 않으므로 작업 스레드마다 하나씩 (풀은 스레드 내에서 재사용)
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            pool_size = int(self.config.get('pool_size', 8))
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=1)
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update({
+                'User-Agent': self.config.get('user_agent') or DEFAULT_USER_AGENT,
+                'Accept-Language': 'ko-KR,ko;q=0.9'
+            })
+            self._local.session = session
+        return session
+
+    def _get(self, url, params=None):
+        response = self._session().get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        # 인코딩 헤더가 없는 국내 사이트 대비 (EUC-KR 등)
+        if not response.encoding or response.encoding.lower() == 'iso-8859-1':
+            response.encoding = response.apparent_encoding
+        return response.url, response.text
+
+    async def get_text(self, url, params=None):
+        """GET 후 (최종 URL, 본문 텍스트) 반환"""
+        return await asyncio.to_thread(self._get, url, params)
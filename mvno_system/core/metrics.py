@@ -0,0 +1,76 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+class CrawlMetrics:
+    """
+    크롤링 1회 실행 단위의 가벼운 계측값
+    카운터/누적값과 단계별 소요 시간(span) 샘플을 보관하며, 로그 및 리포트용 summary 를 제공한다.
+    """
+
+    def __init__(self):
+        self.counters = defaultdict(float)
+        self.timings = defaultdict(list)   # 단계명 -> 소요 시간(ms) 목록
+
+    def reset(self):
+        self.counters.clear()
+        self.timings.clear()
+
+    def add(self, name, value=1):
+        """name 카운터에 value 누적"""
+        self.counters[name] += value
+
+    def get(self, name, default=0):
+        return self.counters.get(name, default)
+
+    def record(self, phase, elapsed_ms):
+        """phase 단계 소요 시간 1건 기록"""
+        self.timings[phase].append(elapsed_ms)
+
+    @contextmanager
+    def span(self, phase):
+        """
+        with 블록 소요 시간을 phase 로 기록 (async 코드에서도 await 를 감싸 사용)
+
+        Usage:
+            with self.metrics.span('goto'):
+                await page.goto(url)
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, (time.perf_counter() - started) * 1000)
+
+    def histograms(self):
+        """단계별 {count, total_ms, p50_ms, p95_ms, max_ms}"""
+        result = {}
+        for phase, samples in sorted(self.timings.items()):
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            result[phase] = {
+                'count': len(ordered),
+                'total_ms': round(sum(ordered), 1),
+                'p50_ms': round(percentile(ordered, 50), 1),
+                'p95_ms': round(percentile(ordered, 95), 1),
+                'max_ms': round(ordered[-1], 1)
+            }
+        return result
+
+    def summary(self):
+        """정수로 떨어지는 값은 int 로 정리한 dict 반환"""
+        return {
+            name: int(value) if float(value).is_integer() else round(value, 3)
+            for name, value in sorted(self.counters.items())
+        }
+
+
+def percentile(ordered, pct):
+    """정렬된 목록의 pct 백분위 (선형 보간)"""
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
@@ -0,0 +1,153 @@
+import asyncio
+import json
+import logging
+import re
+
+logger = logging.getLogger('network_capture')
+
+class NetworkCapture:
+    """
+    페이지가 받아오는 JSON(XHR/fetch) 응답 수집기
+    렌더링된 DOM 대신 사이트가 사용하는 API 응답에서 요금제 데이터를 바로 꺼내기 위해 사용한다.
+
+    Usage:
+        capture = NetworkCapture([r'/api/plans'])
+        capture.attach(page)
+        await page.goto(url)
+        await capture.drain()
+        capture.records  # [{'url':..., 'status':..., 'data':...}, ...]
+    """
+
+    def __init__(self, url_patterns, max_body_kb=5120):
+        self.patterns = [re.compile(p) for p in (url_patterns or [])]
+        self.max_bytes = int(max_body_kb) * 1024
+        self.records = []
+        self._pending = set()
+
+    def attach(self, page):
+        page.on('response', self._on_response)
+
+    def detach(self, page):
+        try:
+            page.remove_listener('response', self._on_response)
+        except Exception:
+            pass
+
+    def clear(self):
+        self.records = []
+
+    def _matches(self, url):
+        return any(p.search(url) for p in self.patterns)
+
+    def _on_response(self, response):
+        if not self._matches(response.url):
+            return
+        task = asyncio.ensure_future(self._read(response))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _read(self, response):
+        try:
+            content_type = (response.headers or {}).get('content-type', '')
+            if 'json' not in content_type:
+                return
+            body = await response.body()
+            if len(body) > self.max_bytes:
+                logger.debug(f"응답 크기 초과로 건너뜀: {response.url} ({len(body)} bytes)")
+                return
+            self.records.append({
+                'url': response.url,
+                'status': response.status,
+                'data': json.loads(body)
+            })
+        except Exception as e:
+            # 페이지 이동으로 본문이 사라진 응답 등
+            logger.debug(f"응답 수집 실패: {response.url} ({e})")
+
+    async def read_inline(self, page, selectors):
+        """SSR 페이지에 포함된 JSON (예: script#__NEXT_DATA__) 도 같은 형식으로 수집"""
+        for selector in selectors or []:
+            try:
+                text = await page.evaluate(
+                    "(sel) => { const el = document.querySelector(sel); return el ? el.textContent : null; }",
+                    selector
+                )
+                if text:
+                    self.records.append({'url': page.url, 'status': 200, 'data': json.loads(text)})
+            except Exception as e:
+                logger.debug(f"인라인 JSON 수집 실패 ({selector}): {e}")
+
+    async def drain(self):
+        """진행 중인 응답 본문 읽기가 모두 끝날 때까지 대기"""
+        while self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
+
+def _resolve(item, candidates):
+    """후보 키 목록 중 처음으로 값이 있는 것 반환 (점 표기 = 중첩 키)"""
+    for key in candidates:
+        value = item
+        for part in key.split('.'):
+            if not isinstance(value, dict) or part not in value:
+                value = None
+                break
+            value = value[part]
+        if value is not None and value != '' and not isinstance(value, (dict, list)):
+            return value
+    return None
+
+
+def _value_at(data, path):
+    """점 표기 경로의 값 (리스트는 각 원소에 대해 계속 탐색)"""
+    nodes = [data]
+    for part in path.split('.'):
+        found = []
+        for node in nodes:
+            if isinstance(node, list):
+                found.extend(item[part] for item in node if isinstance(item, dict) and part in item)
+            elif isinstance(node, dict) and part in node:
+                found.append(node[part])
+        nodes = found
+    return nodes
+
+
+def find_records(data, fields, required=None, paths=None, with_path=False):
+    """
+    JSON 트리를 순회하며 fields 매핑이 성립하는 dict 를 모두 찾아 변환
+
+    fields: {'plan_name': ['name', 'planName'], 'price': ['fee'], ...}
+    required: 반드시 값이 있어야 하는 필드 (기본: fields 전체)
+    paths: 요금제 목록 위치 (점 표기, 예: props.pageProps.plans) - 지정 시 그 아래만 탐색
+    with_path: True 이면 (경로, 레코드) 튜플 반환 (매핑 확인용, 리스트 인덱스는 *)
+    문자열 안에 JSON 이 인코딩된 경우(리브모바일 등)도 풀어서 탐색한다.
+    """
+    required = required or list(fields)
+    results = []
+    if paths:
+        stack = [(path, node) for path in reversed(paths) for node in reversed(_value_at(data, path))]
+    else:
+        stack = [('', data)]
+
+    while stack:
+        where, node = stack.pop()
+        if isinstance(node, str):
+            text = node.strip()
+            if text[:1] in ('[', '{'):
+                try:
+                    stack.append((where, json.loads(text)))
+                except ValueError:
+                    pass
+            continue
+        if isinstance(node, list):
+            stack.extend((f"{where}.*" if where else '*', item) for item in reversed(node))
+            continue
+        if not isinstance(node, dict):
+            continue
+
+        mapped = {name: _resolve(node, candidates) for name, candidates in fields.items()}
+        if all(mapped.get(name) is not None for name in required):
+            results.append((where, mapped) if with_path else mapped)
+            continue
+        stack.extend((f"{where}.{key}" if where else key, value) for key, value in reversed(list(node.items())))
+
+    return results
@@ -13,6 +13,7 @@ class PlatformLoader:
             cls._instance = super(PlatformLoader, cls).__new__(cls)
             cls._instance.config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config', 'platforms.yaml')
             cls._instance.platforms = {}
+            cls._instance.settings = {}
             cls._instance.load_config()
         return cls._instance
 
@@ -21,10 +22,16 @@ class PlatformLoader:
             with open(self.config_path, 'r', encoding='utf-8') as f:
                 data = yaml.safe_load(f)
                 self.platforms = data.get('platforms', {})
+                self.settings = data.get('settings', {}) or {}
                 logger.info(f"Loaded {len(self.platforms)} platforms from config.")
         except Exception as e:
             logger.error(f"Failed to load platforms config: {e}")
             self.platforms = {}
+            self.settings = {}
+
+    def get_settings(self, section):
+        """platforms.yaml 의 전역 settings 섹션 (없으면 빈 dict)"""
+        return self.settings.get(section) or {}
 
     def get_enabled_platforms(self):
         """
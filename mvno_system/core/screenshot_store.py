@@ -0,0 +1,162 @@
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger('screenshot_store')
+
+# 지각 해시 (dHash): 이미지를 17 x N 으로 줄여 가로 인접 픽셀 밝기 비교 (세로 칸 수는 페이지 비율에 맞춤)
+# 디코딩/축소는 브라우저가 하므로 Python 쪽에 이미지 라이브러리가 필요 없다.
+PHASH_JS = """async ({data, type}) => {
+    const blob = await (await fetch(`data:${type};base64,${data}`)).blob();
+    const source = await createImageBitmap(blob);
+    const cols = 17;
+    const rows = Math.max(8, Math.min(256, Math.round(16 * source.height / source.width)));
+    const bitmap = await createImageBitmap(source, { resizeWidth: cols, resizeHeight: rows, resizeQuality: 'high' });
+    const canvas = document.createElement('canvas');
+    canvas.width = cols;
+    canvas.height = rows;
+    const ctx = canvas.getContext('2d');
+    ctx.drawImage(bitmap, 0, 0);
+    const px = ctx.getImageData(0, 0, cols, rows).data;
+    const luma = i => px[i] * 0.299 + px[i + 1] * 0.587 + px[i + 2] * 0.114;
+    let bits = '';
+    for (let y = 0; y < rows; y++) {
+        for (let x = 0; x < cols - 1; x++) {
+            const i = (y * cols + x) * 4;
+            bits += luma(i) > luma(i + 4) ? '1' : '0';
+        }
+    }
+    return { rows, bits };
+}"""
+
+
+def phash_distance(a, b):
+    """두 지각 해시의 다른 비트 비율 (세로 칸 수가 다르면 = 페이지 길이가 달라졌으면 1.0)"""
+    if not a or not b or a['rows'] != b['rows'] or len(a['bits']) != len(b['bits']):
+        return 1.0
+    return sum(x != y for x, y in zip(a['bits'], b['bits'])) / max(1, len(a['bits']))
+
+
+class ScreenshotStore:
+    """
+    콘텐츠 주소 기반 스크린샷 저장소 (settings.screenshots.store: blobs)
+    blob_dir/<해시 앞 2자리>/<sha256>.<확장자> 로 한 번만 저장하고, 요금제의 screenshot_path 는 blob 을 가리킨다.
+    세션마다 screenshots/manifest.json 에 요금제(기존 파일명 규칙의 이름) -> blob 매핑을 남긴다.
+
+    dedupe:
+      - exact:      바이트가 같은 캡처만 재사용
+      - perceptual: 같은 요금제의 직전 blob 과 지각 해시 차이가 phash_threshold 이하이면 재사용
+                    (배너 문구/작은 이미지 교체 등 사소한 변경 무시)
+    """
+
+    def __init__(self, platform_key, config):
+        self.platform_key = platform_key
+        self.root = Path(config.get('blob_dir', 'storage/screenshots/blobs'))
+        self.dedupe = config.get('dedupe', 'exact')
+        self.threshold = float(config.get('phash_threshold', 0.05))
+        self.index_path = self.root / 'index' / f"{platform_key}.json"
+        self._index = None       # 요금제 키 -> 직전 blob 정보 (perceptual 용, 플랫폼별 파일)
+        self._hash_pages = {}    # BrowserContext -> 지각 해시 계산용 빈 페이지
+        self.entries = []        # 이번 실행의 manifest 항목
+        self.stored = 0
+        self.reused = 0
+
+    def blob_path(self, digest, extension='png'):
+        return self.root / digest[:2] / f"{digest}.{extension}"
+
+    def _load_index(self):
+        if self._index is None:
+            try:
+                self._index = json.loads(self.index_path.read_text(encoding='utf-8'))
+            except Exception:
+                self._index = {}
+        return self._index
+
+    async def put(self, page, data, key, name, extension='png', pending=()):
+        """
+        캡처 바이트의 저장 위치 결정
+        key: 요금제 키 (타임스탬프 없는 파일명), name: 기존 규칙의 파일명 (manifest 용)
+        pending: 이번 실행에서 저장 중인 경로 (같은 blob 을 두 번 쓰지 않도록)
+        반환: (blob 경로, 새로 써야 하는지)
+        """
+        digest = await asyncio.to_thread(lambda: hashlib.sha256(data).hexdigest())
+        path = self.blob_path(digest, extension)
+        phash = None
+        reused_from = None
+
+        if self.dedupe == 'perceptual':
+            try:
+                phash = await self._phash(page, data, extension)
+            except Exception as e:
+                logger.warning(f"지각 해시 계산 실패 (바이트 비교로 저장): {e}")
+            previous = self._load_index().get(key)
+            if (
+                phash and previous and previous['blob'] != str(path)
+                and phash_distance(previous.get('phash'), phash) <= self.threshold
+                and Path(previous['blob']).exists()
+            ):
+                reused_from = previous['blob']
+                path = Path(previous['blob'])
+
+        needs_write = reused_from is None and str(path) not in pending and not path.exists()
+        if needs_write:
+            self.stored += 1
+        else:
+            self.reused += 1
+
+        self.entries.append({
+            'name': name,
+            'key': key,
+            'blob': str(path),
+            'sha256': digest,
+            'phash': phash,
+            'reused': not needs_write,
+            'captured_at': datetime.now().isoformat(timespec='seconds')
+        })
+        return path, needs_write
+
+    async def _phash(self, page, data, extension):
+        # 크롤링 중인 페이지는 CSP 로 data: 이미지가 막힐 수 있으므로 같은 컨텍스트의 빈 페이지에서 계산
+        context = page.context
+        helper = self._hash_pages.get(context)
+        if helper is None or helper.is_closed():
+            helper = await context.new_page()
+            self._hash_pages[context] = helper
+            context.on('close', lambda c: self._hash_pages.pop(c, None))
+        return await helper.evaluate(PHASH_JS, {
+            'data': base64.b64encode(data).decode('ascii'),
+            'type': 'image/jpeg' if extension in ('jpg', 'jpeg') else 'image/png'
+        })
+
+    def save(self, manifest_dir):
+        """
+        저장이 끝난 뒤 manifest / 지각 해시 인덱스 기록 (파일이 없는 = 저장 실패한 항목은 제외)
+        manifest 는 같은 세션의 이전 항목에 이어 쓴다.
+        """
+        entries = [e for e in self.entries if Path(e['blob']).exists()]
+        self.entries = []
+        if not entries:
+            return
+
+        manifest_path = Path(manifest_dir) / 'manifest.json'
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        except Exception:
+            manifest = {'platform': self.platform_key, 'blob_dir': str(self.root), 'plans': []}
+        manifest['plans'].extend(entries)
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=1), encoding='utf-8')
+
+        if self.dedupe == 'perceptual':
+            index = self._load_index()
+            for entry in entries:
+                previous = index.get(entry['key'])
+                # 재사용한 blob 이면 기준 해시 유지 (작은 변경이 누적되어도 원본 기준으로 비교)
+                if entry['phash'] and not (previous and previous['blob'] == entry['blob']):
+                    index[entry['key']] = {'blob': entry['blob'], 'phash': entry['phash']}
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            self.index_path.write_text(json.dumps(index, ensure_ascii=False), encoding='utf-8')
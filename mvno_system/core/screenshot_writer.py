@@ -0,0 +1,104 @@
+import gzip
+import logging
+import os
+import struct
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from core.platform_loader import PlatformLoader
+
+logger = logging.getLogger('screenshot_writer')
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def recompress_png(data, level):
+    """
+    PNG 의 IDAT 청크를 zlib level 로 다시 압축 (픽셀/필터 데이터는 그대로 - 무손실)
+    Chromium 은 캡처 속도를 위해 낮은 압축으로 인코딩하므로 긴 전체 페이지 캡처일수록 용량이 줄어든다.
+    스트리밍으로 처리해 원본 비트맵 전체를 메모리에 올리지 않으며, 더 커지면 원본을 반환한다.
+    """
+    if not level or not data.startswith(PNG_SIGNATURE):
+        return data
+
+    decompressor = zlib.decompressobj()
+    compressor = zlib.compressobj(int(level))
+    packed = []
+    before = []     # IDAT 이전 청크
+    after = []      # IDAT 이후 청크
+    idat_size = 0
+    pos = len(PNG_SIGNATURE)
+    while pos + 8 <= len(data):
+        length, chunk_type = struct.unpack('>I4s', data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if chunk_type == b'IDAT':
+            idat_size += length
+            packed.append(compressor.compress(decompressor.decompress(body)))
+        else:
+            (after if idat_size else before).append((chunk_type, body))
+    packed.append(compressor.compress(decompressor.flush()))
+    packed.append(compressor.flush())
+    packed = b''.join(packed)
+    if not idat_size or len(packed) >= idat_size:
+        return data
+
+    def chunk(chunk_type, body):
+        return struct.pack('>I', len(body)) + chunk_type + body + struct.pack('>I', zlib.crc32(chunk_type + body))
+
+    return PNG_SIGNATURE + b''.join(
+        [chunk(t, b) for t, b in before] + [chunk(b'IDAT', packed)] + [chunk(t, b) for t, b in after]
+    )
+
+
+class ScreenshotWriter:
+    """
+    프로세스 전역 스크린샷 저장 스레드 풀
+    크롤러는 캡처한 PNG 바이트만 넘기고 다음 요금제로 진행하며, 재압축/디스크 쓰기는 여기서 처리한다.
+    (대기 개수 제한은 크롤러가 자기 Future 로 관리 - BaseCrawler._wait_screenshot_slot)
+
+    Usage:
+        future = ScreenshotWriter().submit(path, png_bytes)   # Future -> 저장 경로
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(ScreenshotWriter, cls).__new__(cls)
+                cls._instance.config = PlatformLoader().get_settings('screenshots')
+                cls._instance._executor = None
+        return cls._instance
+
+    def submit(self, path, data):
+        with self._instance_lock:
+            if self._executor is None:
+                workers = int(self.config.get('writer_threads', 2))
+                self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='screenshot-writer')
+            return self._executor.submit(self._write, Path(path), data)
+
+    def _write(self, path, data):
+        if path.suffix == '.gz':
+            # DOM/MHTML 스냅샷 (BaseCrawler._save_snapshot)
+            data = gzip.compress(data, compresslevel=int(self.config.get('snapshot_compress_level', 6)))
+        else:
+            try:
+                data = recompress_png(data, self.config.get('png_compress_level', 9))
+            except Exception as e:
+                logger.warning(f"스크린샷 재압축 실패 (원본 저장): {e}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 쓰는 도중 중단되어도 잘린 파일이 남지 않도록 임시 파일 후 교체 (스레드별 임시 파일명)
+        temp_path = path.with_name(f"{path.name}.{threading.get_ident()}.part")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+        return str(path)
+
+    def shutdown(self, wait=True):
+        """남은 저장을 마친 뒤 스레드 종료"""
+        with self._instance_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
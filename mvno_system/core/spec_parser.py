@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+
+# 요금제 스펙 문자열 -> 숫자 컬럼 (pandas 문자열 연산으로 행 단위 루프 없이 일괄 변환)
+#
+#   data_raw "11GB+일2GB+3Mbps" -> data_gb 11, data_daily_gb 2, throttle_mbps 3
+#   voice "기본제공" / "300분"    -> voice_min UNLIMITED / 300
+#   sms "기본제공" / "100건"      -> sms_count UNLIMITED / 100
+#   price "7개월 22,000원 이후 33,000원" -> price_promo_int 22000, price_regular_int 33000, promo_months 7
+#
+# 무제한은 UNLIMITED 로 저장해 "15GB 이상" 같은 비교 조건에 그대로 포함되게 한다.
+
+UNLIMITED = 999999
+
+SPEC_COLUMNS = [
+    'price_int', 'price_regular_int', 'price_promo_int', 'promo_months',
+    'data_gb', 'data_daily_gb', 'throttle_mbps', 'voice_min', 'sms_count'
+]
+
+AMOUNT = r'(\d+(?:\.\d+)?)'
+DAILY_RE = rf'(?:매일|하루|일)\s*{AMOUNT}\s*(GB|MB|G)\b'
+VOLUME_RE = rf'{AMOUNT}\s*(GB|MB|G)(?![a-z])'
+SPEED_RE = rf'{AMOUNT}\s*(Mbps|Kbps|M\b|K\b)'
+UNLIMITED_RE = r'무제한|기본\s*제공|무료'
+WON_RE = r'(\d{1,3}(?:,\d{3})+|\d+)\s*원'
+
+
+def _text(values):
+    return pd.Series(values, dtype='object').fillna('').astype(str)
+
+
+def _volume_gb(amounts, units):
+    amounts = pd.to_numeric(amounts, errors='coerce')
+    return amounts.where(units.str.upper() != 'MB', amounts / 1024).round(3)
+
+
+def parse_data(values):
+    """data_raw 문자열 -> DataFrame[data_gb, data_daily_gb, throttle_mbps]"""
+    text = _text(values).str.replace(r'\s+', ' ', regex=True)
+    upper = text.str.replace(r'(?i)gb', 'GB', regex=True).str.replace(r'(?i)mb(?!ps)', 'MB', regex=True)
+    upper = upper.str.replace(r'(?i)mbps', 'Mbps', regex=True).str.replace(r'(?i)kbps', 'Kbps', regex=True)
+
+    daily = upper.str.extract(DAILY_RE)
+    data_daily_gb = _volume_gb(daily[0], daily[1].fillna(''))
+
+    # 일 제공량/속도 표기를 지운 뒤 첫 용량 = 월 기본 제공량
+    rest = upper.str.replace(DAILY_RE, ' ', regex=True).str.replace(SPEED_RE, ' ', regex=True)
+    monthly = rest.str.extract(VOLUME_RE)
+    data_gb = _volume_gb(monthly[0], monthly[1].fillna(''))
+    data_gb = data_gb.mask(data_gb.isna() & text.str.contains(r'무제한', regex=True), UNLIMITED)
+    # 일 제공량만 있는 요금제는 30일 기준 월 환산
+    data_gb = data_gb.fillna(data_daily_gb * 30)
+
+    speed = upper.str.extract(SPEED_RE)
+    throttle = pd.to_numeric(speed[0], errors='coerce')
+    throttle_mbps = throttle.where(~speed[1].fillna('').str.startswith('K'), throttle / 1000)
+
+    return pd.DataFrame({
+        'data_gb': data_gb,
+        'data_daily_gb': data_daily_gb,
+        'throttle_mbps': throttle_mbps.round(3)
+    })
+
+
+def parse_count(values, unit):
+    """음성(분) / 문자(건) 문자열 -> 숫자 (무제한/기본제공 = UNLIMITED)"""
+    text = _text(values)
+    count = pd.to_numeric(text.str.extract(rf'(\d[\d,]*)\s*{unit}')[0].str.replace(',', ''), errors='coerce')
+    return count.mask(count.isna() & text.str.contains(UNLIMITED_RE, regex=True), UNLIMITED)
+
+
+def parse_price(values):
+    """
+    가격 문자열 -> DataFrame[price_int, price_regular_int, price_promo_int, promo_months]
+    금액이 둘 이상이면 작은 값을 할인(프로모션) 가, 큰 값을 정상가로 본다. price_int 는 현재 월 요금(할인가 우선).
+    """
+    text = _text(values)
+    amounts = text.str.extractall(WON_RE)[0].str.replace(',', '').astype('int64')
+    grouped = amounts.groupby(level=0)
+    low = grouped.min().reindex(text.index)
+    high = grouped.max().reindex(text.index)
+    count = grouped.size().reindex(text.index).fillna(0)
+
+    # "원" 표기가 없으면 숫자만 모아서 (기존 save_plan 방식과 동일)
+    digits = pd.to_numeric(text.str.replace(r'\D', '', regex=True).replace('', np.nan), errors='coerce')
+    regular = high.where(count > 0, digits)
+    promo = low.where(count > 1)
+    months = pd.to_numeric(text.str.extract(r'(\d+)\s*개월')[0], errors='coerce').where(count > 1)
+
+    return pd.DataFrame({
+        'price_int': promo.fillna(regular).fillna(0),
+        'price_regular_int': regular,
+        'price_promo_int': promo,
+        'promo_months': months
+    })
+
+
+def parse_specs(frame):
+    """
+    컬럼 price / data_raw / voice / sms 를 가진 DataFrame -> SPEC_COLUMNS DataFrame (같은 index)
+    없는 컬럼은 빈 값으로 처리한다.
+    """
+    def column(name):
+        return frame[name] if name in frame else pd.Series(None, index=frame.index, dtype='object')
+
+    result = pd.concat([
+        parse_price(column('price').values).set_axis(frame.index),
+        parse_data(column('data_raw').values).set_axis(frame.index),
+    ], axis=1)
+    result['voice_min'] = parse_count(column('voice').values, '분').set_axis(frame.index)
+    result['sms_count'] = parse_count(column('sms').values, '건').set_axis(frame.index)
+    return result[SPEC_COLUMNS]
+
+
+def detail_value(details, key):
+    """details JSON 에서 값 찾기 (크롤러가 plan_data['details'] 로 한 단계 더 중첩한 경우 포함)"""
+    if not isinstance(details, dict):
+        return None
+    value = details.get(key)
+    if value is None and isinstance(details.get('details'), dict):
+        value = details['details'].get(key)
+    return value
+
+
+def spec_records(rows):
+    """
+    plan row dict 목록에 대한 스펙 값 목록 (PlanWriter 배치용, 순서 동일)
+    voice / sms 는 row 에 없으면 details 에서 찾는다. NaN 은 None 으로 변환.
+    """
+    if not rows:
+        return []
+    frame = pd.DataFrame({
+        'price': [row.get('price') for row in rows],
+        'data_raw': [row.get('data_raw') for row in rows],
+        'voice': [row.get('voice') or detail_value(row.get('details'), 'voice') for row in rows],
+        'sms': [row.get('sms') or detail_value(row.get('details'), 'sms') for row in rows],
+    })
+    specs = parse_specs(frame).astype('object')
+    specs = specs.where(specs.notna(), None)
+    records = specs.to_dict('records')
+    for record in records:
+        for name in ('price_int', 'price_regular_int', 'price_promo_int', 'promo_months', 'voice_min', 'sms_count'):
+            if record[name] is not None:
+                record[name] = int(record[name])
+    return records
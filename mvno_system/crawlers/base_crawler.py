@@ -3,15 +3,78 @@ from abc import ABC, abstractmethod
 import yaml
 import pandas as pd
 from pathlib import Path
-from playwright.async_api import async_playwright
 import logging
 from datetime import datetime
 import os
 import sys
+import time
+import json
+import hashlib
+import re
+import html
+import concurrent.futures
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
 
 # 프로젝트 루트 경로 추가 (storage 모듈 import 위해)
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from storage.database import SessionLocal, CrawlLog, Plan as PlanModel
+from storage.database import SessionLocal, CrawlLog, CrawlTiming, PlanIdentity, Plan as PlanModel
+from storage.plan_writer import PlanWriter, VOLATILE_KEYS, refresh_current_plans
+from storage.db_writer import DbWriter
+from core.browser_pool import BrowserPool
+from core.platform_loader import PlatformLoader
+from core.metrics import CrawlMetrics
+from core.network_capture import NetworkCapture, find_records
+from core.http_client import HttpClient
+from core.html_doc import parse_html
+from core.screenshot_writer import ScreenshotWriter
+from core.screenshot_store import ScreenshotStore
+
+# 조건 기반 대기용 DOM 변경 카운터 (문서마다 한 번만 설치, 네비게이션 시 초기화됨)
+MUTATION_COUNTER_JS = """() => {
+    if (!window.__mvnoMutations) {
+        window.__mvnoMutations = { count: 0 };
+        new MutationObserver(records => { window.__mvnoMutations.count += records.length; })
+            .observe(document.documentElement || document, { childList: true, subtree: true, characterData: true });
+    }
+    return window.__mvnoMutations.count;
+}"""
+
+# 목록 카드 일괄 추출 (셀렉터 YAML extract 스펙 -> 한 번의 page.evaluate)
+EXTRACT_LIST_JS = """({card, fields, required, limit}) => {
+    const read = (el, f) => {
+        const targets = f.selector
+            ? (f.all ? Array.from(el.querySelectorAll(f.selector)) : [el.querySelector(f.selector)])
+            : [el];
+        const values = targets.filter(t => t).map(t => {
+            if (f.attr) return t.getAttribute(f.attr);
+            return (f.html ? t.innerHTML : t.innerText || t.textContent || '').trim();
+        });
+        return f.all ? values : (values.length ? values[0] : null);
+    };
+    const cards = Array.from(document.querySelectorAll(card));
+    const items = [];
+    for (let i = 0; i < cards.length; i++) {
+        if (limit && items.length >= limit) break;
+        const item = { _index: i };
+        for (const [name, f] of Object.entries(fields)) item[name] = read(cards[i], f);
+        if (required.some(name => !item[name] || (Array.isArray(item[name]) && !item[name].length))) continue;
+        items.push(item);
+    }
+    return { total: cards.length, items };
+}"""
+
+# 무한 스크롤 엔진용: 보이는 항목 수 / 마지막 항목까지 스크롤
+COUNT_ITEMS_JS = """(sel) => Array.from(document.querySelectorAll(sel)).filter(el => el.getClientRects().length).length"""
+ITEMS_GROWN_JS = """([sel, n]) => Array.from(document.querySelectorAll(sel)).filter(el => el.getClientRects().length).length > n"""
+SCROLL_TO_END_JS = """(sel) => {
+    const els = document.querySelectorAll(sel);
+    if (els.length) els[els.length - 1].scrollIntoView({ block: 'end' });
+    window.scrollTo(0, document.body.scrollHeight);
+}"""
+
+# save_plan 에서 Plan 컬럼으로 저장되어 details JSON 에는 중복 저장하지 않는 키
+PLAN_COLUMN_KEYS = {'platform', 'carrier', 'plan_name', 'price', 'data_raw', 'url', 'screenshot_path', 'list_fingerprint'}
 
 # 로거 설정 (임시, 추후 utils/logger.py로 분리)
 logging.basicConfig(
@@ -23,6 +86,15 @@ logging.basicConfig(
     ]
 )
 
+def with_base_href(document, url):
+    """HTML 스냅샷의 상대 경로가 원본 사이트를 가리키도록 <base> 삽입 (이미 있으면 그대로)"""
+    if re.search(r'<base\s', document, re.IGNORECASE):
+        return document
+    tag = f'<base href="{html.escape(url, quote=True)}">'
+    document, count = re.subn(r'<head(\s[^>]*)?>', lambda m: m.group(0) + tag, document, count=1, flags=re.IGNORECASE)
+    return document if count else tag + document
+
+
 class BaseCrawler(ABC):
     """
     모든 크롤러가 상속받아야 할 기본 추상 클래스
@@ -35,12 +107,67 @@ class BaseCrawler(ABC):
         self.config = self._load_platform_config()
         self.selectors = self._load_selectors()
         self.results = []
-        self.db = SessionLocal()
-        self.crawl_log = None
+        self.db = SessionLocal()  # 조회용 (쓰기는 DbWriter 단일 스레드로)
+        self.crawl_log_id = None
+        self.crawl_log_closed = False  # finish_crawl_log 는 로그마다 1회만 (중복 호출 시 타이밍/스냅샷 이중 기록 방지)
+        # 증분 크롤링 (settings.incremental + 플랫폼별 incremental), force_full 이면 항상 전체 수집
+        self.incremental_config = {
+            **PlatformLoader().get_settings('incremental'),
+            **((self.config or {}).get('incremental') or {})
+        }
+        self.force_full = False
+        self.crawl_mode = 'full'
+        # 부분 실행 사유 (limit/test_mode/실패한 필터 뷰) - 있으면 current_plans 교체/판매 종료 판단 없이 본 것만 반영
+        self.partial_reasons = []
+        # 요금제 저장 버퍼 (settings.database: write_mode/batch_size/flush_interval_sec)
+        self.plan_writer = PlanWriter.from_settings(PlatformLoader().get_settings('database'))
         
         self.session_id = None
         self.session_dir = None
         
+        # 수집 방식 (platforms.yaml: fetch_mode) - browser(기본) | http(서버 렌더링 페이지, 브라우저 미사용)
+        self.fetch_mode = (self.config or {}).get('fetch_mode', 'browser')
+        
+        # 상세 페이지 동시 수집 페이지 수 (platforms.yaml: concurrency)
+        self.concurrency = max(1, int((self.config or {}).get('concurrency', 1)))
+        # 필터 뷰(통신망/탭) 동시 수집 페이지 수 (platforms.yaml: view_concurrency, 기본값: concurrency)
+        self.view_concurrency = max(1, int((self.config or {}).get('view_concurrency', self.concurrency)))
+        
+        # 조건 기반 대기 설정 (settings.waits + 플랫폼별 waits 로 덮어쓰기)
+        self.wait_config = {
+            **PlatformLoader().get_settings('waits'),
+            **((self.config or {}).get('waits') or {})
+        }
+        self.metrics = CrawlMetrics()
+        
+        # 리소스 차단 정책 (settings.resource_policy + 플랫폼별 resource_policy 로 덮어쓰기)
+        self.resource_policy = {
+            **PlatformLoader().get_settings('resource_policy'),
+            **((self.config or {}).get('resource_policy') or {})
+        }
+        self._resource_state = {}  # Page -> {'blocked': 현재 문서에서 차단한 요청 수}
+        self._resource_blocking = True  # 차단 중인 페이지를 촬영하면 이후 해제 (_check_blocked_screenshot)
+        
+        # HAR 기록/재생 모드 (set_har_mode) - None | 'record' | 'replay'
+        self.har_mode = None
+        self.har_path = None
+        # 컨텍스트 생성 직후 실행할 async fn(context) 목록 (벤치마크 fixture 라우팅 등)
+        self.context_hooks = []
+        
+        # 스크린샷 설정 (settings.screenshots + 플랫폼별 screenshots 로 덮어쓰기)
+        self.screenshot_config = {
+            **PlatformLoader().get_settings('screenshots'),
+            **((self.config or {}).get('screenshots') or {})
+        }
+        self._pending_screenshots = {}   # 저장 경로 -> ScreenshotWriter Future (백그라운드 저장 중)
+        self._awaiting_screenshot = []   # 스크린샷 저장 완료 후 기록할 (future, plan_data, row)
+        self._failed_screenshots = set() # 저장 실패를 이미 기록한 경로 (blob 을 여러 요금제가 공유할 수 있음)
+        # 콘텐츠 주소 저장소 (screenshots.store: blobs) - None 이면 세션 폴더에 파일명 규칙대로 저장
+        self.screenshot_store = (
+            ScreenshotStore(platform_key, self.screenshot_config)
+            if self.screenshot_config.get('store') == 'blobs' else None
+        )
+        
         # Default usage (legacy)
         self.screenshot_dir = Path(f"storage/screenshots/{platform_key}")
         self.screenshot_dir.mkdir(parents=True, exist_ok=True)
@@ -59,6 +186,32 @@ class BaseCrawler(ABC):
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.logger.info(f"세션 디렉토리 설정: {self.session_dir}")
         
+    def set_har_mode(self, mode, har_dir=None):
+        """
+        HAR 기록/재생 설정 (crawl 호출 전)
+        - record: 실제 사이트 크롤링 중 받은 응답을 {platform}.har.zip 으로 저장
+        - replay: 저장된 HAR 로만 응답하여 네트워크 없이 같은 크롤링을 재현 (성능/정확도 벤치마크용)
+        HttpClient 요청은 HAR 에 남지 않으므로 이 모드에서는 fetch_mode: http 도 브라우저로 수집한다.
+        """
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"지원하지 않는 HAR 모드: {mode}")
+
+        settings = PlatformLoader().get_settings('har')
+        har_dir = Path(har_dir or settings.get('dir', 'storage/har'))
+        if not har_dir.is_absolute():
+            har_dir = Path(__file__).parent.parent / har_dir
+        har_path = har_dir / f"{self.platform_key}.har.zip"
+
+        if mode == 'replay' and not har_path.exists():
+            raise FileNotFoundError(f"HAR 파일 없음 (먼저 --record-har 로 기록): {har_path}")
+        har_dir.mkdir(parents=True, exist_ok=True)
+
+        self.har_mode = mode
+        self.har_path = har_path
+        if self.fetch_mode == 'http':
+            self.fetch_mode = 'browser'
+        self.logger.info(f"HAR {'기록' if mode == 'record' else '재생'} 모드: {har_path}")
+
     def __del__(self):
         """소멸자: DB 세션 닫기"""
         if hasattr(self, 'db'):
@@ -107,6 +260,805 @@ class BaseCrawler(ABC):
             self.logger.error(f"셀렉터 파일 로드 실패: {e}")
             return {}
 
+    @asynccontextmanager
+    async def open_context(self, headless=False, **context_options):
+        """
+        공유 BrowserPool 에서 격리된 BrowserContext 발급 (async with 로 사용)
+        브라우저 실행/종료는 풀이 관리하므로 크롤러는 컨텍스트만 다룬다.
+        """
+        context_options.setdefault('viewport', {'width': 1920, 'height': 1080})
+        if self.har_mode == 'record':
+            # 컨텍스트 종료 시 파일로 기록됨 (리소스 차단 정책으로 막힌 요청은 기록되지 않음)
+            context_options.setdefault('record_har_path', str(self.har_path))
+            context_options.setdefault('record_har_mode', 'full')
+        async with BrowserPool().context(headless=headless, **context_options) as context:
+            if self.har_mode == 'replay':
+                # 리소스 차단 route 보다 먼저 등록 -> 차단 대상이 아니면 fallback 으로 HAR 응답
+                not_found = PlatformLoader().get_settings('har').get('not_found', 'abort')
+                await context.route_from_har(str(self.har_path), not_found=not_found)
+            for hook in self.context_hooks:
+                await hook(context)
+            await self._apply_resource_policy(context)
+            yield context
+
+    async def _apply_resource_policy(self, context):
+        """
+        이미지/폰트/미디어/트래커 요청 차단 - 스크린샷을 찍지 않는 (텍스트 추출만 하는) 플랫폼에서만 켠다.
+        차단한 페이지를 새로고침해 촬영하면 상세가 두 번 로드되고 탭/아코디언 등 화면 상태도 잃으므로,
+        스크린샷을 찍는 플랫폼은 resource_policy.enabled: false (기본값) 로 둔다.
+        """
+        if not self.resource_policy.get('enabled'):
+            return
+
+        self._block_types = set(self.resource_policy.get('block_types') or [])
+        self._block_domains = tuple(d.lower() for d in (self.resource_policy.get('block_domains') or []))
+        context.on('page', self._track_page)
+        await context.route('**/*', self._route_request)
+
+    def _track_page(self, page):
+        state = self._resource_state.setdefault(page, {'blocked': 0})
+
+        def on_navigated(frame):
+            # 새 문서로 이동하면 차단 이력 초기화
+            if frame == page.main_frame:
+                state['blocked'] = 0
+
+        page.on('framenavigated', on_navigated)
+        page.on('close', lambda p: self._resource_state.pop(p, None))
+
+    def _is_blocked(self, request):
+        if request.resource_type in self._block_types:
+            return True
+        host = (urlparse(request.url).hostname or '').lower()
+        return any(host == d or host.endswith('.' + d) for d in self._block_domains)
+
+    async def _route_request(self, route):
+        request = route.request
+        try:
+            state = self._resource_state.get(request.frame.page)
+        except Exception:
+            state = None  # 서비스 워커 등 페이지에 속하지 않는 요청
+
+        if state is not None and self._resource_blocking and self._is_blocked(request):
+            state['blocked'] += 1
+            self.metrics.add('blocked_requests')
+            await route.abort()
+            return
+
+        # 다른 route (HAR 재생 등) 에 처리를 넘김
+        await route.fallback()
+
+    def _check_blocked_screenshot(self, page):
+        """
+        스크린샷 직전: 현재 문서에서 차단된 요청이 있었다면 (설정 실수) 새로고침 없이 그대로 촬영하고
+        이번 실행의 나머지 페이지부터는 차단을 해제한다.
+        """
+        state = self._resource_state.get(page)
+        if not state or not state['blocked'] or not self._resource_blocking:
+            return
+        self._resource_blocking = False
+        self.metrics.add('screenshot_blocked_pages')
+        self.logger.warning(
+            "리소스 차단 중인 페이지를 촬영합니다 (이미지 누락 가능). 이후 차단 해제 - "
+            f"스크린샷을 찍는 플랫폼은 resource_policy.enabled: false 로 설정하세요 ({self.platform_key})"
+        )
+
+    @staticmethod
+    async def shutdown_browsers():
+        """프로세스 종료 전 공유 브라우저 정리 (단독 실행 스크립트용)"""
+        await BrowserPool().shutdown()
+
+    async def fetch_document(self, url, params=None):
+        """
+        HTTP 로 페이지를 받아 파싱된 문서 반환 (fetch_mode: http 용)
+        반환: (최종 URL, core.html_doc.Node) - select/select_one/text 로 셀렉터 YAML 그대로 사용
+        """
+        started = time.monotonic()
+        final_url, text = await HttpClient().get_text(url, params)
+        doc = parse_html(text)
+        self.metrics.add('http_requests')
+        self.metrics.add('http_ms', (time.monotonic() - started) * 1000)
+        self.metrics.record('http_fetch', (time.monotonic() - started) * 1000)
+        return final_url, doc
+
+    def capture_responses(self, page):
+        """
+        네트워크 캡처 시작 (셀렉터 파일의 api 섹션이 있는 플랫폼만)
+        반환된 capture 로 plans_from_capture 를 호출하고, 빈 목록이면 DOM 수집으로 폴백한다.
+        """
+        spec = self.selectors.get('api') or {}
+        settings = PlatformLoader().get_settings('network_capture')
+        if not spec or not settings.get('enabled', True):
+            return None
+
+        capture = NetworkCapture(spec.get('url_patterns'), settings.get('max_body_kb', 5120))
+        capture.attach(page)
+        return capture
+
+    async def plans_from_capture(self, capture, page=None):
+        """캡처된 JSON 응답(+ 인라인 JSON)을 plan dict 목록으로 변환"""
+        if capture is None:
+            return []
+
+        spec = self.selectors.get('api') or {}
+        with self.metrics.span('extract'):
+            if page is not None:
+                await capture.read_inline(page, spec.get('inline_json'))
+            await capture.drain()
+            plans = self.extract_api_plans(capture.records)
+
+        self.metrics.add('api_responses', len(capture.records))
+        self.metrics.add('api_plans', len(plans))
+        self.logger.info(f"API 응답 {len(capture.records)}건에서 요금제 {len(plans)}개 추출")
+        return await self.check_api_plans(page, plans, spec.get('validate'))
+
+    async def check_api_plans(self, page, plans, rule):
+        """
+        API 추출 결과를 화면 카드와 대조 (셀렉터 YAML api.validate) - 맞지 않으면 [] 반환 (DOM 수집으로 폴백)
+        캡처 패턴에 배너/추천 위젯 같은 다른 JSON 이 걸려도 잘못된 목록이 DOM 수집을 대체하지 않도록 한다.
+
+        rule:
+            card: 화면 카드 셀렉터
+            attr: 비교할 카드 속성 (기본 href)
+            field: 비교할 plan 필드 (기본 url, URL 이면 경로+쿼리로 비교)
+            dom_match: 화면 카드 중 API 결과에 있어야 하는 비율 하한 (기본 0.8)
+            min_plans: API 요금제 최소 개수 (기본 1)
+        """
+        if not plans or not rule or page is None:
+            return plans
+
+        def match_key(value):
+            parsed = urlparse(str(value or '').strip())
+            return parsed.path.rstrip('/') + (f"?{parsed.query}" if parsed.query else '')
+
+        reason = None
+        min_plans = int(rule.get('min_plans', 1))
+        if len(plans) < min_plans:
+            reason = f"요금제 {len(plans)}개 (최소 {min_plans}개)"
+        else:
+            try:
+                values = await page.eval_on_selector_all(
+                    rule['card'], "(els, attr) => els.map(el => el.getAttribute(attr))", rule.get('attr', 'href')
+                )
+            except Exception as e:
+                values = []
+                self.logger.debug(f"화면 카드 대조 실패: {e}")
+            shown = {match_key(v) for v in values if v}
+            if shown:
+                found = {match_key(plan.get(rule.get('field', 'url'))) for plan in plans}
+                ratio = len(shown & found) / len(shown)
+                if ratio < float(rule.get('dom_match', 0.8)):
+                    reason = f"화면 카드 {len(shown)}개 중 {ratio:.0%} 만 API 결과에 있음"
+
+        if reason:
+            self.metrics.add('api_rejected')
+            self.logger.warning(f"API 추출 결과가 화면과 맞지 않아 DOM 수집으로 전환: {reason}")
+            return []
+        return plans
+
+    def extract_api_plans(self, records):
+        """
+        기본 추출기: api.fields 매핑으로 레코드를 찾아 변환, api.url_template 으로 상세 URL 생성
+        api.record_paths 가 있으면 해당 위치의 목록만 탐색한다 (배너/추천 위젯 제외).
+        응답 구조가 특수한 플랫폼은 오버라이드한다.
+        """
+        spec = self.selectors.get('api') or {}
+        fields = spec.get('fields') or {}
+        template = spec.get('url_template')
+
+        plans = []
+        seen = set()
+        for record in records:
+            for item in find_records(record['data'], fields, spec.get('required'), spec.get('record_paths')):
+                if template:
+                    try:
+                        item['url'] = template.format(**item)
+                    except (KeyError, IndexError):
+                        continue
+                key = item.get('url') or tuple(sorted(item.items()))
+                if key in seen:
+                    continue
+                seen.add(key)
+                plans.append(item)
+        return plans
+
+    def item_limit(self, kwargs, test_limit=3):
+        """limit_items 와 같은 규칙의 개수 (0 = 무제한)"""
+        limit = kwargs.get('limit', 0)
+        if limit > 0:
+            return limit
+        if kwargs.get('test_mode'):
+            return test_limit
+        return 0
+
+    async def extract_list(self, page, spec=None, limit=0):
+        """
+        목록 카드 메타데이터 일괄 추출 (카드별 evaluate 왕복 대신 page.evaluate 1회)
+
+        spec (기본: 셀렉터 YAML 의 extract 섹션):
+            card: 카드 셀렉터
+            required: 값이 비어 있으면 제외할 필드 (limit 계산 전에 제외)
+            fields:
+                name: '셀렉터'                              # innerText
+                name: {selector: '...', attr: 'href'}       # 속성 (selector 생략 시 카드 자신)
+                name: {selector: 'img', attr: 'alt', all: true}  # 모든 매칭값 리스트
+        반환: dict 리스트 (각 항목의 _index 는 전체 카드 중 위치 - 클릭이 필요할 때 nth() 로 사용)
+        """
+        spec = spec or self.selectors.get('extract') or {}
+        fields = {
+            name: ({'selector': f} if isinstance(f, str) else dict(f or {}))
+            for name, f in (spec.get('fields') or {}).items()
+        }
+        with self.metrics.span('extract'):
+            result = await page.evaluate(EXTRACT_LIST_JS, {
+                'card': spec['card'],
+                'fields': fields,
+                'required': spec.get('required') or [],
+                'limit': limit or 0
+            })
+        self.logger.info(f"목록 카드 {result['total']}개 중 {len(result['items'])}개 추출 (일괄)")
+        return result['items']
+
+    def mark_partial(self, reason):
+        """이번 실행이 전체 목록을 보지 못했음을 기록 (finish_crawl_log 에서 scope='partial')"""
+        if reason not in self.partial_reasons:
+            self.partial_reasons.append(reason)
+
+    @property
+    def full_run(self):
+        return not self.partial_reasons
+
+    def limit_items(self, items, kwargs, test_limit=3):
+        """
+        limit / test_mode 규칙을 목록에 적용
+        - limit > 0 이면 앞에서 limit 개
+        - limit 이 없고 test_mode 이면 앞에서 test_limit 개
+        """
+        limit = kwargs.get('limit', 0)
+        if limit > 0:
+            return items[:limit]
+        if kwargs.get('test_mode'):
+            return items[:test_limit]
+        return items
+
+    async def run_detail_workers(self, context, items, worker, on_result=None, page=None, concurrency=None):
+        """
+        상세 페이지 병렬 수집 (bounded worker pool)
+        같은 컨텍스트 안에서 N 개의 페이지가 items 를 나눠서 처리한다.
+
+        Args:
+            context: open_context() 로 발급받은 BrowserContext
+            items: 목록 단계에서 수집한 URL/메타데이터 리스트 (limit 적용 후)
+            worker: async def worker(page, item) -> plan_data 또는 None
+            on_result: 결과 콜백 (item 순서대로 호출됨, 예: self.save_plan)
+            page: 재사용할 기존 페이지 (첫 번째 워커가 사용)
+            concurrency: 동시 페이지 수 (기본값: platforms.yaml 의 concurrency)
+
+        Returns:
+            items 와 같은 순서의 결과 리스트 (실패한 항목은 None)
+        """
+        total = len(items)
+        if total == 0:
+            return []
+        
+        results = [None] * total
+        finished = [False] * total
+        next_emit = 0
+        
+        # 증분 모드: 목록 카드가 이전과 같은 항목은 큐에 넣지 않음
+        skipped = self._skip_unchanged(items)
+        queue = asyncio.Queue()
+        for idx, item in enumerate(items):
+            if idx in skipped:
+                finished[idx] = True
+            else:
+                queue.put_nowait((idx, item))
+        if queue.empty():
+            return results
+        concurrency = max(1, min(concurrency or self.concurrency, queue.qsize()))
+
+        def emit_ready():
+            # 앞 순번이 끝난 만큼만 순서대로 콜백 (저장 순서 유지)
+            nonlocal next_emit
+            while next_emit < total and finished[next_emit]:
+                if on_result and results[next_emit] is not None:
+                    on_result(results[next_emit])
+                next_emit += 1
+
+        async def run(worker_page, worker_no):
+            while True:
+                try:
+                    idx, item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                
+                self.logger.info(f"[{idx+1}/{total}] 상세 수집 (worker {worker_no})")
+                # 워커가 item 에 상세 값을 채워 넣기 전의 목록 카드 기준
+                fingerprint = self.list_fingerprint(item)
+                try:
+                    results[idx] = await worker(worker_page, item)
+                    if isinstance(results[idx], dict) and fingerprint:
+                        results[idx]['list_fingerprint'] = fingerprint
+                except Exception as e:
+                    self.logger.error(f"상세 수집 워커 에러 ({idx+1}/{total}): {e}")
+                finally:
+                    finished[idx] = True
+                    emit_ready()
+
+        pages, owned_pages = await self._open_pages(context, concurrency, page)
+        
+        if concurrency > 1:
+            self.logger.info(f"상세 수집 병렬 실행: {total}개 / 동시 {concurrency} 페이지")
+        
+        try:
+            await asyncio.gather(*(run(p, n + 1) for n, p in enumerate(pages)))
+        finally:
+            await self._close_pages(owned_pages)
+
+        return results
+
+    async def _open_pages(self, context, count, page=None):
+        """작업용 페이지 count 개 (page 가 있으면 첫 번째로 재사용). 반환: (전체, 새로 연 페이지)"""
+        pages = [page] if page is not None else []
+        owned_pages = []
+        while len(pages) < count:
+            new_page = await context.new_page()
+            pages.append(new_page)
+            owned_pages.append(new_page)
+        return pages, owned_pages
+
+    async def _close_pages(self, pages):
+        for owned in pages:
+            try:
+                await owned.close()
+            except Exception:
+                pass
+
+    async def run_filter_views(self, context, views, collect, limit=0, required=('plan_name',), key=None, concurrency=None):
+        """
+        필터 뷰(통신망/탭/카테고리) 병렬 수집
+        서로 독립인 뷰를 공유 컨텍스트의 페이지별로 나눠 실행하고, 결과를 뷰 순서대로 합쳐 중복 제거한다.
+
+        Args:
+            context: open_context() 로 발급받은 BrowserContext (None 이면 페이지 없이 실행 - fetch_mode: http)
+            views: 뷰 정의 리스트 (예: [{'name': 'SKT', 'value': 'S'}, ...] 또는 ['SKT', 'KT'])
+            collect: async def collect(page, view) -> item dict 리스트 (페이지 이동/필터 선택부터 수행)
+            limit: 뷰마다 남길 개수 (0 = 무제한, 보통 self.item_limit(kwargs))
+            required: 값이 비어 있으면 버릴 필드 (limit 계산 전에 제외)
+            key: 중복 판정 키 함수 (기본: plan_dedupe_key)
+            concurrency: 동시 페이지 수 (기본값: platforms.yaml 의 view_concurrency)
+
+        Returns:
+            [(view, item), ...] - 여러 탭에 나온 같은 요금제는 처음 나온 것만 남김
+        """
+        total = len(views)
+        if total == 0:
+            return []
+
+        per_view = [None] * total
+        queue = asyncio.Queue()
+        for idx, view in enumerate(views):
+            queue.put_nowait((idx, view))
+        concurrency = max(1, min(concurrency or self.view_concurrency, total))
+
+        async def run(view_page):
+            while True:
+                try:
+                    idx, view = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                name = view.get('name', idx) if isinstance(view, dict) else view
+                self.logger.info(f"[{name}] 요금제 수집 시작")
+                try:
+                    items = [
+                        item for item in (await collect(view_page, view) or [])
+                        if all(item.get(field) for field in required)
+                    ]
+                    per_view[idx] = items[:limit] if limit else items
+                    self.logger.info(f"[{name}] 수집된 요금제: {len(items)}개")
+                except Exception as e:
+                    self.logger.error(f"필터 뷰 수집 실패 ({name}): {e}")
+                    self.mark_partial(f"필터 뷰 실패: {name}")
+
+        if context is None:
+            pages, owned_pages = [None] * concurrency, []
+        else:
+            pages, owned_pages = await self._open_pages(context, concurrency)
+
+        if concurrency > 1:
+            self.logger.info(f"필터 뷰 병렬 실행: {total}개 / 동시 {concurrency}")
+
+        try:
+            await asyncio.gather(*(run(p) for p in pages))
+        finally:
+            await self._close_pages(owned_pages)
+
+        key = key or self.plan_dedupe_key
+        merged = []
+        seen = set()
+        for idx, items in enumerate(per_view):
+            for item in items or []:
+                item_key = key(item)
+                if item_key in seen:
+                    continue
+                seen.add(item_key)
+                merged.append((views[idx], item))
+
+        collected = sum(len(items or []) for items in per_view)
+        if collected > len(merged):
+            self.logger.info(f"필터 뷰 중복 요금제 {collected - len(merged)}개 제외 (총 {len(merged)}개)")
+        return merged
+
+    @staticmethod
+    def plan_dedupe_key(item):
+        """여러 필터 뷰에 같은 요금제가 나올 때의 중복 판정 키 (상세 URL 우선, 없으면 통신사+요금제명+가격+데이터)"""
+        if item.get('url'):
+            return ('url', item['url'])
+        return tuple(' '.join(str(item.get(k) or '').split()).lower() for k in ('carrier', 'plan_name', 'price', 'data'))
+
+    async def run_card_views(self, page, items, extract, on_result=None, limit=0, spec=None, on_reset=None):
+        """
+        모달/같은 탭 상세 수집 모드 (KT엠모바일, 알닷처럼 상세 URL 없이 카드를 클릭해야 하는 사이트)
+        카드 위치는 extract_list 가 한 번 만든 _index 를 그대로 쓰고 (반복마다 .all() 재조회 없음),
+        상세가 보이는 즉시 추출한다 (고정 대기 없음).
+
+        spec (기본: 셀렉터 YAML 의 modal 섹션):
+            card: 카드 셀렉터 (extract.card 와 같아야 _index 가 맞음)
+            mode: modal (기본) | navigate (같은 탭 이동 후 뒤로가기)
+            body: 모달 본문 셀렉터 (mode: modal)
+            ready: 이 요소가 보이면 추출 시작 (기본: body)
+            close: 모달 닫기 버튼 셀렉터 (없거나 안 보이면 Escape)
+            payload_url: 상세 내용을 주는 XHR URL 정규식 - 지정 시 응답 JSON 을 extract 에 전달
+            timeout_ms: 열기/닫기 대기 상한 (기본 5000)
+
+        Args:
+            extract: async def extract(page, item, payload) -> plan_data 또는 None (상세가 열린 상태에서 호출)
+            on_result: 결과 콜백 (예: self.save_plan)
+            limit: 수집 성공 개수 상한 (0 = 무제한)
+            on_reset: 모달이 닫히지 않아 새로고침한 뒤 목록 상태 복원 (예: 아코디언 다시 펼치기)
+        """
+        spec = spec or self.selectors.get('modal') or {}
+        navigate = spec.get('mode') == 'navigate'
+        timeout = int(spec.get('timeout_ms', 5000))
+        payload_re = re.compile(spec['payload_url']) if spec.get('payload_url') else None
+        cards = page.locator(spec['card'])
+        list_url = page.url
+
+        results = []
+        for item in items:
+            if limit and len(results) >= limit:
+                break
+            self.logger.info(f"상세 수집 시도: {item.get('plan_name')}")
+            # extract 가 item 을 바꾸기 전의 목록 카드 기준
+            fingerprint = self.list_fingerprint(item)
+            try:
+                payload = await self._open_card(page, cards.nth(item['_index']), spec, payload_re, list_url, timeout)
+                plan_data = await extract(page, item, payload)
+                if plan_data:
+                    if fingerprint:
+                        plan_data['list_fingerprint'] = fingerprint
+                    results.append(plan_data)
+                    if on_result:
+                        on_result(plan_data)
+                    self.logger.info(f"수집 완료: {plan_data.get('plan_name')}")
+            except Exception as e:
+                self.logger.error(f"카드 처리 중 에러 ({item.get('plan_name')}): {e}")
+            finally:
+                await self._close_card(page, spec, list_url, timeout, on_reset)
+        return results
+
+    async def _open_card(self, page, card, spec, payload_re, list_url, timeout):
+        """카드 클릭 후 상세가 보일 때까지 대기, payload_url 이 있으면 해당 응답 JSON 반환"""
+        started = time.perf_counter()
+        payload = None
+        if payload_re is not None:
+            try:
+                async with page.expect_response(lambda r: payload_re.search(r.url), timeout=timeout) as info:
+                    await card.click()
+                payload = await (await info.value).json()
+            except Exception as e:
+                # 응답을 못 잡아도 클릭은 됐으므로 DOM 추출로 진행
+                self.logger.debug(f"상세 응답 수집 실패: {e}")
+        else:
+            await card.click()
+
+        if spec.get('mode') == 'navigate':
+            await page.wait_for_url(lambda url: url != list_url, timeout=timeout)
+        ready = spec.get('ready') or spec.get('body')
+        if ready:
+            await page.locator(ready).first.wait_for(state='visible', timeout=timeout)
+
+        self.metrics.add('cards_opened')
+        self.metrics.add('card_open_ms', (time.perf_counter() - started) * 1000)
+        self.metrics.record('card_open', (time.perf_counter() - started) * 1000)
+        return payload
+
+    async def _close_card(self, page, spec, list_url, timeout, on_reset=None):
+        """모달 닫기 (또는 뒤로가기) 후 카드 목록이 다시 보일 때까지 대기"""
+        try:
+            if spec.get('mode') == 'navigate':
+                if page.url != list_url:
+                    await page.go_back(wait_until='domcontentloaded')
+                await page.locator(spec['card']).first.wait_for(state='visible', timeout=timeout)
+                return
+
+            body = page.locator(spec['body']).first
+            if not await body.is_visible():
+                return
+            close_btn = page.locator(spec['close']).first if spec.get('close') else None
+            if close_btn is not None and await close_btn.is_visible():
+                await close_btn.click()
+            else:
+                await page.keyboard.press('Escape')
+            await body.wait_for(state='hidden', timeout=timeout)
+        except Exception as e:
+            self.logger.warning(f"상세 닫기 실패, 목록 다시 로드: {e}")
+            try:
+                await self.goto(page, list_url)
+                if on_reset:
+                    await on_reset(page)
+                await page.locator(spec['card']).first.wait_for(state='visible', timeout=timeout)
+            except Exception as e:
+                self.logger.error(f"목록 복구 실패: {e}")
+
+    async def resolve_card_targets(self, page, items, spec=None):
+        """
+        카드 클릭이 일으키는 페이지 이동 요청을 가로채 상세 이동 대상만 수집 (실제 이동은 취소)
+        목록 페이지를 한 번만 로드하고, 상세는 run_detail_workers + open_target 으로 직접 병렬 방문한다.
+
+        spec (기본: 셀렉터 YAML 의 navigation 섹션):
+            card: 카드 셀렉터 (extract.card 와 같아야 _index 가 맞음)
+            click: 카드 안에서 클릭할 요소 (생략 시 카드 자신)
+            timeout_ms: 카드당 이동 요청 대기 상한 (기본 3000)
+
+        각 item 에 target({url, method, post_data, content_type}) 과 url 을 채워 반환 (대상을 못 찾은 카드는 제외)
+        POST(form submit) 대상의 url 은 폼 파라미터를 쿼리로 붙인 값 (요금제 식별/증분 비교용)
+        """
+        spec = spec or self.selectors.get('navigation') or {}
+        timeout = int(spec.get('timeout_ms', 3000)) / 1000
+        cards = page.locator(spec['card'])
+        pending = {'future': None}
+
+        async def intercept(route):
+            request = route.request
+            future = pending['future']
+            if request.is_navigation_request() and request.frame == page.main_frame and future is not None:
+                if not future.done():
+                    future.set_result({
+                        'url': request.url,
+                        'method': request.method,
+                        'post_data': request.post_data,
+                        'content_type': (request.headers or {}).get('content-type')
+                    })
+                await route.abort()
+                return
+            await route.fallback()
+
+        await page.route('**/*', intercept)
+        resolved = []
+        try:
+            for item in items:
+                card = cards.nth(item['_index'])
+                if spec.get('click'):
+                    card = card.locator(spec['click']).first
+                pending['future'] = asyncio.get_running_loop().create_future()
+                try:
+                    await card.click()
+                    target = await asyncio.wait_for(pending['future'], timeout)
+                except Exception as e:
+                    self.logger.warning(f"상세 이동 대상 확인 실패 ({item.get('plan_name')}): {e or '이동 요청 없음'}")
+                    continue
+                finally:
+                    pending['future'] = None
+
+                url = target['url']
+                if target['method'] != 'GET' and target['post_data']:
+                    url = f"{url}{'&' if '?' in url else '?'}{target['post_data']}"
+                item['target'] = target
+                item['url'] = url
+                resolved.append(item)
+        finally:
+            await page.unroute('**/*', intercept)
+
+        self.logger.info(f"상세 이동 대상 {len(resolved)}/{len(items)}개 확인 (목록 재로드 없음)")
+        return resolved
+
+    async def goto(self, page, url, wait_until='domcontentloaded', **kwargs):
+        """page.goto + 이동 소요 시간 기록 (단계별 소요 시간의 goto)"""
+        with self.metrics.span('goto'):
+            return await page.goto(url, wait_until=wait_until, **kwargs)
+
+    async def open_target(self, page, item, wait_until='domcontentloaded'):
+        """resolve_card_targets 로 얻은 대상으로 바로 이동 (POST 는 같은 폼 데이터로 재전송)"""
+        target = item.get('target') or {'url': item['url'], 'method': 'GET'}
+        if target['method'] == 'GET':
+            return await self.goto(page, target['url'], wait_until=wait_until)
+
+        async def as_form_submit(route):
+            headers = dict(route.request.headers)
+            if target.get('content_type'):
+                headers['content-type'] = target['content_type']
+            await route.continue_(method=target['method'], post_data=target.get('post_data'), headers=headers)
+
+        await page.route(lambda url: url == target['url'], as_form_submit, times=1)
+        return await self.goto(page, target['url'], wait_until=wait_until)
+
+    async def load_all_items(self, page, selector, limit=0, more_selector=None):
+        """
+        무한 스크롤 / 더보기 목록 로딩 (scrollHeight 대신 보이는 항목 수로 판단)
+        - limit 개 이상 보이면 즉시 종료
+        - 스크롤 후 항목이 늘 때까지만 대기 (직전 로딩 시간 기반 적응형 상한)
+        - 늘지 않으면 더보기 버튼 클릭, 그래도 늘지 않으면 종료
+
+        Args:
+            selector: 목록 항목 셀렉터
+            limit: 필요한 항목 수 (0 = 전부)
+            more_selector: 더보기 버튼 셀렉터 (기본값: settings.scroll.more_selector)
+
+        Returns:
+            로딩된 (보이는) 항목 수
+        """
+        config = PlatformLoader().get_settings('scroll')
+        max_rounds = int(config.get('max_rounds', 50))
+        max_wait = int(config.get('max_wait_ms', 2000))
+        min_wait = min(int(config.get('min_wait_ms', 400)), max_wait)
+        more_selector = more_selector or config.get('more_selector')
+
+        started = time.perf_counter()
+        count = await page.evaluate(COUNT_ITEMS_JS, selector)
+        rounds = 0
+        clicks = 0
+        latency = None  # 직전 로딩에 걸린 시간 (ms, 지수 평균)
+
+        async def wait_growth(timeout_ms):
+            nonlocal latency
+            wait_started = time.perf_counter()
+            try:
+                await page.wait_for_function(ITEMS_GROWN_JS, arg=[selector, count], timeout=timeout_ms)
+            except Exception:
+                return False
+            took = (time.perf_counter() - wait_started) * 1000
+            latency = took if latency is None else latency * 0.7 + took * 0.3
+            return True
+
+        while rounds < max_rounds and not (limit and count >= limit):
+            rounds += 1
+            await page.evaluate(SCROLL_TO_END_JS, selector)
+            adaptive = max_wait if latency is None else max(min_wait, min(max_wait, int(latency * 3)))
+            grown = await wait_growth(adaptive)
+
+            clicked = False
+            if not grown and more_selector:
+                try:
+                    more_btn = page.locator(more_selector).first
+                    if await more_btn.is_visible():
+                        await more_btn.click()
+                        clicked = True
+                        clicks += 1
+                        grown = await wait_growth(max_wait)
+                except Exception:
+                    pass
+            if not grown and not clicked and adaptive < max_wait:
+                # 적응형 대기가 짧았던 경우 남은 시간만큼 한 번 더 확인 후 종료
+                grown = await wait_growth(max_wait - adaptive)
+            if not grown:
+                break
+            count = await page.evaluate(COUNT_ITEMS_JS, selector)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.metrics.add('scroll_rounds', rounds)
+        self.metrics.add('scroll_more_clicks', clicks)
+        self.metrics.add('scroll_ms', elapsed_ms)
+        self.metrics.record('scroll', elapsed_ms)
+        self.logger.info(f"목록 로딩: {count}개 (스크롤 {rounds}회, 더보기 {clicks}회, {elapsed_ms / 1000:.1f}s)")
+        return count
+
+    async def wait_ready(self, page, max_ms, selector=None, until='settled', quiet_ms=None):
+        """
+        조건 기반 대기 (고정 wait_for_timeout 대체)
+        조건이 충족되는 즉시 반환하며, 기존 고정 대기값(max_ms)은 상한으로만 사용한다.
+
+        Args:
+            page: Playwright page
+            max_ms: 최대 대기 시간 (기존 고정 대기값)
+            selector: 지정 시 해당 요소가 보이는 즉시 반환
+            until: selector 가 없을 때의 조건
+                - 'dom': DOM 변경이 quiet_ms 동안 없음
+                - 'network': 요청 시작/종료가 quiet_ms 동안 없음
+                - 'settled': dom + network 모두 충족 (기본값)
+            quiet_ms: 조용해야 하는 구간 길이 (기본값: settings.waits.quiet_ms)
+
+        Returns:
+            실제 대기 시간 (ms)
+        """
+        start = time.perf_counter()
+        
+        if not self.wait_config.get('enabled', True):
+            # 조건 대기 비활성화 시 기존 고정 대기 동작
+            await page.wait_for_timeout(max_ms)
+        else:
+            quiet_ms = quiet_ms or self.wait_config.get('quiet_ms', 300)
+            try:
+                if selector:
+                    await page.wait_for_selector(selector, state='visible', timeout=max_ms)
+                else:
+                    await self._wait_quiet(
+                        page, max_ms, min(quiet_ms, max_ms),
+                        dom=until in ('dom', 'settled'),
+                        network=until in ('network', 'settled')
+                    )
+            except Exception:
+                # 타임아웃 = 기존 고정 대기와 동일하게 상한까지 기다린 것으로 간주
+                pass
+            
+        waited_ms = (time.perf_counter() - start) * 1000
+        saved_ms = max(0.0, max_ms - waited_ms)
+        self.metrics.add('wait_calls')
+        self.metrics.add('wait_ms', waited_ms)
+        self.metrics.add('wait_saved_ms', saved_ms)
+        self.metrics.record('wait', waited_ms)
+        self.logger.debug(f"대기 {waited_ms:.0f}ms (상한 {max_ms}ms, 절약 {saved_ms:.0f}ms)")
+        return waited_ms
+
+    async def _wait_quiet(self, page, max_ms, quiet_ms, dom=True, network=True):
+        """DOM 변경 / 네트워크 요청이 quiet_ms 동안 없을 때까지 폴링 (max_ms 상한)"""
+        loop = asyncio.get_running_loop()
+        poll = self.wait_config.get('poll_ms', 100) / 1000
+        quiet = quiet_ms / 1000
+        # 롱폴링/비콘 등 끝나지 않는 요청은 이 시간 이후 무시
+        stale = max(quiet * 4, 1.0)
+        
+        started_at = loop.time()
+        deadline = started_at + max_ms / 1000
+        inflight = {}
+        last_network = [started_at]
+
+        def on_request(request):
+            inflight[request] = loop.time()
+            last_network[0] = loop.time()
+
+        def on_request_done(request):
+            inflight.pop(request, None)
+            last_network[0] = loop.time()
+
+        if network:
+            page.on('request', on_request)
+            page.on('requestfinished', on_request_done)
+            page.on('requestfailed', on_request_done)
+            
+        try:
+            last_count = None
+            last_dom = started_at
+            while True:
+                now = loop.time()
+                if dom:
+                    try:
+                        count = await page.evaluate(MUTATION_COUNTER_JS)
+                    except Exception:
+                        # 네비게이션 중에는 실행 컨텍스트가 없음 -> 변경 중으로 간주
+                        count = None
+                    now = loop.time()
+                    if count is None or count != last_count:
+                        last_count = count
+                        last_dom = now
+                        
+                dom_quiet = not dom or (now - last_dom) >= quiet
+                network_quiet = not network or (
+                    (now - last_network[0]) >= quiet
+                    and not any(now - t < stale for t in inflight.values())
+                )
+                if dom_quiet and network_quiet:
+                    return
+                if now >= deadline:
+                    return
+                await asyncio.sleep(min(poll, max(0, deadline - now)))
+        finally:
+            if network:
+                page.remove_listener('request', on_request)
+                page.remove_listener('requestfinished', on_request_done)
+                page.remove_listener('requestfailed', on_request_done)
+
     @abstractmethod
     async def crawl(self, **kwargs):
         """
@@ -226,94 +1178,540 @@ class BaseCrawler(ABC):
         safe_name = safe_name.replace(' ', '')
         
         target_dir = self.screenshot_dir
-        filename = target_dir / f"{safe_name}.png"
+        if self.screenshot_config.get('mode') == 'snapshot':
+            # 이미지 대신 DOM/MHTML 스냅샷 저장 (이미지는 render_snapshots.py 로 필요할 때 생성)
+            return await self._save_snapshot(page, target_dir / safe_name)
+
+        extension = 'jpg' if self.screenshot_config.get('format') in ('jpeg', 'jpg') else 'png'
+        filename = target_dir / f"{safe_name}.{extension}"
+        async_write = self.screenshot_config.get('async_write', True)
         
+        if async_write:
+            await self._wait_screenshot_slot()
+        self._check_blocked_screenshot(page)
         try:
-            await page.screenshot(path=str(filename), full_page=True, timeout=10000)
-            self.logger.info(f"스크린샷 저장: {filename}")
-            return str(filename)
+            if not async_write and self.screenshot_store is None:
+                with self.metrics.span('screenshot'):
+                    await self._capture_screenshot(page, path=str(filename))
+                self._count_screenshot_bytes(filename)
+                self.logger.info(f"스크린샷 저장: {filename}")
+                return str(filename)
+
+            # 메모리로 캡처만 하고 재압축/쓰기는 백그라운드 (실패 시 save_plan 이 screenshot_path 를 비움)
+            with self.metrics.span('screenshot'):
+                data = await self._capture_screenshot(page)
+            target, needs_write = filename, True
+            if self.screenshot_store is not None:
+                # 콘텐츠 주소 저장: 같은(또는 지각적으로 비슷한) 화면이면 기존 blob 참조
+                key = "_".join(final_parts[:-1]).replace(' ', '')
+                target, needs_write = await self.screenshot_store.put(
+                    page, data, key, filename.name, extension=extension, pending=self._pending_screenshots
+                )
+
+            if not needs_write:
+                self.logger.info(f"스크린샷 재사용: {filename.name} -> {target}")
+                return str(target)
+            future = ScreenshotWriter().submit(target, data)
+            self._pending_screenshots[str(target)] = future
+            if not async_write:
+                try:
+                    await asyncio.wrap_future(future)
+                except Exception:
+                    self._pending_screenshots.pop(str(target), None)
+                    raise
+                self.logger.info(f"스크린샷 저장: {target}")
+            else:
+                self.logger.info(f"스크린샷 캡처: {target} (백그라운드 저장)")
+            return str(target)
         except Exception as e:
             self.logger.error(f"스크린샷 저장 에러: {e}")
             return None
 
 
 
-    def start_crawl_log(self):
-        """크롤링 시작 로그 기록"""
+    async def _save_snapshot(self, page, base_path):
+        """
+        스크린샷 대신 페이지 스냅샷을 gzip 으로 저장 (screenshots.mode: snapshot)
+        - mhtml: 이미지/CSS 포함 단일 파일 (Chromium CDP) - 리소스 차단을 켠 플랫폼에서는 사용하지 않음
+        - html:  현재 DOM (<base> 로 원본 URL 지정, 리소스는 렌더링 시점에 원본 사이트에서 로드)
+        반환: 스냅샷 경로 (요금제의 screenshot_path 로 저장됨)
+        """
+        snapshot_format = 'html' if self.screenshot_config.get('snapshot_format') == 'html' else 'mhtml'
+        filename = base_path.with_name(f"{base_path.name}.{snapshot_format}.gz")
+        async_write = self.screenshot_config.get('async_write', True)
+
+        if async_write:
+            await self._wait_screenshot_slot()
+        try:
+            with self.metrics.span('snapshot'):
+                if snapshot_format == 'mhtml':
+                    self._check_blocked_screenshot(page)
+                    session = await page.context.new_cdp_session(page)
+                    try:
+                        data = (await session.send('Page.captureSnapshot', {'format': 'mhtml'}))['data']
+                    finally:
+                        await session.detach()
+                else:
+                    data = with_base_href(await page.content(), page.url)
+
+            future = ScreenshotWriter().submit(filename, data.encode('utf-8'))
+            self._pending_screenshots[str(filename)] = future
+            if not async_write:
+                try:
+                    await asyncio.wrap_future(future)
+                except Exception:
+                    self._pending_screenshots.pop(str(filename), None)
+                    raise
+            self.logger.info(f"스냅샷 저장: {filename}")
+            return str(filename)
+        except Exception as e:
+            self.logger.error(f"스냅샷 저장 에러: {e}")
+            return None
+
+    async def _capture_screenshot(self, page, path=None):
+        """
+        screenshots 설정대로 캡처 (platforms.yaml settings.screenshots + 플랫폼별 screenshots)
+        - format / quality: png(무손실) | jpeg(quality 1~100)
+        - capture: full_page | viewport | element (clip_selector 요소만, 없으면 전체 페이지)
+        - max_height: 전체 페이지 캡처 높이 상한 (px, 0 = 제한 없음)
+        반환: 이미지 바이트
+        """
+        config = self.screenshot_config
+        options = {'timeout': int(config.get('timeout_ms', 10000))}
+        if path:
+            options['path'] = path
+        if config.get('format') in ('jpeg', 'jpg'):
+            options['type'] = 'jpeg'
+            options['quality'] = int(config.get('quality', 80))
+
+        capture = config.get('capture', 'full_page')
+        if capture == 'element' and config.get('clip_selector'):
+            element = page.locator(config['clip_selector']).first
+            if await element.count():
+                return await element.screenshot(**options)
+            self.logger.debug(f"스크린샷 영역 없음 (전체 페이지 캡처): {config['clip_selector']}")
+        elif capture == 'viewport':
+            return await page.screenshot(**options)
+
+        options['full_page'] = True
+        max_height = int(config.get('max_height') or 0)
+        if max_height:
+            width, height = await page.evaluate(
+                "() => [document.documentElement.scrollWidth, document.documentElement.scrollHeight]"
+            )
+            if height > max_height:
+                options['clip'] = {'x': 0, 'y': 0, 'width': width, 'height': max_height}
+                self.metrics.add('screenshot_clipped')
+        return await page.screenshot(**options)
+
+    def _count_screenshot_bytes(self, path):
+        """새로 기록한 스크린샷 용량 집계 (요금제당 디스크 사용량 리포트용)"""
+        try:
+            self.metrics.add('screenshot_bytes', os.path.getsize(path))
+            self.metrics.add('screenshot_files')
+        except OSError:
+            pass
+
+    async def _wait_screenshot_slot(self):
+        """백그라운드 저장 대기 개수가 상한(max_pending)이면 하나가 끝날 때까지 대기 (메모리 상한)"""
+        limit = max(1, int(self.screenshot_config.get('max_pending', 8)))
+        pending = [f for f in self._pending_screenshots.values() if not f.done()]
+        if len(pending) < limit:
+            return
+
+        started = time.perf_counter()
+        await asyncio.wait([asyncio.wrap_future(f) for f in pending], return_when=asyncio.FIRST_COMPLETED)
+        self.metrics.add('screenshot_backpressure_ms', (time.perf_counter() - started) * 1000)
+
+    def _resolve_screenshot(self, future, plan_data, row):
+        """저장이 끝난 스크린샷의 요금제 행 기록 (저장 실패면 screenshot_path 를 비움)"""
+        if future.exception() is not None:
+            if row.get('screenshot_path') not in self._failed_screenshots:
+                self._failed_screenshots.add(row.get('screenshot_path'))
+                self.logger.error(f"스크린샷 저장 에러: {future.exception()}")
+                self.metrics.add('screenshot_failures')
+            plan_data['screenshot_path'] = row['screenshot_path'] = None
+        self.plan_writer.add(row)
+
+    def _release_screenshot_rows(self):
+        """스크린샷 저장이 끝난 보류 행을 PlanWriter 로 넘김"""
+        if not self._awaiting_screenshot:
+            return
+        waiting = []
+        for entry in self._awaiting_screenshot:
+            if entry[0].done():
+                self._resolve_screenshot(*entry)
+            else:
+                waiting.append(entry)
+        self._awaiting_screenshot = waiting
+
+    async def wait_screenshots(self):
+        """백그라운드 스크린샷 저장 완료를 이벤트 루프를 막지 않고 대기 (flush_screenshots 전)"""
+        pending = [asyncio.wrap_future(f) for f in self._pending_screenshots.values() if not f.done()]
+        if pending:
+            with self.metrics.span('screenshot_flush'):
+                await asyncio.wait(pending)
+
+    def flush_screenshots(self):
+        """백그라운드 스크린샷 저장 완료까지 대기 후 보류된 요금제 행 기록 (finish_crawl_log / export 전)"""
+        pending = list(self._pending_screenshots.items())
+        if pending:
+            with self.metrics.span('screenshot_flush'):
+                concurrent.futures.wait([f for _, f in pending])
+
+        for entry in self._awaiting_screenshot:
+            self._resolve_screenshot(*entry)
+        self._awaiting_screenshot = []
+
+        # 요금제에 연결되지 않은 스크린샷의 실패도 기록
+        for path, future in pending:
+            if future.exception() is None:
+                self._count_screenshot_bytes(path)
+            elif path not in self._failed_screenshots:
+                self.logger.error(f"스크린샷 저장 에러: {path} ({future.exception()})")
+                self.metrics.add('screenshot_failures')
+        self._pending_screenshots.clear()
+        self._failed_screenshots.clear()
+
+        if self.screenshot_store is not None:
+            # 세션 manifest: 요금제(기존 파일명) -> blob (저장 실패 항목 제외)
+            try:
+                self.screenshot_store.save(self.screenshot_dir)
+            except Exception as e:
+                self.logger.error(f"스크린샷 manifest 저장 실패: {e}")
+            if self.screenshot_store.stored or self.screenshot_store.reused:
+                self.logger.info(
+                    f"스크린샷 blob: 신규 {self.screenshot_store.stored}개, 재사용 {self.screenshot_store.reused}개"
+                )
+                self.metrics.add('screenshot_blobs_stored', self.screenshot_store.stored)
+                self.metrics.add('screenshot_blobs_reused', self.screenshot_store.reused)
+                self.screenshot_store.stored = self.screenshot_store.reused = 0
+
+    def _decide_crawl_mode(self):
+        """
+        증분/전체 결정: 설정이 꺼져 있거나 force_full 이거나
+        마지막 성공한 전체 수집이 full_every_hours 보다 오래됐으면 전체 수집
+        """
+        if self.force_full or not self.incremental_config.get('enabled'):
+            return 'full'
+
         try:
-            self.crawl_log = CrawlLog(
+            last_full = (
+                self.db.query(CrawlLog.start_time)
+                .filter(CrawlLog.platform == self.platform_key, CrawlLog.status == 'success')
+                .filter((CrawlLog.mode == 'full') | (CrawlLog.mode.is_(None)))
+                .filter((CrawlLog.scope == 'full') | (CrawlLog.scope.is_(None)))
+                .order_by(CrawlLog.start_time.desc())
+                .first()
+            )
+        except Exception as e:
+            self.logger.warning(f"이전 수집 기록 조회 실패 (전체 수집): {e}")
+            return 'full'
+        finally:
+            self.db.rollback()  # 읽기 트랜잭션 종료
+
+        full_every = float(self.incremental_config.get('full_every_hours', 72))
+        if last_full is None or (datetime.now() - last_full[0]).total_seconds() > full_every * 3600:
+            return 'full'
+        return 'incremental'
+
+    def list_fingerprint(self, item):
+        """
+        목록 카드 메타데이터 해시 (비교 불가이면 None -> 증분 생략 없이 상세 수집)
+        카드에 incremental.compare_fields (기본: price) 값이 모두 있어야 한다.
+        요금제명/통신사만 있는 카드는 상세의 가격/데이터 변경을 알 수 없으므로 비교하지 않음
+        """
+        if not isinstance(item, dict):
+            return None
+        compare_fields = self.incremental_config.get('compare_fields') or ['price']
+        if not all(item.get(field) not in (None, '') for field in compare_fields):
+            return None
+        content = {k: v for k, v in item.items() if k not in VOLATILE_KEYS}
+        if not content:
+            return None
+        payload = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def _skip_unchanged(self, items):
+        """
+        증분 모드: 이전 성공 수집과 목록 카드 해시가 같은 항목은 상세 방문 없이 '확인됨' 처리
+        반환: 건너뛴 item 인덱스 집합 (이전 관측값은 self.results 에 채워 엑셀에도 포함)
+        """
+        fingerprints = {
+            idx: (item.get('url'), self.list_fingerprint(item))
+            for idx, item in enumerate(items)
+            if isinstance(item, dict) and item.get('url')
+        }
+        fingerprints = {idx: v for idx, v in fingerprints.items() if v[1]}
+        if self.crawl_mode != 'incremental' or not fingerprints:
+            return set()
+
+        urls = list({url for url, _ in fingerprints.values()})
+        previous = {}  # url -> [(identity, fingerprint)]
+        try:
+            for i in range(0, len(urls), 500):
+                rows = (
+                    self.db.query(PlanIdentity)
+                    .filter(
+                        PlanIdentity.platform == self.platform_key,
+                        PlanIdentity.url.in_(urls[i:i + 500]),
+                        PlanIdentity.last_success_crawl_log_id.isnot(None)
+                    )
+                )
+                for identity in rows:
+                    previous.setdefault(identity.url, []).append(identity)
+
+            skipped = set()
+            seen_ids = []
+            for idx, (url, fingerprint) in fingerprints.items():
+                identities = previous.get(url)
+                if identities and all(i.list_fingerprint == fingerprint for i in identities):
+                    skipped.add(idx)
+                    seen_ids.extend(i.id for i in identities)
+            if not skipped:
+                return set()
+
+            # 이전 관측값 복원 (엑셀/결과 집계용)
+            latest = {}
+            for i in range(0, len(seen_ids), 500):
+                for plan in self.db.query(PlanModel).filter(PlanModel.identity_id.in_(seen_ids[i:i + 500])):
+                    if plan.identity_id not in latest or plan.id > latest[plan.identity_id].id:
+                        latest[plan.identity_id] = plan
+            network = {i.id: i.network for ids in previous.values() for i in ids}
+            for identity_id, plan in latest.items():
+                self.results.append({
+                    **(plan.details or {}),
+                    'platform': plan.platform,
+                    'carrier': plan.carrier,
+                    'network': network.get(identity_id),
+                    'plan_name': plan.plan_name,
+                    'price': plan.price,
+                    'data_raw': plan.data_raw,
+                    'url': plan.url,
+                    'screenshot_path': plan.screenshot_path
+                })
+        except Exception as e:
+            self.logger.warning(f"증분 비교 실패 (전체 상세 수집으로 진행): {e}")
+            return set()
+        finally:
+            self.db.rollback()
+
+        crawl_log_id = self.crawl_log_id
+
+        def mark_seen(session):
+            now = datetime.now()
+            for i in range(0, len(seen_ids), 500):
+                session.query(PlanIdentity).filter(PlanIdentity.id.in_(seen_ids[i:i + 500])).update(
+                    {'last_seen': now, 'last_crawl_log_id': crawl_log_id},
+                    synchronize_session=False
+                )
+
+        DbWriter().submit(mark_seen)
+        self.metrics.add('incremental_skipped', len(skipped))
+        self.logger.info(f"증분 수집: 변경 없는 {len(skipped)}/{len(items)}개 상세 방문 생략")
+        return skipped
+
+    async def start_crawl_log(self, **options):
+        """
+        크롤링 시작 로그 기록 (writer 대기 중에도 이벤트 루프는 진행)
+        options: crawl() 의 kwargs - limit / test_mode 가 있으면 부분 실행
+        """
+        self.metrics.reset()
+        self.crawl_log_closed = False
+        self.partial_reasons = []
+        if options.get('limit', 0) > 0:
+            self.mark_partial(f"limit={options['limit']}")
+        if options.get('test_mode'):
+            self.mark_partial('test_mode')
+
+        def create_log(session):
+            crawl_log = CrawlLog(
                 platform=self.platform_key,
                 status='running',
                 start_time=datetime.now()
             )
-            self.db.add(self.crawl_log)
-            self.db.commit()
-            self.logger.info(f"크롤링 로그 시작 (ID: {self.crawl_log.id})")
+            session.add(crawl_log)
+            session.flush()
+            return crawl_log.id
+
+        try:
+            self.crawl_log_id = await DbWriter().run(create_log)
+            # 스키마 보강(DbWriter 시작 시) 이후에 이전 기록 조회
+            self.crawl_mode = self._decide_crawl_mode()
+            self.logger.info(
+                f"크롤링 로그 시작 (ID: {self.crawl_log_id}, Mode: {self.crawl_mode}"
+                + (f", 부분 실행: {', '.join(self.partial_reasons)})" if self.partial_reasons else ")")
+            )
         except Exception as e:
             self.logger.error(f"DB 로그 시작 실패: {e}")
 
     def save_plan(self, plan_data):
         """요금제 정보 DB 저장"""
-        if not self.crawl_log:
+        if not self.crawl_log_id:
             self.logger.warning("Crawl Log가 시작되지 않아 데이터가 저장되지 않습니다.")
             return
 
+        started = time.perf_counter()
         try:
-            # 가격 문자열에서 숫자 추출 (예: "15,000" -> 15000)
+            # price_int 등 숫자 컬럼은 PlanWriter 가 배치 단위로 파싱 (core/spec_parser.py)
             price_str = str(plan_data.get('price', '0'))
-            price_int = int(''.join(filter(str.isdigit, price_str))) if any(char.isdigit() for char in price_str) else 0
 
-            plan = PlanModel(
-                crawl_log_id=self.crawl_log.id,
-                platform=self.platform_key,
-                carrier=plan_data.get('carrier'),
-                plan_name=plan_data.get('plan_name'),
-                price=price_str,
-                price_int=price_int,
-                data_raw=plan_data.get('data_raw'),
-                url=plan_data.get('url'),
-                screenshot_path=plan_data.get('screenshot_path'),
-                details=plan_data, # 전체 원본 데이터도 JSON으로 저장
-                collected_at=datetime.now()
-            )
-            self.db.add(plan)
-            # 성능을 위해 매번 커밋하지 않고 flush 만 하거나, 주기적으로 커밋할 수 있음
-            # 여기서는 안전을 위해 바로 커밋
-            self.db.commit() 
+            # 커밋은 PlanWriter 가 모아서 수행 (write_mode: row 이면 기존처럼 행마다 커밋)
+            row = {
+                'crawl_log_id': self.crawl_log_id,
+                'platform': self.platform_key,
+                'carrier': plan_data.get('carrier'),
+                'plan_name': plan_data.get('plan_name'),
+                'price': price_str,
+                'data_raw': plan_data.get('data_raw'),
+                'url': plan_data.get('url'),
+                'screenshot_path': plan_data.get('screenshot_path'),
+                'network': plan_data.get('network'),
+                'list_fingerprint': plan_data.get('list_fingerprint'),
+                # 컬럼에 이미 있는 값은 빼고 나머지 원본만 JSON 으로 (복사본이라 이후 변경 영향 없음)
+                'details': {k: v for k, v in plan_data.items() if k not in PLAN_COLUMN_KEYS},
+                'collected_at': datetime.now()
+            }
+            # 스크린샷이 아직 백그라운드 저장 중이면 결과가 나올 때까지 행 기록 보류
+            future = self._pending_screenshots.get(row['screenshot_path'])
+            if future is not None and not future.done():
+                self._awaiting_screenshot.append((future, plan_data, row))
+            elif future is not None:
+                self._resolve_screenshot(future, plan_data, row)
+            else:
+                self.plan_writer.add(row)
+            self._release_screenshot_rows()
             self.results.append(plan_data) # 메모리에도 유지 (선택사항)
             
         except Exception as e:
             self.logger.error(f"요금제 저장 실패: {e}")
-            self.db.rollback()
+        finally:
+            self.metrics.record('save_plan', (time.perf_counter() - started) * 1000)
 
-    def finish_crawl_log(self, status='success', error=None):
-        """크롤링 종료 로그 기록"""
-        if not self.crawl_log:
+    async def finish_crawl_log(self, status='success', error=None):
+        """
+        크롤링 종료 로그 기록 (남은 배치 기록까지 writer 를 await - 같은 루프의 다른 크롤러는 계속 진행)
+        이미 종료한 로그에 다시 호출하면 (예: 성공 종료 후 예외 처리에서 failed) 아무것도 하지 않는다.
+        """
+        if self.crawl_log_closed:
+            self.logger.warning(f"크롤링 로그가 이미 종료됨 (ID: {self.crawl_log_id}) - 중복 종료 무시 (Status: {status})")
+            return
+        self.crawl_log_closed = True
+        # 스크린샷은 DB 로그 여부와 무관하게 저장 완료까지 대기
+        await self.wait_screenshots()
+        self.flush_screenshots()
+        if not self.crawl_log_id:
             return
 
+        # 남은 버퍼는 항상 기록 (실패 종료 시에도 수집된 분량은 보존)
+        self.plan_writer.flush()
+
+        def close_log(session):
+            # writer 큐 순서상 이 시점에는 위 flush 배치까지 기록 완료 (배치 기록 시간도 집계에 포함)
+            write_ms, self.plan_writer.write_ms = self.plan_writer.write_ms, []
+            for elapsed_ms in write_ms:
+                self.metrics.record('db_write', elapsed_ms)
+            session.add_all([
+                CrawlTiming(crawl_log_id=self.crawl_log_id, phase=phase, **stats)
+                for phase, stats in self.metrics.histograms().items()
+            ])
+
+            if status == 'success' and self.full_run:
+                # 이번 크롤링에서 본 요금제 (저장 + 증분 생략) 를 성공 기준으로 확정 - 실패/진행 중/부분 크롤링은 반영하지 않음
+                session.query(PlanIdentity).filter(PlanIdentity.last_crawl_log_id == self.crawl_log_id).update(
+                    {'last_success_crawl_log_id': self.crawl_log_id}, synchronize_session=False
+                )
+
+            crawl_log = session.get(CrawlLog, self.crawl_log_id)
+            crawl_log.end_time = datetime.now()
+            crawl_log.status = status
+            crawl_log.items_count = len(self.results)
+            crawl_log.changed_count = self.plan_writer.changed
+            crawl_log.mode = self.crawl_mode
+            crawl_log.scope = 'full' if self.full_run else 'partial'
+            crawl_log.error_message = str(error) if error else None
+
         try:
-            self.crawl_log.end_time = datetime.now()
-            self.crawl_log.status = status
-            self.crawl_log.items_count = len(self.results)
-            self.crawl_log.error_message = str(error) if error else None
-            
-            self.db.commit()
-            self.logger.info(f"크롤링 로그 종료 (Status: {status}, Count: {len(self.results)})")
+            # writer 큐는 순서대로 처리되므로 반환 시점에 위 요금제 배치도 기록 완료
+            await DbWriter().run(close_log)
+            self.logger.info(
+                f"크롤링 로그 종료 (Status: {status}, Count: {len(self.results)}, "
+                f"Changed: {self.plan_writer.changed})"
+            )
+            if self.metrics.get('wait_calls'):
+                self.logger.info(
+                    f"조건 대기 {int(self.metrics.get('wait_calls'))}회: "
+                    f"{self.metrics.get('wait_ms') / 1000:.1f}s 대기, "
+                    f"{self.metrics.get('wait_saved_ms') / 1000:.1f}s 절약"
+                )
+            if self.metrics.get('scroll_rounds'):
+                self.logger.info(
+                    f"목록 스크롤 {int(self.metrics.get('scroll_rounds'))}회 "
+                    f"(더보기 {int(self.metrics.get('scroll_more_clicks'))}회): "
+                    f"{self.metrics.get('scroll_ms') / 1000:.1f}s"
+                )
+            if self.metrics.get('blocked_requests'):
+                self.logger.info(
+                    f"리소스 차단 {int(self.metrics.get('blocked_requests'))}건, "
+                    f"차단 중 촬영 {int(self.metrics.get('screenshot_blocked_pages'))}회"
+                )
+            shots = self.metrics.histograms().get('screenshot')
+            if shots:
+                files = self.metrics.get('screenshot_files')
+                average_kb = self.metrics.get('screenshot_bytes') / files / 1024 if files else 0
+                self.logger.info(
+                    f"스크린샷 {shots['count']}회: 캡처 p50 {shots['p50_ms']:.0f}ms / p95 {shots['p95_ms']:.0f}ms, "
+                    f"새 파일 {int(files)}개 평균 {average_kb:.0f}KB "
+                    f"(총 {self.metrics.get('screenshot_bytes') / 1024 / 1024:.1f}MB)"
+                )
+            slowest = sorted(self.metrics.histograms().items(), key=lambda x: -x[1]['total_ms'])[:3]
+            if slowest:
+                self.logger.info("단계별 소요 시간 상위: " + ", ".join(
+                    f"{phase} {stats['total_ms'] / 1000:.1f}s ({stats['count']}회, p95 {stats['p95_ms']:.0f}ms)"
+                    for phase, stats in slowest
+                ))
         except Exception as e:
             self.logger.error(f"DB 로그 종료 실패: {e}")
 
+        if status == 'success':
+            await self.refresh_current_plans()
+
+    async def refresh_current_plans(self):
+        """
+        성공한 크롤링 결과로 current_plans 의 이 플랫폼 분을 교체 (한 트랜잭션)
+        부분 실행은 이번에 본 요금제만 반영하고 보지 못한 요금제는 삭제하지 않는다.
+        """
+        if not self.results:
+            # 수집 0건 성공은 사이트 변경 가능성이 커서 기존 스냅샷 유지
+            self.logger.warning("수집된 요금제가 없어 current_plans 갱신 생략")
+            return
+        crawl_log_id, full = self.crawl_log_id, self.full_run
+        try:
+            copied, removed = await DbWriter().run(
+                lambda session: refresh_current_plans(session, self.platform_key, crawl_log_id, full=full)
+            )
+            if full:
+                self.logger.info(f"current_plans 갱신: 변경/신규 {copied}건, 판매 종료 {removed}건")
+            else:
+                self.logger.info(f"current_plans 부분 반영 ({', '.join(self.partial_reasons)}): 변경/신규 {copied}건, 삭제 없음")
+        except Exception as e:
+            self.logger.error(f"current_plans 갱신 실패 (이전 스냅샷 유지): {e}")
+
     def export_json(self):
         """결과를 JSON으로 저장 (임시)"""
         import json
+        self.flush_screenshots()
         output_file = Path(f"storage/data/{self.platform_key}_{datetime.now().strftime('%Y%m%d')}.json")
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with self.metrics.span('export'), open(output_file, 'w', encoding='utf-8') as f:
             json.dump(self.results, f, ensure_ascii=False, indent=2)
         self.logger.info(f"데이터 저장 완료: {output_file}")
     def export_excel(self):
         """결과를 Excel로 저장"""
         try:
+            # 저장 실패한 스크린샷 경로가 엑셀에 남지 않도록
+            self.flush_screenshots()
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             
             if self.session_dir:
@@ -326,12 +1724,13 @@ class BaseCrawler(ABC):
             
             output_file.parent.mkdir(parents=True, exist_ok=True)
             
-            df = pd.DataFrame(self.results)
-            # Remove detailed JSON object for clean excel
-            if 'details' in df.columns:
-                df = df.drop(columns=['details'])
-                
-            df.to_excel(output_file, index=False)
+            with self.metrics.span('export'):
+                df = pd.DataFrame(self.results)
+                # Remove detailed JSON object for clean excel
+                if 'details' in df.columns:
+                    df = df.drop(columns=['details'])
+                    
+                df.to_excel(output_file, index=False)
             self.logger.info(f"엑셀 저장 완료: {output_file}")
             return str(output_file)
         except Exception as e:
@@ -1,5 +1,4 @@
 from .base_crawler import BaseCrawler
-from playwright.async_api import async_playwright
 import asyncio
 
 class EgMobileCrawler(BaseCrawler):
@@ -8,118 +7,137 @@ class EgMobileCrawler(BaseCrawler):
         
     async def crawl(self, headless=False, **kwargs):
         self.logger.info("이지모바일 크롤링 시작")
-        self.start_crawl_log()
+        await self.start_crawl_log(**kwargs)
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=headless)
-            context = await browser.new_context(viewport={'width': 1920, 'height': 1080})
-            page = await context.new_page()
+        try:
+            if self.fetch_mode == 'http':
+                # 서버 렌더링 테이블 + 목록 캡처 없음 -> 브라우저 없이 HTTP 로 수집
+                self.logger.info("HTTP 모드로 수집 (브라우저 미사용)")
+                await self._crawl_carriers(
+                    None, lambda page, url, network: self._fetch_items_http(url, network), kwargs
+                )
+            else:
+                async with self.open_context(headless=headless) as context:
+                    await self._crawl_carriers(context, self._fetch_items_browser, kwargs)
             
-            try:
-                base_url = self.selectors.get('url', "https://www.egmobile.co.kr/charge/list")
-                
-                # Carriers to crawl (KT, LG U+) - Query param te=kt / te=lg
-                carriers = [
-                    {'name': 'KT', 'param': 'kt'},
-                    {'name': 'LGU+', 'param': 'lg'}
-                ]
-                
-                total_items = 0
+            await self.finish_crawl_log(status='success')
+            
+        except Exception as e:
+            self.logger.error(f"크롤링 에러: {e}")
+            await self.finish_crawl_log(status='failed', error=e)
+
+    async def _crawl_carriers(self, context, fetch_items, kwargs):
+        base_url = self.selectors.get('url', "https://www.egmobile.co.kr/charge/list")
+        
+        # Carriers to crawl (KT, LG U+) - Query param te=kt / te=lg
+        carriers = [
+            {'name': 'KT', 'param': 'kt'},
+            {'name': 'LGU+', 'param': 'lg'}
+        ]
+        
+        # 통신망별 목록을 병렬 수집 (http 모드는 페이지 없이 요청만 병렬)
+        results = await self.run_filter_views(
+            context, carriers,
+            lambda page, carrier: fetch_items(page, f"{base_url}?te={carrier['param']}", carrier['name']),
+            limit=self.item_limit(kwargs)
+        )
+        
+        for carrier, item in results:
+            plan_data = {
+                'platform': self.platform_key,
+                'carrier': item.get('carrier'),
+                'plan_name': item.get('plan_name'),
+                'price': item.get('price'),
+                'data_raw': item.get('data'),
+                'url': f"{base_url}?te={carrier['param']}", 
+                'details': item
+            }
+            
+            plan_data['screenshot_path'] = 'captured_in_list'
+            
+            self.save_plan(plan_data)
+            self.logger.info(f"수집: {plan_data['carrier']} - {plan_data['plan_name']}")
+
+    async def _fetch_items_http(self, target_url, network):
+        """셀렉터 YAML (list.*) 로 서버 HTML 파싱 - 브라우저 JS 추출과 같은 결과 형식"""
+        _, doc = await self.fetch_document(target_url)
+        return self.parse_list(doc, network)
+
+    def parse_list(self, doc, network):
+        """요금표 문서 (core.html_doc) -> 요금제 item 리스트 (tests/run_html_doc_test.py 에서 저장된 HTML 로 확인)"""
+        sel = self.selectors['list']
+        
+        def cell_text(row, key):
+            el = row.select_one(sel[key])
+            return el.text() if el else ''
+        
+        items = []
+        for tr in doc.select(sel['item_card']):
+            price_el = tr.select_one(sel['price_promo']) or tr.select_one(sel['price_original'])
+            if price_el is None:
+                price_el = tr.select_one('td:nth-child(5)')
+            
+            items.append({
+                'carrier': f'EG Mobile ({network})',
+                'plan_name': cell_text(tr, 'plan_name'),
+                'data': cell_text(tr, 'data'),
+                'voice': cell_text(tr, 'voice'),
+                'price': price_el.text() if price_el else '0'
+            })
+        return items
+
+    async def _fetch_items_browser(self, page, target_url, network):
+        await self.goto(page, target_url)
+        await self.wait_ready(page, 2000)
+        
+        # No pagination found in analysis, assuming all on one page or infinite scroll (but analysis said "No infinite scroll")
+        # Let's scroll down a bit just in case
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        await self.wait_ready(page, 1000)
+        
+        # Extract items
+        return await page.evaluate(f"""(network) => {{
+                const list = [];
+                // Select rows in the table
+                // Updated to 'div.rate_table table tbody tr'
+                const rows = document.querySelectorAll('div.rate_table table tbody tr');
                 
-                for carrier in carriers:
-                    self.logger.info(f"[{carrier['name']}] 요금제 수집 시작")
+                rows.forEach(tr => {{
+                    const result = {{}};
+                    result.carrier = 'EG Mobile (' + network + ')';
                     
-                    target_url = f"{base_url}?te={carrier['param']}"
-                    await page.goto(target_url, wait_until='domcontentloaded')
-                    await page.wait_for_timeout(2000)
+                    // Plan Name - 1st col
+                    const nameTd = tr.querySelector('td:nth-child(1)');
+                    result.plan_name = nameTd ? nameTd.innerText.trim() : '';
                     
-                    # No pagination found in analysis, assuming all on one page or infinite scroll (but analysis said "No infinite scroll")
-                    # Let's scroll down a bit just in case
-                    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    await page.wait_for_timeout(1000)
+                    // Data - 2nd col
+                    const dataTd = tr.querySelector('td:nth-child(2)');
+                    result.data = dataTd ? dataTd.innerText.trim() : '';
                     
-                    # Extract items
-                    items = await page.evaluate(f"""(network) => {{
-                        const list = [];
-                        // Select rows in the table
-                        // Updated to 'div.rate_table table tbody tr'
-                        const rows = document.querySelectorAll('div.rate_table table tbody tr');
-                        
-                        rows.forEach(tr => {{
-                            const result = {{}};
-                            result.carrier = 'EG Mobile (' + network + ')';
-                            
-                            // Plan Name - 1st col
-                            const nameTd = tr.querySelector('td:nth-child(1)');
-                            result.plan_name = nameTd ? nameTd.innerText.trim() : '';
-                            
-                            // Data - 2nd col
-                            const dataTd = tr.querySelector('td:nth-child(2)');
-                            result.data = dataTd ? dataTd.innerText.trim() : '';
-                            
-                            // Voice - 3rd col
-                            const voiceTd = tr.querySelector('td:nth-child(3)');
-                            result.voice = voiceTd ? voiceTd.innerText.trim() : '';
-                            
-                            // Price - 5th col
-                            // Promo is usually strong, Original is span:first-child
-                            const priceTd = tr.querySelector('td:nth-child(5)');
-                            
-                            let priceText = '0';
-                            if (priceTd) {{
-                                const promoEl = priceTd.querySelector('strong');
-                                const originalEl = priceTd.querySelector('span:first-child');
-                                
-                                // Logic: if promo exists, use it? Or capture both?
-                                // Our standard is just one price field, usually promo if available.
-                                if (promoEl) priceText = promoEl.innerText;
-                                else if (originalEl) priceText = originalEl.innerText;
-                                else priceText = priceTd.innerText; // Fallback
-                            }}
-                            
-                            result.price = priceText.trim();
-                            
-                            list.push(result);
-                        }});
-                        
-                        return list;
-                    }}""", carrier['name'])
+                    // Voice - 3rd col
+                    const voiceTd = tr.querySelector('td:nth-child(3)');
+                    result.voice = voiceTd ? voiceTd.innerText.trim() : '';
                     
-                    self.logger.info(f"[{carrier['name']}] 수집된 요금제: {len(items)}개")
+                    // Price - 5th col
+                    // Promo is usually strong, Original is span:first-child
+                    const priceTd = tr.querySelector('td:nth-child(5)');
                     
-                    valid_count = 0
-                    for item in items:
-                        limit = kwargs.get('limit', 0)
-                        if limit > 0 and valid_count >= limit:
-                            break
-                        if kwargs.get('test_mode') and limit == 0 and valid_count >= 3:
-                            break
+                    let priceText = '0';
+                    if (priceTd) {{
+                        const promoEl = priceTd.querySelector('strong');
+                        const originalEl = priceTd.querySelector('span:first-child');
                         
-                        if not item['plan_name']:
-                            continue
-
-                        valid_count += 1
-                        total_items += 1
-                        
-                        plan_data = {
-                            'platform': self.platform_key,
-                            'carrier': item.get('carrier'),
-                            'plan_name': item.get('plan_name'),
-                            'price': item.get('price'),
-                            'data_raw': item.get('data'),
-                            'url': target_url, 
-                            'details': item
-                        }
-                        
-                        plan_data['screenshot_path'] = 'captured_in_list'
-                        
-                        self.save_plan(plan_data)
-                        self.logger.info(f"수집: {plan_data['carrier']} - {plan_data['plan_name']}")
-                
-                self.finish_crawl_log(status='success')
+                        // Logic: if promo exists, use it? Or capture both?
+                        // Our standard is just one price field, usually promo if available.
+                        if (promoEl) priceText = promoEl.innerText;
+                        else if (originalEl) priceText = originalEl.innerText;
+                        else priceText = priceTd.innerText; // Fallback
+                    }}
+                    
+                    result.price = priceText.trim();
+                    
+                    list.push(result);
+                }});
                 
-            except Exception as e:
-                self.logger.error(f"크롤링 에러: {e}")
-                self.finish_crawl_log(status='failed', error=e)
-            finally:
-                await browser.close()
+                return list;
+            }}""", network)
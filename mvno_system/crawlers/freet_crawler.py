@@ -1,5 +1,4 @@
 from .base_crawler import BaseCrawler
-from playwright.async_api import async_playwright
 import asyncio
 from datetime import datetime
 
@@ -9,17 +8,15 @@ class FreeTCrawler(BaseCrawler):
         
     async def crawl(self, headless=False, **kwargs):
         self.logger.info("프리티 크롤링 시작")
-        self.start_crawl_log()
+        await self.start_crawl_log(**kwargs)
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=headless)
-            context = await browser.new_context(viewport={'width': 1920, 'height': 1080})
+        async with self.open_context(headless=headless) as context:
             page = await context.new_page()
             
             try:
                 target_url = self.selectors.get('url', f"{self.config['base_url']}/plan/ratePlan")
-                await page.goto(target_url, wait_until='domcontentloaded')
-                await page.wait_for_timeout(3000)
+                await self.goto(page, target_url)
+                await self.wait_ready(page, 3000)
                 
                 # Close Popups if any
                 try:
@@ -28,7 +25,7 @@ class FreeTCrawler(BaseCrawler):
                     for btn in close_btns:
                         if await btn.is_visible():
                             await btn.click()
-                            await page.wait_for_timeout(500)
+                            await self.wait_ready(page, 500)
                 except:
                     pass
                 
@@ -41,7 +38,7 @@ class FreeTCrawler(BaseCrawler):
                         more_btn = page.locator('a.btn-type3:has-text("더보기")')
                         if await more_btn.is_visible():
                             await more_btn.click()
-                            await page.wait_for_timeout(1000)
+                            await self.wait_ready(page, 1000)
                         else:
                             break
                     except:
@@ -90,33 +87,26 @@ class FreeTCrawler(BaseCrawler):
                 
                 self.logger.info(f"수집된 요금제 URL: {len(items)}개")
                 
-                valid_count = 0
-                for item in items:
-                     limit = kwargs.get('limit', 0)
-                     if limit > 0 and valid_count >= limit:
-                         break
-                     if kwargs.get('test_mode') and limit == 0 and valid_count >= 3:
-                         break
-                     
-                     if not item['url']:
-                         continue
- 
-                     valid_count += 1
-                     await self._crawl_plan_detail(item['url'], item, page)
+                # URL 없는 항목 제외 후 limit / test_mode 적용, 병렬 수집 (저장은 목록 순서대로)
+                targets = self.limit_items([item for item in items if item['url']], kwargs)
+                await self.run_detail_workers(
+                    context, targets,
+                    worker=lambda worker_page, item: self._crawl_plan_detail(item['url'], item, worker_page),
+                    on_result=self.save_plan,
+                    page=page
+                )
                 
-                self.finish_crawl_log(status='success')
+                await self.finish_crawl_log(status='success')
                 
             except Exception as e:
                 self.logger.error(f"크롤링 에러: {e}")
-                self.finish_crawl_log(status='failed', error=e)
-            finally:
-                await browser.close()
+                await self.finish_crawl_log(status='failed', error=e)
 
     async def _crawl_plan_detail(self, url, meta, page):
         self.logger.info(f"상세 이동: {url}")
         try:
-            await page.goto(url, wait_until='domcontentloaded')
-            await page.wait_for_timeout(2000)
+            await self.goto(page, url)
+            await self.wait_ready(page, 2000)
 
             try:
                 # Close potential popups in detail page
@@ -124,7 +114,7 @@ class FreeTCrawler(BaseCrawler):
                     const btn = document.querySelector('.btn-close, .modal-close, .xo-popup-close');
                     if(btn) btn.click();
                 }""")
-                await page.wait_for_timeout(500)
+                await self.wait_ready(page, 500)
             except:
                 pass
 
@@ -169,9 +159,10 @@ class FreeTCrawler(BaseCrawler):
                 'collected_at': datetime.now().isoformat()
             }
             
-            self.save_plan(plan_data)
-            
             await self._save_screenshot(page, plan_data)
             
+            return plan_data
+            
         except Exception as e:
             self.logger.error(f"상세 수집 실패 ({url}): {e}")
+            return None
@@ -1,5 +1,4 @@
 from .base_crawler import BaseCrawler
-from playwright.async_api import async_playwright
 import asyncio
 import re
 from datetime import datetime
@@ -10,18 +9,16 @@ class HelloMobileCrawler(BaseCrawler):
         
     async def crawl(self, headless=False, **kwargs):
         self.logger.info("헬로모바일 크롤링 시작")
-        self.start_crawl_log()
+        await self.start_crawl_log(**kwargs)
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=headless)
-            context = await browser.new_context(viewport={'width': 1920, 'height': 1080})
+        async with self.open_context(headless=headless) as context:
             page = await context.new_page()
             
             try:
                 # 1. 목록 페이지 접속
                 target_url = self.selectors.get('url', f"{self.config['base_url']}/rate/rateViewUsim.do")
-                await page.goto(target_url, wait_until='domcontentloaded')
-                await page.wait_for_timeout(3000)
+                await self.goto(page, target_url)
+                await self.wait_ready(page, 3000)
                 
                 # 팝업 닫기
                 try:
@@ -29,7 +26,7 @@ class HelloMobileCrawler(BaseCrawler):
                     for btn in close_btns:
                          if await btn.is_visible():
                              await btn.click()
-                             await page.wait_for_timeout(500)
+                             await self.wait_ready(page, 500)
                 except:
                     pass
                 
@@ -43,7 +40,7 @@ class HelloMobileCrawler(BaseCrawler):
                         more_btn = page.locator('#moreBtn')
                         if await more_btn.is_visible():
                             await more_btn.click()
-                            await page.wait_for_timeout(1500) # Wait for ajax load
+                            await self.wait_ready(page, 1500) # Wait for ajax load
                         else:
                             break
                     except:
@@ -86,7 +83,7 @@ class HelloMobileCrawler(BaseCrawler):
                             self.logger.warning(f"모달 로딩 실패: {plan_name}")
                             continue
 
-                        await page.wait_for_timeout(500)
+                        await self.wait_ready(page, 500)
                         
                         # Scrape Detail from Modal
                         detail_data = await page.evaluate("""() => {
@@ -168,10 +165,8 @@ class HelloMobileCrawler(BaseCrawler):
                         self.logger.error(f"상세 수집 실패 (Item {i}): {e}")
                         continue
 
-                self.finish_crawl_log(status='success')
+                await self.finish_crawl_log(status='success')
                 
             except Exception as e:
                 self.logger.error(f"크롤링 에러: {e}")
-                self.finish_crawl_log(status='failed', error=e)
-            finally:
-                await browser.close()
+                await self.finish_crawl_log(status='failed', error=e)
@@ -1,5 +1,4 @@
 from .base_crawler import BaseCrawler
-from playwright.async_api import async_playwright
 import asyncio
 
 class KTMobileCrawler(BaseCrawler):
@@ -8,18 +7,16 @@ class KTMobileCrawler(BaseCrawler):
         
     async def crawl(self, headless=False, **kwargs):
         self.logger.info("KT엠모바일 크롤링 시작")
-        self.start_crawl_log()
+        await self.start_crawl_log(**kwargs)
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=headless)
-            context = await browser.new_context(viewport={'width': 1920, 'height': 1080})
+        async with self.open_context(headless=headless) as context:
             page = await context.new_page()
             
             try:
                 # 1. 목록 페이지 접속
                 target_url = self.selectors.get('url', f"{self.config['base_url']}/rate/rateList.do")
-                await page.goto(target_url, wait_until='domcontentloaded')
-                await page.wait_for_timeout(3000)
+                await self.goto(page, target_url)
+                await self.wait_ready(page, 3000)
                 
                 # 팝업 닫기 Logic (여러 팝업 대응)
                 try:
@@ -30,25 +27,14 @@ class KTMobileCrawler(BaseCrawler):
                                 close_btn = popup.locator('button.close, .btn-close')
                                 if await close_btn.count() > 0:
                                     await close_btn.first.click()
-                                    await page.wait_for_timeout(500)
+                                    await self.wait_ready(page, 500)
                             except:
                                 pass
                 except:
                     pass
 
                 # 2. 아코디언 펼치기
-                try:
-                    # 아코디언 버튼 대기
-                    await page.wait_for_selector('button.c-accordion__button', timeout=10000)
-                    buttons = await page.locator('button.c-accordion__button').all()
-                    self.logger.info(f"아코디언 버튼 {len(buttons)}개 발견 - 펼치기 시도")
-                    
-                    for btn in buttons:
-                        if await btn.is_visible():
-                            await btn.click()
-                            await page.wait_for_timeout(500)
-                except Exception as e:
-                    self.logger.warning(f"아코디언 펼치기 중 오류 (또는 없음): {e}")
+                await self._expand_accordions(page)
 
                 # 3. 요금제 카드 로딩 대기
                 try:
@@ -63,133 +49,89 @@ class KTMobileCrawler(BaseCrawler):
                 
                 if not kwargs.get('test_mode'):
                      await page.mouse.wheel(0, 5000)
-                     await page.wait_for_timeout(2000)
-
-                cards = await page.locator('a.rate-info__wrap').all()
-                self.logger.info(f"발견된 요금제 카드: {len(cards)}개")
-                
-                valid_count = 0
-                for i in range(len(cards)):
-                     # Re-locate cards in case DOM changed
-                     cards = await page.locator('a.rate-info__wrap').all()
-                     if i >= len(cards): break
-                     card = cards[i]
+                     await self.wait_ready(page, 2000)
 
-                     limit = kwargs.get('limit', 0)
-                     if limit > 0 and valid_count >= limit:
-                         break
-                     if kwargs.get('test_mode') and limit == 0 and valid_count >= 3:
-                         break
-                        
-                     try:
-                         # 1. Get Basic Info from List (Carrier, Name)
-                         basic_data = await card.evaluate("""(card) => {
-                            const result = {};
-                            result.carrier = 'KT M Mobile';
-                            const nameEl = card.querySelector('strong');
-                            result.plan_name = nameEl ? nameEl.innerText : 'Unknown Plan';
-                            return result;
-                         }""")
-                         
-                         self.logger.info(f"상세 수집 시도: {basic_data['plan_name']}")
-                         
-                         # 2. Click to Open Modal
-                         await card.click()
-                         
-                         # 3. Wait for Modal
-                         try:
-                             modal = page.locator('.c-modal__body').first
-                             await modal.wait_for(state='visible', timeout=5000)
-                             await page.wait_for_timeout(1000) # Render wait
-                         except:
-                             self.logger.warning(f"모달 로딩 실패: {basic_data['plan_name']}")
-                             continue
+                # 4. 카드 메타 일괄 추출 (카드 위치 _index 는 모달 수집 동안 그대로 사용)
+                items = await self.extract_list(page)
+                self.logger.info(f"발견된 요금제 카드: {len(items)}개")
 
-                         # 4. Scrape Detail Data from Modal
-                         detail_data = await modal.evaluate("""(modal) => {
-                             const result = {};
-                             
-                             // Helper to extract text from product-summary items
-                             const items = Array.from(modal.querySelectorAll('li.product-summary__item'));
-                             
-                             items.forEach(item => {
-                                 const img = item.querySelector('img');
-                                 if (!img) return;
-                                 const src = img.src;
-                                 const textEl = item.querySelector('.product-summary__text');
-                                 const text = textEl ? textEl.innerText : '';
-                                 
-                                 if (src.includes('data')) result.data_full = text;
-                                 else if (src.includes('call')) result.voice_full = text;
-                                 else if (src.includes('sms')) result.sms_full = text;
-                             });
-                             
-                             // Price
-                             const priceEl = modal.querySelector('.product-detail__price b');
-                             result.price = priceEl ? priceEl.innerText : '0';
-                             
-                             return result;
-                         }""")
-                         
-                         # Screenshot (with Modal open)
-                         # KTMobile uses KT network
-                         screenshot_data = {
-                             'carrier': basic_data['carrier'],
-                             'network': 'KT',
-                             'plan_name': basic_data['plan_name']
-                         }
-                         screenshot_path = await self._save_screenshot(page, screenshot_data)
-                         
-                         # 6. Close Modal (Robust)
-                         # Try button click first
-                         try:
-                             close_btn = page.locator('button.c-popup-close, button.close, .c-modal__close').first
-                             if await close_btn.is_visible():
-                                 await close_btn.click()
-                             else:
-                                 await page.keyboard.press('Escape')
-                         except:
-                             await page.keyboard.press('Escape')
-                             
-                         # Wait for modal to disappear
-                         try:
-                             await page.locator('.c-modal__body').first.wait_for(state='hidden', timeout=3000)
-                         except:
-                             # Force reload if sticky
-                             self.logger.warning("모달 닫기 실패. 페이지 리로드")
-                             await page.reload()
-                             await page.wait_for_timeout(2000)
-                             # Re-open accordions if needed, but simple reload might be safer to reset state
-                         
-                         await page.wait_for_timeout(500)
-                         
-                         # 7. Save
-                         final_data = {
-                            'platform': self.platform_key,
-                            'carrier': basic_data['carrier'],
-                            'plan_name': basic_data['plan_name'],
-                            'price': detail_data.get('price'),
-                            'data_raw': detail_data.get('data_full', '').replace('\n', ' '),
-                            'url': target_url, # Same URL since it's a modal
-                            'details': detail_data,
-                            'screenshot_path': screenshot_path
-                         }
-                         
-                         self.save_plan(final_data)
-                         valid_count += 1
-                         self.logger.info(f"수집 완료: {final_data['plan_name']}")
-                         
-                     except Exception as e:
-                         self.logger.error(f"카드 처리 중 에러: {e}")
-                         # Try to recover by closing modal if open
-                         await page.keyboard.press('Escape')
-                         await page.wait_for_timeout(1000)
-                         continue
+                # 5. 카드별 모달 열기 -> 본문이 보이는 즉시 추출 -> 닫기
+                # 모달이라 상세 URL 이 없으므로 목록 URL 을 저장 (page.url 은 모달/복구 후 달라질 수 있음)
+                await self.run_card_views(
+                    page, items,
+                    lambda modal_page, item, payload: self._extract_modal(modal_page, item, payload, target_url),
+                    on_result=self.save_plan,
+                    limit=self.item_limit(kwargs),
+                    on_reset=self._expand_accordions
+                )
                 
-                self.finish_crawl_log(status='success')
+                await self.finish_crawl_log(status='success')
                 
             except Exception as e:
                 self.logger.error(f"크롤링 에러: {e}")
-                self.finish_crawl_log(status='failed', error=e)
-            finally:
-                await browser.close()
+                await self.finish_crawl_log(status='failed', error=e)
+
+    async def _expand_accordions(self, page):
+        """요금제 그룹 아코디언 모두 펼치기 (모달 복구로 새로고침한 뒤에도 호출)"""
+        try:
+            # 아코디언 버튼 대기
+            await page.wait_for_selector('button.c-accordion__button', timeout=10000)
+            buttons = await page.locator('button.c-accordion__button').all()
+            self.logger.info(f"아코디언 버튼 {len(buttons)}개 발견 - 펼치기 시도")
+            
+            for btn in buttons:
+                if await btn.is_visible():
+                    await btn.click()
+                    await self.wait_ready(page, 500)
+        except Exception as e:
+            self.logger.warning(f"아코디언 펼치기 중 오류 (또는 없음): {e}")
+
+    async def _extract_modal(self, page, item, payload, target_url):
+        """열린 모달에서 상세 추출 + 스크린샷 (모달이 열린 상태)"""
+        modal = page.locator('.c-modal__body').first
+        detail_data = await modal.evaluate("""(modal) => {
+            const result = {};
+            
+            // Helper to extract text from product-summary items
+            const items = Array.from(modal.querySelectorAll('li.product-summary__item'));
+            
+            items.forEach(item => {
+                const img = item.querySelector('img');
+                if (!img) return;
+                const src = img.src;
+                const textEl = item.querySelector('.product-summary__text');
+                const text = textEl ? textEl.innerText : '';
+                
+                if (src.includes('data')) result.data_full = text;
+                else if (src.includes('call')) result.voice_full = text;
+                else if (src.includes('sms')) result.sms_full = text;
+            });
+            
+            // Price
+            const priceEl = modal.querySelector('.product-detail__price b');
+            result.price = priceEl ? priceEl.innerText : '0';
+            
+            return result;
+        }""")
+        
+        plan_name = item.get('plan_name') or 'Unknown Plan'
+        
+        # Screenshot (with Modal open)
+        # KTMobile uses KT network
+        screenshot_data = {
+            'carrier': 'KT M Mobile',
+            'network': 'KT',
+            'plan_name': plan_name
+        }
+        screenshot_path = await self._save_screenshot(page, screenshot_data)
+        
+        return {
+            'platform': self.platform_key,
+            'carrier': 'KT M Mobile',
+            'plan_name': plan_name,
+            'price': detail_data.get('price'),
+            'data_raw': detail_data.get('data_full', '').replace('\n', ' '),
+            'url': target_url, # Same URL since it's a modal
+            'details': detail_data,
+            'screenshot_path': screenshot_path
+        }
@@ -1,5 +1,4 @@
 from .base_crawler import BaseCrawler
-from playwright.async_api import async_playwright
 import asyncio
 import re
 from datetime import datetime
@@ -10,23 +9,23 @@ class LiivMCrawler(BaseCrawler):
         
     async def crawl(self, headless=False, **kwargs):
         self.logger.info("리브모바일 크롤링 시작 (Mobile URL Strategy)")
-        self.start_crawl_log()
+        await self.start_crawl_log(**kwargs)
         
-        async with async_playwright() as p:
-            # Use Mobile Viewport & User Agent to ensure m.liivm.com renders correctly
-            browser = await p.chromium.launch(headless=headless)
-            context = await browser.new_context(
-                viewport={'width': 375, 'height': 812}, 
-                user_agent="Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Mobile/15E148 Safari/604.1"
-            )
+        # Use Mobile Viewport & User Agent to ensure m.liivm.com renders correctly
+        async with self.open_context(
+            headless=headless,
+            viewport={'width': 375, 'height': 812}, 
+            user_agent="Mozilla/5.0 (iPhone; CPU iPhone OS 15_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.0 Mobile/15E148 Safari/604.1"
+        ) as context:
             page = await context.new_page()
+            capture = self.capture_responses(page)
             
             try:
                 # 1. 목록 페이지 접속 (Mobile URL)
                 target_url = "https://m.liivm.com/rateplan/plans/products"
                 self.logger.info(f"이동: {target_url}")
-                await page.goto(target_url, wait_until='domcontentloaded')
-                await page.wait_for_timeout(5000)
+                await self.goto(page, target_url)
+                await self.wait_ready(page, 5000)
                 
                 # 팝업 닫기
                 try:
@@ -34,74 +33,54 @@ class LiivMCrawler(BaseCrawler):
                     for btn in close_btns:
                         if await btn.is_visible():
                             await btn.click()
-                            await page.wait_for_timeout(500)
+                            await self.wait_ready(page, 500)
                 except:
                     pass
 
-                # 2. 데이터 로딩 (무한 스크롤)
-                # Scroll down to load more items
+                # 2. 데이터 로딩 (무한 스크롤, 필요한 개수가 보이면 중단)
                 self.logger.info("아이템 로딩 중...")
-                last_height = await page.evaluate("document.body.scrollHeight")
-                max_scrolls = 20
-                scroll_count = 0
-                
-                while scroll_count < max_scrolls:
-                    if kwargs.get('test_mode') and scroll_count > 2:
-                        break
-                        
-                    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    await page.wait_for_timeout(1500)
-                    new_height = await page.evaluate("document.body.scrollHeight")
-                    if new_height == last_height:
-                        # Try button click if exists
-                        try:
-                            more_btn = page.locator('button:has-text("더보기")').first
-                            if await more_btn.is_visible():
-                                await more_btn.click()
-                                await page.wait_for_timeout(1500)
-                            else:
-                                break
-                        except:
-                            break
-                    last_height = new_height
-                    scroll_count += 1
+                await self.load_all_items(page, '[onclick*="prodDetailPage"]', limit=self.item_limit(kwargs))
                     
                 # 3. 데이터 수집
-                # Find items with prodDetailPage onclick
-                await page.wait_for_selector('[onclick*="prodDetailPage"]', timeout=10000)
+                # 상품 목록 API 응답에서 ID 를 바로 얻고, 없으면 onclick 요소에서 추출
+                items_data = await self.plans_from_capture(capture, page)
+                if not items_data:
+                    # Find items with prodDetailPage onclick
+                    await page.wait_for_selector('[onclick*="prodDetailPage"]', timeout=10000)
                 
-                # Extract IDs for URL construction
-                items_data = await page.evaluate("""() => {
-                    const list = [];
-                    // Look for elements calling prodDetailPage
-                    const elements = document.querySelectorAll('[onclick*="prodDetailPage"]');
+                    # Extract IDs for URL construction
+                    items_data = await page.evaluate("""() => {
+                        const list = [];
+                        // Look for elements calling prodDetailPage
+                        const elements = document.querySelectorAll('[onclick*="prodDetailPage"]');
                     
-                    elements.forEach(el => {
-                        const soId = el.getAttribute('data-soId');
-                        const prodGrpCd = el.getAttribute('data-prodGrpCd');
-                        const prodCd = el.getAttribute('data-prodCd');
+                        elements.forEach(el => {
+                            const soId = el.getAttribute('data-soId');
+                            const prodGrpCd = el.getAttribute('data-prodGrpCd');
+                            const prodCd = el.getAttribute('data-prodCd');
                         
-                        // Try to find name/price in parent/sibling context if needed
-                        // But usually we just need IDs to visit detail
-                        // Let's grab name for logging
-                        let container = el.closest('li') || el.closest('div.card_item') || el.closest('div');
-                        let name = '';
-                        if(container) {
-                            const nameEl = container.querySelector('.tit, strong, .name');
-                            if(nameEl) name = nameEl.innerText.trim();
-                        }
+                            // Try to find name/price in parent/sibling context if needed
+                            // But usually we just need IDs to visit detail
+                            // Let's grab name for logging
+                            let container = el.closest('li') || el.closest('div.card_item') || el.closest('div');
+                            let name = '';
+                            if(container) {
+                                const nameEl = container.querySelector('.tit, strong, .name');
+                                if(nameEl) name = nameEl.innerText.trim();
+                            }
                         
-                        if(soId && prodGrpCd && prodCd) {
-                            list.push({
-                                soId: soId,
-                                prodGrpCd: prodGrpCd,
-                                prodCd: prodCd,
-                                temp_name: name
-                            });
-                        }
-                    });
-                    return list;
-                }""")
+                            if(soId && prodGrpCd && prodCd) {
+                                list.push({
+                                    soId: soId,
+                                    prodGrpCd: prodGrpCd,
+                                    prodCd: prodCd,
+                                    temp_name: name
+                                });
+                            }
+                        });
+                        return list;
+                    }""")
+                
                 
                 self.logger.info(f"발견된 요금제(ID 추출): {len(items_data)}개")
                 
@@ -116,11 +95,11 @@ class LiivMCrawler(BaseCrawler):
                     try:
                         # Construct Detail URL
                         # /rateplan/plans/product-detailed?soId=01&prodGrpCd=K01&prodCd=P000000001
-                        detail_url = f"https://m.liivm.com/rateplan/plans/product-detailed?soId={item['soId']}&prodGrpCd={item['prodGrpCd']}&prodCd={item['prodCd']}"
+                        detail_url = item.get('url') or f"https://m.liivm.com/rateplan/plans/product-detailed?soId={item['soId']}&prodGrpCd={item['prodGrpCd']}&prodCd={item['prodCd']}"
                         
                         self.logger.info(f"상세 이동: {detail_url}")
-                        await page.goto(detail_url, wait_until='domcontentloaded')
-                        await page.wait_for_timeout(2000)
+                        await self.goto(page, detail_url)
+                        await self.wait_ready(page, 2000)
                         
                         # Scrape Detail Data
                         detail_data = await page.evaluate("""() => {
@@ -214,10 +193,8 @@ class LiivMCrawler(BaseCrawler):
                         self.logger.error(f"상세 수집 실패 ({item.get('temp_name')}): {e}")
                         continue
 
-                self.finish_crawl_log(status='success')
+                await self.finish_crawl_log(status='success')
                 
             except Exception as e:
                 self.logger.error(f"크롤링 에러: {e}")
-                self.finish_crawl_log(status='failed', error=e)
-            finally:
-                await browser.close()
+                await self.finish_crawl_log(status='failed', error=e)
@@ -1,5 +1,4 @@
 from .base_crawler import BaseCrawler
-from playwright.async_api import async_playwright
 import asyncio
 import re
 from datetime import datetime
@@ -15,18 +14,16 @@ class PhonebCrawler(BaseCrawler):
         self.logger.info("폰비 크롤링 시작")
         
         # DB 로그 시작
-        self.start_crawl_log()
+        await self.start_crawl_log(**kwargs)
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=headless)
-            context = await browser.new_context(viewport={'width': 1920, 'height': 1080})
+        async with self.open_context(headless=headless) as context:
             page = await context.new_page()
             
             error_occured = None
             try:
                 # 1. 접속
-                await page.goto(f"{self.config['base_url']}/plans", wait_until='domcontentloaded')
-                await page.wait_for_timeout(2000)
+                await self.goto(page, f"{self.config['base_url']}/plans")
+                await self.wait_ready(page, 2000)
                 
                 # 2. 필터 및 정렬 설정 (간소화: 전체 수집 기준)
                 await self._set_sorting(page)
@@ -35,32 +32,24 @@ class PhonebCrawler(BaseCrawler):
                 plan_urls = await self._get_plan_urls(page)
                 self.logger.info(f"수집된 요금제 URL: {len(plan_urls)}개")
                 
-                # 4. 상세 수집
-                for idx, url in enumerate(plan_urls, 1):
-                    self.logger.info(f"[{idx}/{len(plan_urls)}] 상세 수집: {url}")
-                    plan_data = await self._crawl_plan_detail(page, url)
-                    if plan_data:
-                        # DB 저장 (BaseCrawler 메서드)
-                        self.save_plan(plan_data)
-                        
-                    # 테스트 모드라면 앞 3개만 수집하고 종료 (속도 위해)
-                    # 수집 제한 및 테스트 모드 체크
-                    limit = kwargs.get('limit', 0)
-                    if limit > 0 and idx >= limit:
-                        self.logger.info(f"수집 제한({limit}개) 도달로 종료")
-                        break
-                        
-                    if kwargs.get('test_mode') and limit == 0 and idx >= 3:
-                        self.logger.info("테스트 모드: 3개 수집 후 종료")
-                        break
+                # 4. 상세 수집 (limit / test_mode 적용 후 병렬 수집, 저장은 목록 순서대로)
+                # 테스트 모드라면 앞 3개만 수집 (속도 위해)
+                plan_urls = self.limit_items(plan_urls, kwargs)
+                await self.run_detail_workers(
+                    context, plan_urls,
+                    worker=self._crawl_plan_detail,
+                    on_result=self.save_plan, # DB 저장 (BaseCrawler 메서드)
+                    page=page
+                )
                         
                 # 5. 결과 저장
                 if self.results:
+                    await self.wait_screenshots()  # 스크린샷 저장 대기 (루프 비차단)
                     self.export_excel() # 엑셀 출력 추가
                     # self.export_json()
                 
                 # 정상 종료 로그
-                self.finish_crawl_log(status='success')
+                await self.finish_crawl_log(status='success')
                 
             except Exception as e:
                 error_occured = e
@@ -69,19 +58,17 @@ class PhonebCrawler(BaseCrawler):
                 self.logger.error(traceback.format_exc())
                 
                 # 실패 로그
-                self.finish_crawl_log(status='failed', error=e)
+                await self.finish_crawl_log(status='failed', error=e)
                 
-            finally:
-                await browser.close()
 
     async def _set_sorting(self, page):
         """데이터 많은 순 정렬 (Selectors.yaml 활용)"""
         try:
             await page.click(self.selectors['list']['sort_btn'])
-            await page.wait_for_timeout(500)
+            await self.wait_ready(page, 500)
             await page.locator('li:has-text("데이터 많은 순")').click()
             await page.wait_for_load_state('domcontentloaded')
-            await page.wait_for_timeout(2000)
+            await self.wait_ready(page, 2000)
         except Exception as e:
             self.logger.warning(f"정렬 설정 실패: {e}")
 
@@ -105,8 +92,8 @@ class PhonebCrawler(BaseCrawler):
     async def _crawl_plan_detail(self, page, url):
         """상세 페이지 파싱"""
         try:
-            await page.goto(url, wait_until='domcontentloaded')
-            await page.wait_for_timeout(2000)
+            await self.goto(page, url)
+            await self.wait_ready(page, 2000)
             
             # Selectors 활용하여 데이터 추출
             # (복잡한 로직은 JS evaluation 사용이 유리하므로 유지)
@@ -1,5 +1,4 @@
 from .base_crawler import BaseCrawler
-from playwright.async_api import async_playwright
 import asyncio
 import re
 
@@ -9,18 +8,16 @@ class SkylifeCrawler(BaseCrawler):
         
     async def crawl(self, headless=False, **kwargs):
         self.logger.info("스카이라이프 크롤링 시작")
-        self.start_crawl_log()
+        await self.start_crawl_log(**kwargs)
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=headless)
-            context = await browser.new_context(viewport={'width': 1920, 'height': 1080})
+        async with self.open_context(headless=headless) as context:
             page = await context.new_page()
             
             try:
                 # 1. 목록 페이지 접속
                 target_url = self.selectors.get('url', f"{self.config['base_url']}/product/mobile/goods")
-                await page.goto(target_url, wait_until='domcontentloaded')
-                await page.wait_for_timeout(3000)
+                await self.goto(page, target_url)
+                await self.wait_ready(page, 3000)
                 
                 # 팝업 닫기 Logic
                 try:
@@ -28,7 +25,7 @@ class SkylifeCrawler(BaseCrawler):
                     for btn in close_btns:
                         if await btn.is_visible():
                             await btn.click()
-                            await page.wait_for_timeout(500)
+                            await self.wait_ready(page, 500)
                 except:
                     pass
 
@@ -42,7 +39,7 @@ class SkylifeCrawler(BaseCrawler):
                         more_btn = page.locator('button:has-text("더보기")').first
                         if await more_btn.is_visible():
                             await more_btn.click()
-                            await page.wait_for_timeout(1000)
+                            await self.wait_ready(page, 1000)
                         else:
                             break
                     except:
@@ -51,7 +48,7 @@ class SkylifeCrawler(BaseCrawler):
                 # 3. 요금제 카드 로딩 대기
                 # 스크롤 조금 해서 로딩 유도
                 await page.mouse.wheel(0, 500)
-                await page.wait_for_timeout(1000)
+                await self.wait_ready(page, 1000)
                 
                 try:
                     await page.wait_for_selector('a[href^="/product/mobile/goods/"]', timeout=60000)
@@ -100,8 +97,8 @@ class SkylifeCrawler(BaseCrawler):
                      
                      try:
                          # Visit Detail
-                         await page.goto(full_url, wait_until='domcontentloaded')
-                         await page.wait_for_timeout(3000)
+                         await self.goto(page, full_url)
+                         await self.wait_ready(page, 3000)
                          
                          # Check for error
                          if "페이지 주소를 다시 한번" in await page.content():
@@ -163,9 +160,7 @@ class SkylifeCrawler(BaseCrawler):
                          self.logger.error(f"상세 수집 실패 ({full_url}): {e}")
                          continue
                 
-                self.finish_crawl_log(status='success')
-                
-                self.finish_crawl_log(status='success')
+                await self.finish_crawl_log(status='success')
                 
             except Exception as e:
                 self.logger.error(f"크롤링 에러: {e}")
@@ -175,6 +170,4 @@ class SkylifeCrawler(BaseCrawler):
                     await page.screenshot(path=f"{self.screenshot_dir}/error_final.png")
                 except:
                     pass
-                self.finish_crawl_log(status='failed', error=e)
-            finally:
-                await browser.close()
+                await self.finish_crawl_log(status='failed', error=e)
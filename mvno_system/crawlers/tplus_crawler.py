@@ -1,5 +1,4 @@
 from .base_crawler import BaseCrawler
-from playwright.async_api import async_playwright
 import asyncio
 
 class TplusCrawler(BaseCrawler):
@@ -8,17 +7,15 @@ class TplusCrawler(BaseCrawler):
         
     async def crawl(self, headless=False, **kwargs):
         self.logger.info("티플러스 크롤링 시작")
-        self.start_crawl_log()
+        await self.start_crawl_log(**kwargs)
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=headless)
-            context = await browser.new_context(viewport={'width': 1920, 'height': 1080})
+        async with self.open_context(headless=headless) as context:
             page = await context.new_page()
             
             try:
                 target_url = self.selectors.get('url', f"{self.config['base_url']}/main/rate/join")
-                await page.goto(target_url, wait_until='domcontentloaded')
-                await page.wait_for_timeout(3000)
+                await self.goto(page, target_url)
+                await self.wait_ready(page, 3000)
                 
                 # Close Popups
                 try:
@@ -27,7 +24,7 @@ class TplusCrawler(BaseCrawler):
                     for btn in close_btns:
                         if await btn.is_visible():
                             await btn.click()
-                            await page.wait_for_timeout(500)
+                            await self.wait_ready(page, 500)
                 except:
                     pass
                 
@@ -43,7 +40,7 @@ class TplusCrawler(BaseCrawler):
                         more_btn = page.locator('#board_paging')
                         if await more_btn.is_visible() and "더보기" in await more_btn.inner_text():
                             await more_btn.click()
-                            await page.wait_for_timeout(1000) # Wait for ajax
+                            await self.wait_ready(page, 1000) # Wait for ajax
                         else:
                             break
                     except:
@@ -122,10 +119,8 @@ class TplusCrawler(BaseCrawler):
                      self.save_plan(plan_data)
                      self.logger.info(f"수집: {plan_data['carrier']} - {plan_data['plan_name']}")
                 
-                self.finish_crawl_log(status='success')
+                await self.finish_crawl_log(status='success')
                 
             except Exception as e:
                 self.logger.error(f"크롤링 에러: {e}")
-                self.finish_crawl_log(status='failed', error=e)
-            finally:
-                await browser.close()
+                await self.finish_crawl_log(status='failed', error=e)
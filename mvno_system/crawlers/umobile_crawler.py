@@ -1,5 +1,4 @@
 from .base_crawler import BaseCrawler
-from playwright.async_api import async_playwright
 import asyncio
 import re
 from datetime import datetime
@@ -10,19 +9,17 @@ class UMobileCrawler(BaseCrawler):
         
     async def crawl(self, headless=False, **kwargs):
         self.logger.info("U+유모바일 크롤링 시작")
-        self.start_crawl_log()
+        await self.start_crawl_log(**kwargs)
         
-        async with async_playwright() as p:
+        async with self.open_context(headless=headless) as context:
             # Grant permission for multiple pages/popups
-            browser = await p.chromium.launch(headless=headless)
-            context = await browser.new_context(viewport={'width': 1920, 'height': 1080})
             page = await context.new_page()
             
             try:
                 # 1. 목록 페이지 접속
                 target_url = self.selectors.get('url', f"{self.config['base_url']}/product/pric/usim/pricList")
-                await page.goto(target_url, wait_until='domcontentloaded')
-                await page.wait_for_timeout(3000)
+                await self.goto(page, target_url)
+                await self.wait_ready(page, 3000)
                 
                 # Close Popups
                 try:
@@ -30,7 +27,7 @@ class UMobileCrawler(BaseCrawler):
                     for btn in close_btns:
                         if await btn.is_visible():
                             await btn.click()
-                            await page.wait_for_timeout(500)
+                            await self.wait_ready(page, 500)
                 except:
                     pass
 
@@ -45,14 +42,14 @@ class UMobileCrawler(BaseCrawler):
                         
                     # 맨 아래로 스크롤
                     await page.keyboard.press('End')
-                    await page.wait_for_timeout(1000)
+                    await self.wait_ready(page, 1000)
                     
                     # 더보기 버튼
                     try:
                         more_btn = page.locator('button.btn-more, .more-btn').first
                         if await more_btn.is_visible():
                              await more_btn.click()
-                             await page.wait_for_timeout(1000)
+                             await self.wait_ready(page, 1000)
                     except:
                         pass
                     
@@ -64,7 +61,7 @@ class UMobileCrawler(BaseCrawler):
                          no_change = 0
                          for _ in range(3):
                              await page.keyboard.press('End')
-                             await page.wait_for_timeout(1000)
+                             await self.wait_ready(page, 1000)
                              cards_check = await page.locator('div.price-card-list > ul > li').all()
                              if len(cards_check) > current_count:
                                  no_change = 0
@@ -118,7 +115,7 @@ class UMobileCrawler(BaseCrawler):
                         
                         new_page = await new_page_info.value
                         await new_page.wait_for_load_state('domcontentloaded')
-                        await new_page.wait_for_timeout(2000)
+                        await self.wait_ready(new_page, 2000)
                         
                         # Scrape Detail
                         detail_data = await new_page.evaluate("""() => {
@@ -170,10 +167,8 @@ class UMobileCrawler(BaseCrawler):
                         self.logger.error(f"상세 수집 실패 (Item {i}): {e}")
                         continue
                         
-                self.finish_crawl_log(status='success')
+                await self.finish_crawl_log(status='success')
                 
             except Exception as e:
                 self.logger.error(f"크롤링 에러: {e}")
-                self.finish_crawl_log(status='failed', error=e)
-            finally:
-                await browser.close()
+                await self.finish_crawl_log(status='failed', error=e)
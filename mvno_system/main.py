@@ -9,6 +9,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from storage.database import init_db
 from scheduler.task_scheduler import TaskScheduler
 from core.platform_loader import PlatformLoader
+from core.browser_pool import BrowserPool
 
 async def main():
     print(f"=== MVNO Monitoring System Started at {datetime.now()} ===")
@@ -24,6 +25,11 @@ async def main():
     loader = PlatformLoader()
     platforms = loader.get_enabled_platforms()
     
+    # --full: 증분 모드를 건너뛰고 모든 상세 페이지 재수집
+    force_full = '--full' in sys.argv
+    # --record-har: 크롤링 응답을 HAR 로 기록 / --replay-har: 기록된 HAR 로만 재생 (네트워크 미사용)
+    har_mode = 'record' if '--record-har' in sys.argv else 'replay' if '--replay-har' in sys.argv else None
+    
     # 모드 선택 (인수 또는 입력)
     if len(sys.argv) > 1 and sys.argv[1] == '--scheduler':
         mode = 'scheduler'
@@ -55,32 +61,40 @@ async def main():
             limit_input = input("수집 제한 개수 (0: 무제한, 엔터: 10): ").strip()
             limit = int(limit_input) if limit_input.isdigit() else 10
     
-    if mode == 'scheduler':
-        # 스케줄러 실행
-        scheduler = TaskScheduler()
-        scheduler.start()
+    try:
+        if mode == 'scheduler':
+            # 스케줄러 실행
+            scheduler = TaskScheduler()
+            scheduler.start()
         
-        print("\n>>> Scheduler is running. Press Ctrl+C to exit.")
+            print("\n>>> Scheduler is running. Press Ctrl+C to exit.")
         
-        try:
-            # 무한 대기 (스케줄러가 백그라운드에서 실행됨)
-            while True:
-                await asyncio.sleep(60)
-        except asyncio.CancelledError:
-            scheduler.stop()
+            try:
+                # 무한 대기 (스케줄러가 백그라운드에서 실행됨)
+                while True:
+                    await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                scheduler.stop()
             
-    elif mode == 'single':
-        if not target_platform:
-            print("잘못된 선택입니다.")
-            return
+        elif mode == 'single':
+            if not target_platform:
+                print("잘못된 선택입니다.")
+                return
 
-        print(f"\n>>> Starting Single Crawl ({target_platform})... Limit: {limit}")
-        crawler = loader.get_crawler(target_platform)
-        if crawler:
-            crawler.set_session(session_id)
-            await crawler.crawl(headless=False, test_mode=True, limit=limit)
-        else:
-            print("크롤러 로드 실패.")
+            print(f"\n>>> Starting Single Crawl ({target_platform})... Limit: {limit}")
+            crawler = loader.get_crawler(target_platform)
+            if crawler:
+                crawler.set_session(session_id)
+                crawler.force_full = force_full
+                if har_mode:
+                    crawler.set_har_mode(har_mode)
+                await crawler.crawl(headless=False, test_mode=True, limit=limit)
+            else:
+                print("크롤러 로드 실패.")
+    
+    finally:
+        # 공유 브라우저 풀 정리 (스케줄러 종료 / 단일 크롤링 완료 시)
+        await BrowserPool().shutdown()
     
     print("\n=== All Tasks Completed ===")
 
@@ -0,0 +1,41 @@
+import argparse
+import os
+import sys
+
+# 프로젝트 루트 경로 추가 (mvno_system 폴더)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from storage.database import SessionLocal, init_db
+from storage.plan_writer import refresh_current_plans
+from storage.queries import latest_success_logs
+
+# current_plans 스냅샷 재구성 (테이블 추가 이전 DB, 또는 수동 정리 후)
+# 크롤링 성공 시에는 finish_crawl_log 가 자동 갱신하므로 평소에는 필요 없다.
+#
+#   python rebuild_current_plans.py            # 전체 플랫폼
+#   python rebuild_current_plans.py moyo liivm
+
+
+def rebuild(platforms=None):
+    """플랫폼별 최근 성공 크롤링 기준으로 갱신 (플랫폼마다 1 트랜잭션)"""
+    db = SessionLocal()
+    try:
+        for platform, crawl_log_id in sorted(latest_success_logs(db, platforms).items()):
+            try:
+                copied, removed = refresh_current_plans(db, platform, crawl_log_id)
+                db.commit()
+                print(f"  {platform}: 로그 {crawl_log_id} 기준, 변경/신규 {copied}건, 삭제 {removed}건")
+            except Exception as e:
+                db.rollback()
+                print(f"  {platform}: 실패 ({e})")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='current_plans 스냅샷 재구성')
+    parser.add_argument('platforms', nargs='*', help='플랫폼 키 (기본: 전체)')
+    args = parser.parse_args()
+
+    init_db()
+    rebuild(args.platforms or None)
@@ -0,0 +1,138 @@
+import argparse
+import asyncio
+import gzip
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가 (mvno_system 폴더)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.browser_pool import BrowserPool
+
+# 스냅샷(screenshots.mode: snapshot) -> 스크린샷 일괄 렌더링
+#
+#   python render_snapshots.py --session 20250101_120000               # 세션 전체
+#   python render_snapshots.py --session 20250101_120000 --platform moyo --plan 5G
+#   python render_snapshots.py storage/sessions/.../x.mhtml.gz --update-db
+#
+# 스냅샷 옆에 같은 이름의 .png 를 만든다. --update-db 이면 해당 요금제의 screenshot_path 도 PNG 로 바꾼다.
+
+SNAPSHOT_SUFFIXES = ('.mhtml.gz', '.html.gz')
+
+
+def image_path(snapshot):
+    name = snapshot.name
+    for suffix in SNAPSHOT_SUFFIXES:
+        if name.endswith(suffix):
+            return snapshot.with_name(name[:-len(suffix)] + '.png')
+    return snapshot.with_suffix('.png')
+
+
+def find_snapshots(args):
+    paths = [Path(p) for p in args.paths]
+    if args.session:
+        root = Path('storage/sessions') / args.session
+        pattern = f"{args.platform or '*'}/screenshots/*"
+        paths += [p for p in root.glob(pattern) if p.name.endswith(SNAPSHOT_SUFFIXES)]
+    if args.plan:
+        paths = [p for p in paths if args.plan.replace(' ', '') in p.name]
+    if not args.force:
+        paths = [p for p in paths if not image_path(p).exists()]
+    return sorted(set(paths))
+
+
+async def render_one(page, snapshot, workdir, full_page):
+    data = gzip.decompress(snapshot.read_bytes())
+    if snapshot.name.endswith('.mhtml.gz'):
+        # MHTML 은 파일 URL 로 열어야 포함된 리소스가 적용된다
+        local = Path(workdir) / (snapshot.name[:-3])
+        local.write_bytes(data)
+        await page.goto(local.resolve().as_uri(), wait_until='load')
+    else:
+        # DOM 스냅샷은 스크립트 없이 (컨텍스트 java_script_enabled=False) 원본 사이트 리소스로 렌더링
+        await page.set_content(data.decode('utf-8'), wait_until='load', timeout=30000)
+    target = image_path(snapshot)
+    await page.screenshot(path=str(target), full_page=full_page, timeout=30000)
+    return target
+
+
+async def render(snapshots, concurrency, full_page=True):
+    """반환: {스냅샷 경로: PNG 경로 또는 None}"""
+    results = {}
+    queue = asyncio.Queue()
+    for snapshot in snapshots:
+        queue.put_nowait(snapshot)
+
+    async with BrowserPool().context(
+        headless=True, viewport={'width': 1920, 'height': 1080}, java_script_enabled=False
+    ) as context:
+        async def worker(workdir):
+            page = await context.new_page()
+            try:
+                while not queue.empty():
+                    snapshot = queue.get_nowait()
+                    try:
+                        results[snapshot] = await render_one(page, snapshot, workdir, full_page)
+                        print(f"  렌더링: {results[snapshot]}")
+                    except Exception as e:
+                        results[snapshot] = None
+                        print(f"  실패: {snapshot} ({e})")
+            finally:
+                await page.close()
+
+        with tempfile.TemporaryDirectory(prefix='mvno_snapshot_') as workdir:
+            await asyncio.gather(*(worker(workdir) for _ in range(max(1, min(concurrency, len(snapshots))))))
+    return results
+
+
+def update_db(rendered):
+    """렌더링한 스냅샷을 가리키던 요금제 관측 행의 screenshot_path 를 PNG 로 교체"""
+    from storage.database import SessionLocal, Plan
+
+    db = SessionLocal()
+    try:
+        updated = 0
+        for snapshot, image in rendered.items():
+            if image is None:
+                continue
+            updated += db.query(Plan).filter(Plan.screenshot_path == str(snapshot)).update(
+                {Plan.screenshot_path: str(image)}, synchronize_session=False
+            )
+        db.commit()
+        return updated
+    finally:
+        db.close()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description='스냅샷 -> 스크린샷 일괄 렌더링')
+    parser.add_argument('paths', nargs='*', help='스냅샷 파일 (.mhtml.gz / .html.gz)')
+    parser.add_argument('--session', help='세션 ID (storage/sessions/<session>)')
+    parser.add_argument('--platform', help='세션 중 특정 플랫폼만')
+    parser.add_argument('--plan', help='파일명에 포함된 요금제명으로 선택')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--viewport-only', action='store_true', help='전체 페이지 대신 첫 화면만')
+    parser.add_argument('--force', action='store_true', help='이미 렌더링한 스냅샷도 다시 렌더링')
+    parser.add_argument('--update-db', action='store_true', help='요금제 screenshot_path 를 PNG 로 갱신')
+    args = parser.parse_args()
+
+    snapshots = find_snapshots(args)
+    if not snapshots:
+        print("렌더링할 스냅샷이 없습니다.")
+        return
+
+    print(f"=== 스냅샷 {len(snapshots)}개 렌더링 ===")
+    try:
+        rendered = await render(snapshots, args.concurrency, full_page=not args.viewport_only)
+    finally:
+        await BrowserPool().shutdown()
+
+    done = sum(1 for image in rendered.values() if image)
+    print(f"완료 {done}/{len(snapshots)}")
+    if args.update_db:
+        print(f"DB screenshot_path 갱신: {update_db(rendered)}건")
+
+if __name__ == "__main__":
+    asyncio.run(main())
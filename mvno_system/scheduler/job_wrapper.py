@@ -23,6 +23,8 @@ async def run_crawler_job(platform_key, **kwargs):
         # Session ID for this job run
         session_id = datetime.now().strftime('%Y%m%d_%H%M%S')
         crawler.set_session(session_id)
+        # full=True 이면 증분 모드 대신 전체 수집
+        crawler.force_full = kwargs.pop('full', False)
         
         # 크롤링 실행
         await crawler.crawl(**kwargs)
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, ForeignKey, JSON
+from sqlalchemy import create_engine, event, inspect, text, Index, Column, Integer, String, DateTime, Text, Float, ForeignKey, JSON
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
@@ -21,22 +21,90 @@ class CrawlLog(Base):
     status = Column(String(20))  # 'running', 'success', 'failed'
     items_count = Column(Integer, default=0)
     error_message = Column(Text, nullable=True)
+    changed_count = Column(Integer, default=0)  # 신규/변경으로 관측 행이 기록된 요금제 수
+    mode = Column(String(20), default='full')   # 'full', 'incremental'
+    scope = Column(String(20), default='full')  # 'full', 'partial' (limit/test_mode/실패한 필터 뷰 - 판매 종료 판단에 쓰지 않음)
     
     plans = relationship("Plan", back_populates="crawl_log")
+    timings = relationship("CrawlTiming", back_populates="crawl_log")
+    
+    # 플랫폼별 최근 성공 로그 조회 (storage/queries.py)
+    __table_args__ = (Index('ix_crawl_logs_platform_status', 'platform', 'status'),)
+
+class CrawlTiming(Base):
+    """크롤링 1회의 단계별 소요 시간 분포 (goto, wait, extract, screenshot, save_plan, export 등)"""
+    __tablename__ = 'crawl_timings'
+    
+    id = Column(Integer, primary_key=True)
+    crawl_log_id = Column(Integer, ForeignKey('crawl_logs.id'), index=True)
+    phase = Column(String(50), nullable=False)
+    count = Column(Integer, default=0)
+    total_ms = Column(Float, default=0)
+    p50_ms = Column(Float)
+    p95_ms = Column(Float)
+    max_ms = Column(Float)
+    
+    crawl_log = relationship("CrawlLog", back_populates="timings")
+
+class PlanIdentity(Base):
+    """
+    요금제 고유 식별 (플랫폼 + 통신사 + 망 + 요금제명/URL)
+    크롤링마다 last_seen 만 갱신하고, 내용이 바뀐 경우에만 plans 에 관측 행을 추가한다.
+    """
+    __tablename__ = 'plan_identities'
+    
+    id = Column(Integer, primary_key=True)
+    plan_key = Column(String(64), unique=True, nullable=False)  # 식별 필드 sha1
+    
+    platform = Column(String(50), index=True)
+    carrier = Column(String(100))
+    network = Column(String(50))
+    plan_name = Column(String(200))
+    url = Column(Text)
+    
+    content_hash = Column(String(64))  # 마지막 관측 행의 내용 해시
+    list_fingerprint = Column(String(64))  # 목록 카드 해시 (증분 크롤링 시 상세 재방문 여부 판단)
+    first_seen = Column(DateTime, default=datetime.now)
+    last_seen = Column(DateTime, default=datetime.now)
+    last_changed = Column(DateTime, default=datetime.now)
+    last_crawl_log_id = Column(Integer, ForeignKey('crawl_logs.id'))  # 마지막으로 본 크롤링 (진행 중/실패 포함)
+    last_success_crawl_log_id = Column(Integer, ForeignKey('crawl_logs.id'))  # 마지막으로 본 성공 크롤링 (finish_crawl_log 에서 갱신)
+    
+    observations = relationship("Plan", back_populates="identity")
+    
+    __table_args__ = (
+        Index('ix_plan_identities_platform_url', 'platform', 'url'),
+        Index('ix_plan_identities_carrier_network', 'carrier', 'network'),
+        Index('ix_plan_identities_last_crawl_log_id', 'last_crawl_log_id'),
+        Index('ix_plan_identities_last_success_crawl_log_id', 'last_success_crawl_log_id'),  # 최근 성공 크롤링에서 본 요금제
+    )
 
 class Plan(Base):
+    """요금제 관측 행 (PlanIdentity 기준 가격/스펙이 바뀐 시점마다 1행)"""
     __tablename__ = 'plans'
     
     id = Column(Integer, primary_key=True)
-    crawl_log_id = Column(Integer, ForeignKey('crawl_logs.id'))
+    crawl_log_id = Column(Integer, ForeignKey('crawl_logs.id'), index=True)
+    identity_id = Column(Integer, ForeignKey('plan_identities.id'), index=True)
+    content_hash = Column(String(64))
     
     platform = Column(String(50))
     carrier = Column(String(100))
     plan_name = Column(String(200))
     price = Column(String(50))      # 원본 가격 문자열
-    price_int = Column(Integer)     # 숫자형 변환 가격 (분석용)
+    price_int = Column(Integer)     # 숫자형 변환 가격 (분석용) - 현재 월 요금 (할인가 우선)
     data_raw = Column(String(100))  # 데이터 문자열 (예: "11GB+일2GB+3Mbps")
     
+    # 스펙 숫자 컬럼 (core/spec_parser.py, 무제한 = UNLIMITED) - 기존 행은 backfill_specs.py 로 채움
+    price_regular_int = Column(Integer)   # 정상가
+    price_promo_int = Column(Integer)     # 할인(프로모션) 가
+    promo_months = Column(Integer)        # 할인 기간 (개월)
+    data_gb = Column(Float)               # 월 기본 제공량 (일 제공만 있으면 30일 환산)
+    data_daily_gb = Column(Float)         # 일 제공량
+    throttle_mbps = Column(Float)         # 소진 후 속도
+    voice_min = Column(Integer)
+    sms_count = Column(Integer)
+    
     # 추가 상세 정보 (JSON으로 유연하게 저장)
     details = Column(JSON, nullable=True)
     
@@ -45,13 +113,109 @@ class Plan(Base):
     collected_at = Column(DateTime, default=datetime.now)
     
     crawl_log = relationship("CrawlLog", back_populates="plans")
+    identity = relationship("PlanIdentity", back_populates="observations")
+    
+    __table_args__ = (
+        Index('ix_plans_platform_collected_at', 'platform', 'collected_at'),  # 기간별 변경 조회
+        Index('ix_plans_data_gb_price', 'data_gb', 'price_int'),   # "N GB 이상 최저가"
+        Index('ix_plans_price_int', 'price_int'),
+    )
+
+class CurrentPlan(Base):
+    """
+    현재 판매 중인 요금제 스냅샷 (요금제당 1행 = 최근 관측 행 사본)
+    크롤링 성공 시 finish_crawl_log 가 플랫폼 단위로 한 트랜잭션에서 갱신 (storage/plan_writer.py refresh_current_plans)
+    """
+    __tablename__ = 'current_plans'
+
+    identity_id = Column(Integer, ForeignKey('plan_identities.id'), primary_key=True)
+    plan_id = Column(Integer, ForeignKey('plans.id'))   # 복사한 관측 행
+    crawl_log_id = Column(Integer, ForeignKey('crawl_logs.id'))  # 마지막으로 확인한 크롤링
+
+    platform = Column(String(50), nullable=False)
+    carrier = Column(String(100))
+    network = Column(String(50))
+    plan_name = Column(String(200))
+    price = Column(String(50))
+    price_int = Column(Integer)
+    data_raw = Column(String(100))
+    price_regular_int = Column(Integer)
+    price_promo_int = Column(Integer)
+    promo_months = Column(Integer)
+    data_gb = Column(Float)
+    data_daily_gb = Column(Float)
+    throttle_mbps = Column(Float)
+    voice_min = Column(Integer)
+    sms_count = Column(Integer)
+    details = Column(JSON, nullable=True)
+    url = Column(Text)
+    screenshot_path = Column(Text)
+    collected_at = Column(DateTime)     # 관측 행 기록 시각 (마지막 변경)
+    last_seen = Column(DateTime)
+
+    __table_args__ = (
+        Index('ix_current_plans_platform', 'platform'),
+        Index('ix_current_plans_carrier_network', 'carrier', 'network'),
+        Index('ix_current_plans_data_gb_price', 'data_gb', 'price_int'),
+        Index('ix_current_plans_price_int', 'price_int'),
+    )
+
+# SQLite 연결 설정
+# WAL: 읽기(엑셀 추출/verify_db)가 쓰기를 막지 않음, synchronous=NORMAL: WAL 에서는 커밋마다 fsync 하지 않음
+SQLITE_PRAGMAS = [
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "busy_timeout=30000",     # 다른 프로세스가 쓰는 중이면 즉시 실패하지 않고 대기 (ms)
+    "cache_size=-65536",      # 64MB 페이지 캐시
+    "mmap_size=268435456",    # 256MB
+    "temp_store=MEMORY",
+]
 
 # 엔진 및 세션 생성
-engine = create_engine(DATABASE_URL, echo=False)
+# 쓰기는 storage/db_writer.py 의 단일 스레드가 담당하므로 스레드 간 커넥션 공유 허용
+engine = create_engine(
+    DATABASE_URL,
+    echo=False,
+    connect_args={'timeout': 30, 'check_same_thread': False}
+)
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
 
 def init_db():
-    """데이터베이스 테이블 생성"""
+    """데이터베이스 테이블 생성 + 기존 테이블에 없는 컬럼/인덱스 보강"""
     Base.metadata.create_all(engine)
+    _add_missing_columns()
+
+# 컬럼을 새로 추가했을 때 기존 행 채우기
+COLUMN_BACKFILL = {
+    ('plan_identities', 'last_success_crawl_log_id'): (
+        "UPDATE plan_identities SET last_success_crawl_log_id = last_crawl_log_id "
+        "WHERE last_crawl_log_id IN (SELECT id FROM crawl_logs WHERE status = 'success')"
+    ),
+}
+
+def _add_missing_columns():
+    """
+    경량 마이그레이션: create_all 은 이미 있는 테이블을 변경하지 않으므로
+    모델에 추가된 컬럼은 ALTER TABLE ADD COLUMN 으로 (COLUMN_BACKFILL 로 기존 행 채움), 인덱스는 checkfirst 로 생성
+    """
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    column_type = column.type.compile(dialect=engine.dialect)
+                    conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+                    if (table.name, column.name) in COLUMN_BACKFILL:
+                        conn.execute(text(COLUMN_BACKFILL[(table.name, column.name)]))
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -0,0 +1,87 @@
+import asyncio
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+
+from storage.database import SessionLocal, init_db
+
+logger = logging.getLogger('db_writer')
+
+class DbWriter:
+    """
+    프로세스 전역 단일 DB writer 스레드
+    모든 크롤러의 쓰기 작업을 한 줄로 세워 처리하므로, 동시 크롤링 중에도
+    "database is locked" 경합이 없고 커밋(fsync)이 이벤트 루프를 막지 않는다.
+
+    Usage:
+        DbWriter().submit(lambda session: session.add(obj))      # 기다리지 않음 (Future 반환)
+        log_id = DbWriter().call(create_log)                      # 동기 대기
+        await DbWriter().run(fn)                                  # 비동기 대기
+    작업 함수는 writer 스레드의 세션을 인자로 받으며, 반환 후 writer 가 커밋한다.
+    큐 순서대로 실행되므로 call() 이 끝나면 그 전에 submit 된 작업도 모두 끝난 상태다.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super(DbWriter, cls).__new__(cls)
+                cls._instance._queue = queue.Queue()
+                cls._instance._thread = None
+        return cls._instance
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='db-writer', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        # main.py 를 거치지 않는 실행(테스트 스크립트 등)에서도 스키마가 최신이도록
+        try:
+            init_db()
+        except Exception as e:
+            logger.error(f"DB 스키마 확인 실패: {e}")
+
+        session = SessionLocal()
+        try:
+            while True:
+                task = self._queue.get()
+                if task is None:
+                    break
+                fn, future = task
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    result = fn(session)
+                    session.commit()
+                    future.set_result(result)
+                except Exception as e:
+                    session.rollback()
+                    future.set_exception(e)
+        finally:
+            session.close()
+
+    def submit(self, fn):
+        future = Future()
+        with self._instance_lock:
+            self._ensure_thread()
+            self._queue.put((fn, future))
+        return future
+
+    def call(self, fn, timeout=None):
+        return self.submit(fn).result(timeout)
+
+    async def run(self, fn):
+        return await asyncio.wrap_future(self.submit(fn))
+
+    def close(self, timeout=30):
+        """남은 작업을 모두 처리한 뒤 스레드 종료"""
+        with self._instance_lock:
+            thread = self._thread
+            if thread is None or not thread.is_alive():
+                return
+            self._queue.put(None)
+        thread.join(timeout)
+        self._thread = None
@@ -0,0 +1,249 @@
+import hashlib
+import json
+import logging
+import time
+from datetime import datetime
+from sqlalchemy import insert, update, delete, select, func
+
+from core.spec_parser import spec_records
+from storage.database import Plan, PlanIdentity, CurrentPlan
+from storage.db_writer import DbWriter
+
+logger = logging.getLogger('plan_writer')
+
+# 크롤링마다 달라지므로 변경 판단에서 제외하는 값
+VOLATILE_KEYS = {'collected_at', 'screenshot_path', 'url', 'list_fingerprint', '_index', 'target'}
+# SQLite IN 절 변수 수 제한 대비
+QUERY_CHUNK = 500
+# 관측 행에서 current_plans 로 그대로 복사하는 컬럼
+CURRENT_PLAN_COLUMNS = [
+    'platform', 'carrier', 'plan_name', 'price', 'price_int', 'data_raw',
+    'price_regular_int', 'price_promo_int', 'promo_months', 'data_gb', 'data_daily_gb', 'throttle_mbps',
+    'voice_min', 'sms_count', 'details', 'url', 'screenshot_path', 'collected_at'
+]
+
+
+def _normalize(value):
+    return ' '.join(str(value or '').split()).lower()
+
+
+def plan_key(row):
+    """요금제 고유 키: 플랫폼 + 통신사 + 망 + 요금제명 (요금제명이 없으면 URL)"""
+    parts = [
+        row.get('platform'),
+        row.get('carrier'),
+        row.get('network'),
+        row.get('plan_name') or row.get('url')
+    ]
+    return hashlib.sha1('|'.join(_normalize(p) for p in parts).encode('utf-8')).hexdigest()
+
+
+def content_hash(row):
+    """가격/데이터/상세 스펙 해시 - 값이 같으면 관측 행을 새로 쓰지 않는다"""
+    details = {k: v for k, v in (row.get('details') or {}).items() if k not in VOLATILE_KEYS}
+    payload = json.dumps(
+        [row.get('price'), row.get('data_raw'), details],
+        sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def write_observations(session, rows):
+    """
+    DbWriter 스레드에서 실행: 신규/변경된 요금제만 plans 에 기록하고
+    이번 배치에서 본 식별자 전체의 last_seen 을 한 번에 갱신. 기록한 관측 행 수 반환
+    """
+    now = datetime.now()
+    keys = list({row['plan_key'] for row in rows})
+    identities = {}
+    for i in range(0, len(keys), QUERY_CHUNK):
+        chunk = keys[i:i + QUERY_CHUNK]
+        for identity in session.query(PlanIdentity).filter(PlanIdentity.plan_key.in_(chunk)):
+            identities[identity.plan_key] = identity
+
+    changed = []
+    for row in rows:
+        identity = identities.get(row['plan_key'])
+        if identity is None:
+            identity = PlanIdentity(
+                plan_key=row['plan_key'],
+                platform=row.get('platform'),
+                carrier=row.get('carrier'),
+                network=row.get('network'),
+                plan_name=row.get('plan_name'),
+                first_seen=now,
+                last_changed=now
+            )
+            session.add(identity)
+            identities[row['plan_key']] = identity
+
+        # 증분 크롤링 조회 기준 (URL + 목록 카드 해시) 은 변경 여부와 무관하게 최신값 유지
+        if row.get('url') and identity.url != row.get('url'):
+            identity.url = row.get('url')
+        if row.get('list_fingerprint') and identity.list_fingerprint != row.get('list_fingerprint'):
+            identity.list_fingerprint = row.get('list_fingerprint')
+
+        if identity.content_hash == row['content_hash']:
+            continue
+        if identity.content_hash is not None:
+            identity.last_changed = now
+        identity.content_hash = row['content_hash']
+        changed.append((identity, row))
+
+    session.flush()  # 신규 식별자 id 확보
+
+    if changed:
+        session.execute(insert(Plan), [
+            {
+                **{k: v for k, v in row.items() if k not in ('plan_key', 'network', 'list_fingerprint')},
+                'identity_id': identity.id
+            }
+            for identity, row in changed
+        ])
+
+    ids = [identity.id for identity in identities.values()]
+    for i in range(0, len(ids), QUERY_CHUNK):
+        session.execute(
+            update(PlanIdentity)
+            .where(PlanIdentity.id.in_(ids[i:i + QUERY_CHUNK]))
+            .values(last_seen=now, last_crawl_log_id=rows[0].get('crawl_log_id')),
+            execution_options={'synchronize_session': False}
+        )
+    return len(changed)
+
+
+def refresh_current_plans(session, platform, crawl_log_id, full=True):
+    """
+    DbWriter 스레드에서 실행 (크롤링 성공 후): current_plans 의 platform 분을 이번 크롤링 기준으로 교체
+    대상은 last_success_crawl_log_id 가 crawl_log_id 인 요금제 (finish_crawl_log 가 성공 시 갱신)
+    전체를 다시 쓰지 않고 이번에 보지 못한 요금제 삭제 + 관측 행이 바뀐 요금제만 다시 복사하며,
+    writer 커밋 1회로 끝나므로 읽는 쪽은 이전 또는 새 스냅샷 중 하나만 본다. 반환: (복사, 삭제) 행 수
+
+    full=False (limit/test_mode 등 부분 실행): last_crawl_log_id 기준으로 이번에 본 요금제만 upsert 하고
+    보지 못한 요금제는 판매 종료로 보지 않는다 (삭제 0).
+    """
+    now = datetime.now()
+    seen_column = PlanIdentity.last_success_crawl_log_id if full else PlanIdentity.last_crawl_log_id
+    seen_ids = select(PlanIdentity.id).where(seen_column == crawl_log_id)
+    latest_id = select(func.max(Plan.id)).where(Plan.identity_id == CurrentPlan.identity_id).scalar_subquery()
+    seen_current = (CurrentPlan.platform == platform, CurrentPlan.identity_id.in_(seen_ids))
+
+    removed = 0
+    if full:
+        removed = session.execute(
+            delete(CurrentPlan).where(CurrentPlan.platform == platform, CurrentPlan.identity_id.not_in(seen_ids)),
+            execution_options={'synchronize_session': False}
+        ).rowcount
+    # 새 관측 행이 생긴 요금제는 지우고 아래에서 다시 복사
+    session.execute(
+        delete(CurrentPlan).where(*seen_current, CurrentPlan.plan_id != latest_id),
+        execution_options={'synchronize_session': False}
+    )
+    session.execute(
+        update(CurrentPlan).where(*seen_current).values(crawl_log_id=crawl_log_id, last_seen=now),
+        execution_options={'synchronize_session': False}
+    )
+
+    latest_plan_id = (
+        select(func.max(Plan.id)).where(Plan.identity_id == PlanIdentity.id).correlate(PlanIdentity).scalar_subquery()
+    )
+    source = (
+        select(
+            PlanIdentity.id, Plan.id, seen_column, PlanIdentity.network, PlanIdentity.last_seen,
+            *[getattr(Plan, name) for name in CURRENT_PLAN_COLUMNS]
+        )
+        .join(Plan, Plan.id == latest_plan_id)
+        .where(
+            seen_column == crawl_log_id,
+            PlanIdentity.id.not_in(select(CurrentPlan.identity_id).where(CurrentPlan.platform == platform))
+        )
+    )
+    copied = session.execute(
+        insert(CurrentPlan).from_select(
+            ['identity_id', 'plan_id', 'crawl_log_id', 'network', 'last_seen'] + CURRENT_PLAN_COLUMNS,
+            source
+        )
+    ).rowcount
+    return copied, removed
+
+
+class PlanWriter:
+    """
+    Plan 행 버퍼 (BaseCrawler.save_plan -> add, finish_crawl_log -> flush)
+    실제 쓰기는 DbWriter 스레드에 넘기므로 batch 모드에서는 add() 가 블로킹되지 않는다.
+    내용이 이전 관측과 같은 요금제는 plans 에 다시 쓰지 않고 last_seen 만 갱신한다.
+
+    write_mode:
+      - batch: batch_size 개가 모이거나 flush_interval_sec 가 지나면 bulk insert 후 1회 커밋
+      - row:   기존 방식, 행마다 커밋 완료까지 대기 (크래시 시 유실 0 이 필요할 때)
+    """
+
+    def __init__(self, write_mode='batch', batch_size=50, flush_interval_sec=5.0):
+        self.write_mode = write_mode
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = float(flush_interval_sec)
+        self.buffer = []
+        self.written = 0   # writer 에 기록된 행 수 (변경 없음 포함)
+        self.changed = 0   # 신규/변경으로 관측 행을 쓴 수
+        self.write_ms = [] # 배치별 writer 스레드 기록 시간 (단계별 소요 시간 집계용)
+        self._last_flush = time.monotonic()
+
+    @classmethod
+    def from_settings(cls, settings):
+        """platforms.yaml settings.database 섹션으로 생성"""
+        return cls(
+            write_mode=settings.get('write_mode', 'batch'),
+            batch_size=settings.get('batch_size', 50),
+            flush_interval_sec=settings.get('flush_interval_sec', 5.0)
+        )
+
+    def add(self, row):
+        """row: Plan 컬럼명 -> 값 dict (+ network, 식별용)"""
+        row['plan_key'] = plan_key(row)
+        row['content_hash'] = content_hash(row)
+        self.buffer.append(row)
+        if self.write_mode == 'row':
+            self.flush(wait=True)
+        elif (
+            len(self.buffer) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self, wait=False):
+        """
+        버퍼를 bulk insert 작업으로 writer 에 전달
+        wait=True 이면 기록 완료까지 대기하고 성공 여부 반환 (실패한 배치는 버린다)
+        """
+        self._last_flush = time.monotonic()
+        if not self.buffer:
+            return True
+
+        rows, self.buffer = self.buffer, []
+
+        def write(session):
+            started = time.perf_counter()
+            try:
+                # 스펙 문자열 -> 숫자 컬럼 (배치 단위 일괄 파싱, writer 스레드에서)
+                for row, specs in zip(rows, spec_records(rows)):
+                    row.update(specs)
+                return write_observations(session, rows)
+            finally:
+                self.write_ms.append((time.perf_counter() - started) * 1000)
+
+        future = DbWriter().submit(write)
+        future.add_done_callback(lambda f: self._on_written(f, len(rows)))
+        if not wait:
+            return True
+        try:
+            future.result()
+            return True
+        except Exception:
+            return False
+
+    def _on_written(self, future, count):
+        if future.exception() is not None:
+            logger.error(f"요금제 {count}건 일괄 저장 실패: {future.exception()}")
+        else:
+            self.written += count
+            self.changed += future.result()
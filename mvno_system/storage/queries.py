@@ -0,0 +1,179 @@
+from sqlalchemy import select, func, tuple_
+from sqlalchemy.orm import aliased
+
+from core.spec_parser import UNLIMITED
+from storage.database import CrawlLog, CurrentPlan, Plan, PlanIdentity
+
+# 비교 조회 API - 전체 행을 메모리에 올리지 않도록 keyset 페이지 단위로 스트리밍한다.
+#
+#   for plan in current_plans(session, 'moyo'): ...     # current_plans 스냅샷 테이블
+#   cheapest_with_data(session, 15, limit=10)
+#   cheapest_by_data_tier(session)
+#   for change in changes_since(session, datetime(2025, 1, 1)): ...
+#
+# 반환 행은 dict (ORM 객체 생성 없음). 인덱스는 storage/database.py 참고.
+# "현재" 조회는 current_plans 테이블만 읽고, latest_plans 는 이력(plans)에서 같은 결과를 계산한다 (스냅샷 재구성용).
+
+DEFAULT_PAGE_SIZE = 1000
+# 데이터 구간 하한 (GB) - 마지막 구간은 무제한
+DATA_TIERS = [0, 1, 3, 7, 15, 30, 100, UNLIMITED]
+
+CURRENT_FIELDS = [column for column in CurrentPlan.__table__.columns if column.name != 'details']
+
+PLAN_FIELDS = [
+    Plan.id, Plan.identity_id, Plan.crawl_log_id, Plan.platform, Plan.carrier, PlanIdentity.network,
+    Plan.plan_name, Plan.price, Plan.price_int, Plan.price_regular_int, Plan.price_promo_int, Plan.promo_months,
+    Plan.data_raw, Plan.data_gb, Plan.data_daily_gb, Plan.throttle_mbps, Plan.voice_min, Plan.sms_count,
+    Plan.url, Plan.screenshot_path, Plan.collected_at
+]
+
+
+def _plan_select(*extra):
+    return select(*PLAN_FIELDS, *extra).join(PlanIdentity, PlanIdentity.id == Plan.identity_id)
+
+
+def latest_success_logs(session, platforms=None):
+    """플랫폼 -> 최근 성공한 전체 범위 CrawlLog id (limit/test_mode 등 부분 실행 제외)"""
+    query = (
+        select(CrawlLog.platform, func.max(CrawlLog.id))
+        .where(CrawlLog.status == 'success', (CrawlLog.scope == 'full') | CrawlLog.scope.is_(None))
+        .group_by(CrawlLog.platform)
+    )
+    if platforms:
+        query = query.where(CrawlLog.platform.in_(platforms))
+    return dict(session.execute(query).all())
+
+
+def latest_plans(session, platform=None, after_id=0, page_size=DEFAULT_PAGE_SIZE):
+    """
+    플랫폼별 최근 성공한 전체 범위 크롤링에서 확인된 요금제의 최신 관측 행 (identity_id 순 스트리밍)
+    진행 중/실패한 크롤링이 바꾸는 last_crawl_log_id 대신 성공 시에만 갱신되는 last_success_crawl_log_id 기준
+    after_id: 이전 조회의 마지막 identity_id (이어서 조회)
+    """
+    log_ids = list(latest_success_logs(session, [platform] if platform else None).values())
+    if not log_ids:
+        return
+
+    while True:
+        ids = session.execute(
+            select(PlanIdentity.id)
+            .where(PlanIdentity.last_success_crawl_log_id.in_(log_ids), PlanIdentity.id > after_id)
+            .order_by(PlanIdentity.id)
+            .limit(page_size)
+        ).scalars().all()
+        if not ids:
+            return
+
+        latest_ids = select(func.max(Plan.id)).where(Plan.identity_id.in_(ids)).group_by(Plan.identity_id)
+        rows = session.execute(
+            _plan_select().where(Plan.id.in_(latest_ids)).order_by(Plan.identity_id)
+        ).mappings().all()
+        for row in rows:
+            yield dict(row)
+        after_id = ids[-1]
+
+
+def current_plans(session, platform=None, after_id=0, page_size=DEFAULT_PAGE_SIZE):
+    """current_plans 스냅샷 스트리밍 (identity_id 순). after_id: 이전 조회의 마지막 identity_id"""
+    while True:
+        query = (
+            select(*CURRENT_FIELDS)
+            .where(CurrentPlan.identity_id > after_id)
+            .order_by(CurrentPlan.identity_id)
+            .limit(page_size)
+        )
+        if platform:
+            query = query.where(CurrentPlan.platform == platform)
+        rows = session.execute(query).mappings().all()
+        if not rows:
+            return
+        for row in rows:
+            yield dict(row)
+        after_id = rows[-1]['identity_id']
+
+
+def _current_with_data(min_gb, max_gb=None, platform=None):
+    query = select(*CURRENT_FIELDS).where(CurrentPlan.data_gb >= min_gb, CurrentPlan.price_int > 0)
+    if max_gb is not None:
+        query = query.where(CurrentPlan.data_gb < max_gb)
+    if platform:
+        query = query.where(CurrentPlan.platform == platform)
+    return query
+
+
+def cheapest_with_data(session, min_gb, limit=20, platform=None, offset=0):
+    """현재 판매 중이며 월 데이터 min_gb 이상인 요금제를 가격순으로"""
+    query = (
+        _current_with_data(min_gb, platform=platform)
+        .order_by(CurrentPlan.price_int, CurrentPlan.data_gb.desc(), CurrentPlan.identity_id)
+        .limit(limit)
+        .offset(offset)
+    )
+    return [dict(row) for row in session.execute(query).mappings()]
+
+
+def cheapest_by_data_tier(session, per_tier=5, platform=None, tiers=DATA_TIERS):
+    """데이터 구간별 최저가 요금제: {'15GB~30GB': [plan, ...], ...}"""
+    result = {}
+    for i, low in enumerate(tiers):
+        high = tiers[i + 1] if i + 1 < len(tiers) else None
+        label = '무제한' if low >= UNLIMITED else f"{low}GB~" + (f"{high}GB" if high and high < UNLIMITED else '')
+        query = (
+            _current_with_data(low, high, platform)
+            .order_by(CurrentPlan.price_int, CurrentPlan.identity_id)
+            .limit(per_tier)
+        )
+        result[label] = [dict(row) for row in session.execute(query).mappings()]
+    return result
+
+
+def changes_since(session, since, platform=None, after=None, page_size=DEFAULT_PAGE_SIZE):
+    """
+    since 이후 기록된 관측 행 (신규/변경) 을 플랫폼, 수집 시각 순으로 스트리밍
+    각 행에 change ('new' | 'changed') 와 직전 관측의 price / price_int / data_raw 를 붙인다.
+    after: 이전 조회의 마지막 (collected_at, id) - platform 지정 시에만 사용
+    """
+    if platform is None:
+        platforms = session.execute(select(CrawlLog.platform).distinct().order_by(CrawlLog.platform)).scalars().all()
+        for name in platforms:
+            yield from changes_since(session, since, name, page_size=page_size)
+        return
+
+    previous = aliased(Plan)
+    previous_id = (
+        select(func.max(previous.id))
+        .where(previous.identity_id == Plan.identity_id, previous.id < Plan.id)
+        .correlate(Plan)
+        .scalar_subquery()
+        .label('previous_id')
+    )
+    cursor = after or (since, 0)
+    while True:
+        rows = session.execute(
+            _plan_select(previous_id)
+            .where(
+                Plan.platform == platform,
+                Plan.collected_at >= since,
+                tuple_(Plan.collected_at, Plan.id) > tuple_(*cursor)
+            )
+            .order_by(Plan.collected_at, Plan.id)
+            .limit(page_size)
+        ).mappings().all()
+        if not rows:
+            return
+
+        previous_rows = {
+            row.id: row for row in session.execute(
+                select(Plan.id, Plan.price, Plan.price_int, Plan.data_raw)
+                .where(Plan.id.in_([r['previous_id'] for r in rows if r['previous_id']]))
+            )
+        }
+        for row in rows:
+            item = dict(row)
+            before = previous_rows.get(item.pop('previous_id'))
+            item['change'] = 'changed' if before else 'new'
+            item['previous_price'] = before.price if before else None
+            item['previous_price_int'] = before.price_int if before else None
+            item['previous_data_raw'] = before.data_raw if before else None
+            yield item
+        cursor = (rows[-1]['collected_at'], rows[-1]['id'])
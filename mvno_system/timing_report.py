@@ -0,0 +1,121 @@
+import argparse
+import os
+import sys
+
+# 현재 디렉토리를 경로에 추가
+sys.path.append(os.getcwd())
+
+from storage.database import SessionLocal, CrawlLog, CrawlTiming, init_db
+
+# 단계별 소요 시간 리포트 (crawl_timings 기반)
+#
+#   python timing_report.py                     # 플랫폼별 최근 실행 vs 직전 실행
+#   python timing_report.py moyo liivm --runs 5 # 지정 플랫폼의 최근 5회 추이
+#   python timing_report.py --log 12 --log 15   # 두 실행(로그 ID) 직접 비교
+
+
+def load_runs(db, platforms=None, runs=2):
+    """플랫폼별 최근 runs 개 실행 [(CrawlLog, {phase: CrawlTiming})] (최신순)"""
+    query = db.query(CrawlLog).filter(CrawlLog.end_time.isnot(None)).order_by(CrawlLog.id.desc())
+    if platforms:
+        query = query.filter(CrawlLog.platform.in_(platforms))
+
+    result = {}
+    for log in query:
+        bucket = result.setdefault(log.platform, [])
+        if len(bucket) < runs:
+            bucket.append(log)
+
+    return {
+        platform: [(log, timings_of(db, log.id)) for log in logs]
+        for platform, logs in sorted(result.items())
+    }
+
+
+def timings_of(db, crawl_log_id):
+    return {t.phase: t for t in db.query(CrawlTiming).filter(CrawlTiming.crawl_log_id == crawl_log_id)}
+
+
+def describe(log):
+    duration = (log.end_time - log.start_time).total_seconds() if log.end_time and log.start_time else 0
+    return f"#{log.id} {log.start_time:%Y-%m-%d %H:%M} {log.status} {log.items_count}건 {duration:.0f}s"
+
+
+def change(old, new):
+    if not old:
+        return ''
+    return f" ({(new - old) / old * 100:+.0f}%)"
+
+
+def print_compare(base, current):
+    """두 실행의 단계별 total / p95 비교"""
+    base_log, base_timings = base
+    log, timings = current
+    print(f"  {describe(base_log)}  ->  {describe(log)}")
+    print(f"  {'phase':<14}{'count':>12}{'total(s)':>24}{'p95(ms)':>24}")
+    for phase in sorted(set(base_timings) | set(timings), key=lambda p: -(timings[p].total_ms if p in timings else 0)):
+        old, new = base_timings.get(phase), timings.get(phase)
+        if old is None or new is None:
+            row = new or old
+            mark = '(신규)' if old is None else '(없음)'
+            print(f"  {phase:<14}{row.count:>12}{row.total_ms / 1000:>24.1f}{row.p95_ms:>24.0f}  {mark}")
+            continue
+        count = f"{old.count}->{new.count}"
+        total = f"{old.total_ms / 1000:.1f}->{new.total_ms / 1000:.1f}{change(old.total_ms, new.total_ms)}"
+        p95 = f"{old.p95_ms:.0f}->{new.p95_ms:.0f}{change(old.p95_ms, new.p95_ms)}"
+        print(f"  {phase:<14}{count:>12}{total:>24}{p95:>24}")
+
+
+def print_trend(runs):
+    """한 플랫폼의 실행별 단계 total 추이 (오래된 순)"""
+    runs = list(reversed(runs))
+    phases = sorted({phase for _, timings in runs for phase in timings})
+    print(f"  {'run':<10}" + ''.join(f"{phase:>12}" for phase in phases))
+    for log, timings in runs:
+        cells = ''.join(
+            f"{timings[phase].total_ms / 1000:>11.1f}s" if phase in timings else f"{'-':>12}"
+            for phase in phases
+        )
+        print(f"  #{log.id:<9}{cells}")
+
+
+def report():
+    parser = argparse.ArgumentParser(description='크롤링 단계별 소요 시간 리포트')
+    parser.add_argument('platforms', nargs='*', help='플랫폼 키 (기본: 전체)')
+    parser.add_argument('--runs', type=int, default=2, help='플랫폼별 최근 실행 수 (2 = 직전 실행과 비교)')
+    parser.add_argument('--log', type=int, action='append', help='비교할 크롤링 로그 ID (2개)')
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    try:
+        if args.log:
+            if len(args.log) != 2:
+                print("--log 는 2개를 지정해야 합니다.")
+                return
+            runs = [(db.get(CrawlLog, log_id), timings_of(db, log_id)) for log_id in args.log]
+            if any(log is None for log, _ in runs):
+                print("존재하지 않는 로그 ID 입니다.")
+                return
+            print("=== 실행 비교 ===")
+            print_compare(runs[0], runs[1])
+            return
+
+        print("=== 단계별 소요 시간 ===")
+        for platform, runs in load_runs(db, args.platforms, max(1, args.runs)).items():
+            runs = [run for run in runs if run[1]]
+            if not runs:
+                continue
+            print(f"\n[{platform}]")
+            if len(runs) == 1:
+                print(f"  {describe(runs[0][0])}")
+                print_trend(runs)
+            elif len(runs) == 2:
+                print_compare(runs[1], runs[0])
+            else:
+                print_trend(runs)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    report()
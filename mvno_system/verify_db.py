@@ -1,25 +1,31 @@
-from storage.database import SessionLocal, CrawlLog, Plan
+from storage.database import SessionLocal, CrawlLog, CurrentPlan, Plan, PlanIdentity
+from storage.queries import latest_success_logs
 import sys
 import os
 
 # 현재 디렉토리를 경로에 추가
 sys.path.append(os.getcwd())
 
-def verify():
+def verify(recent_logs=20, sample_plans=5):
     db = SessionLocal()
     try:
         print("=== Database Verification ===")
         
-        # 로그 확인
-        logs = db.query(CrawlLog).all()
-        print(f"Total Crawl Logs: {len(logs)}")
+        # 로그 확인 (최근 recent_logs 건만 조회)
+        print(f"Total Crawl Logs: {db.query(CrawlLog).count()}")
+        logs = db.query(CrawlLog).order_by(CrawlLog.id.desc()).limit(recent_logs)
         for log in logs:
             print(f" - ID: {log.id}, Platform: {log.platform}, Status: {log.status}, Items: {log.items_count}, Start: {log.start_time}, End: {log.end_time}")
+        print(f"Latest successful logs: {latest_success_logs(db)}")
             
-        # 요금제 확인
-        plans = db.query(Plan).all()
-        print(f"\nTotal Plans: {len(plans)}")
-        for plan in plans[:5]: # 5개만 출력
+        # 요금제 식별자 (크롤링마다 last_seen 만 갱신)
+        print(f"\nTotal Plan Identities: {db.query(PlanIdentity).count()}")
+        print(f"Current Plans (snapshot): {db.query(CurrentPlan).count()}")
+            
+        # 요금제 확인 (신규/변경 시점의 관측 행)
+        print(f"Total Plans (observations): {db.query(Plan).count()}")
+        plans = db.query(Plan.id, Plan.crawl_log_id, Plan.carrier, Plan.plan_name, Plan.price).order_by(Plan.id).limit(sample_plans)
+        for plan in plans:
             print(f" - ID: {plan.id}, LogID: {plan.crawl_log_id}, Carrier: {plan.carrier}, Plan: {plan.plan_name}, Price: {plan.price}")
             
     finally:
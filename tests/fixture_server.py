@@ -0,0 +1,369 @@
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import urllib.error
+import urllib.request
+import zipfile
+from base64 import b64decode
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import quote, unquote, urlsplit
+
+# Project root setup
+try:
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'mvno_system')))
+except:
+    pass
+
+from core.html_doc import parse_html, select
+
+logger = logging.getLogger('fixture_server')
+
+# 벤치마크용 로컬 fixture 서버
+# tests/fixtures/<platform>/manifest.json + bodies/ 에 저장된 응답(HAR 에서 가져옴)을
+# http://127.0.0.1:<port>/<platform>/<scheme>/<host><path>?<query> 로 제공한다.
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+# 합성 카탈로그 복제본 표식 (URL/요금제명 끝에 붙이고, 조회 시 제거)
+SYNTH_MARK_RE = re.compile(r'(~|%7[Ee])s\d+')
+# 요금제마다 값이 있어야 하는 필드 (벤치마크 결과 확인)
+REQUIRED_FIELDS = ('plan_name', 'price')
+
+
+def result_key(item):
+    """추출 결과 비교 키 (run_har_test.py --record 의 <platform>.expected.json 형식)"""
+    return (item.get('carrier'), item.get('plan_name'), str(item.get('price')))
+
+
+# --- fixture 저장소 ---
+
+class FixtureStore:
+    """플랫폼별 저장 응답 조회 (정확한 URL -> 합성 표식 제거 -> 쿼리 제외 순)"""
+
+    def __init__(self, root=FIXTURES_DIR):
+        self.root = Path(root)
+        self._index = {}   # platform -> (by_url, by_path)
+
+    def platforms(self):
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if (p / 'manifest.json').exists())
+
+    def _load(self, platform):
+        if platform not in self._index:
+            manifest = json.loads((self.root / platform / 'manifest.json').read_text(encoding='utf-8'))
+            by_url, by_path = {}, {}
+            for entry in manifest['entries']:
+                by_url.setdefault(entry['url'], entry)
+                by_path.setdefault(entry['url'].split('?', 1)[0], entry)
+            self._index[platform] = (by_url, by_path)
+        return self._index[platform]
+
+    def expected(self, platform):
+        """import 시 함께 가져온 기록 당시 추출 결과 키 집합 (없으면 None)"""
+        path = self.root / platform / 'expected.json'
+        if not path.exists():
+            return None
+        return {tuple(k) for k in json.loads(path.read_text(encoding='utf-8'))}
+
+    def lookup(self, platform, url):
+        """반환: (entry, body bytes) 또는 None"""
+        by_url, by_path = self._load(platform)
+        url = url.split('#', 1)[0]
+        stripped = SYNTH_MARK_RE.sub('', url)
+        entry = by_url.get(url) or by_url.get(stripped) or by_path.get(stripped.split('?', 1)[0])
+        if entry is None:
+            return None
+        body = (self.root / platform / 'bodies' / entry['file']).read_bytes() if entry.get('file') else b''
+        return entry, body
+
+
+def read_har(har_path):
+    """
+    HAR(.har 또는 Playwright 가 기록한 .har.zip) 응답 목록
+    반환: [{'method', 'url', 'status', 'headers', 'content_type', 'body'}, ...] (기록 순서)
+    """
+    har_path = Path(har_path)
+    archive = zipfile.ZipFile(har_path) if har_path.suffix == '.zip' else None
+    if archive is not None:
+        har_name = next(n for n in archive.namelist() if n.endswith('.har'))
+        har = json.loads(archive.read(har_name))
+    else:
+        har = json.loads(har_path.read_text(encoding='utf-8'))
+
+    responses = []
+    for item in har['log']['entries']:
+        response = item['response']
+        content = response.get('content') or {}
+        if content.get('_file') and archive is not None:
+            body = archive.read(content['_file'])
+        elif content.get('encoding') == 'base64':
+            body = b64decode(content.get('text') or '')
+        else:
+            body = (content.get('text') or '').encode('utf-8')
+
+        headers = {h['name'].lower(): h['value'] for h in response.get('headers') or []}
+        responses.append({
+            'method': item['request'].get('method', 'GET'),
+            'url': item['request']['url'],
+            'status': response.get('status', 0),
+            'headers': headers,
+            'content_type': content.get('mimeType') or headers.get('content-type', ''),
+            'body': body
+        })
+    return responses
+
+
+def import_har(har_path, platform, root=FIXTURES_DIR):
+    """
+    HAR 응답을 fixture 로 변환
+    같은 URL 이 여러 번 기록된 경우 처음 응답을 사용한다. 반환: 저장한 항목 수
+    HAR 옆의 <platform>.expected.json (run_har_test.py --record) 은 expected.json 으로 복사 (벤치마크 결과 확인용)
+    """
+    har_path = Path(har_path)
+    target = Path(root) / platform
+    (target / 'bodies').mkdir(parents=True, exist_ok=True)
+    entries = []
+    seen = set()
+    for response in read_har(har_path):
+        url = response['url']
+        if url in seen or response['status'] <= 0:
+            continue
+        seen.add(url)
+
+        body = response['body']
+        file_name = None
+        if body:
+            file_name = hashlib.sha1(body).hexdigest()
+            (target / 'bodies' / file_name).write_bytes(body)
+        entries.append({
+            'method': response['method'],
+            'url': url,
+            'status': response['status'],
+            'content_type': response['content_type'],
+            'location': response['headers'].get('location'),
+            'file': file_name
+        })
+
+    (target / 'manifest.json').write_text(
+        json.dumps({'source': har_path.name, 'entries': entries}, ensure_ascii=False, indent=1),
+        encoding='utf-8'
+    )
+    expected_path = har_path.with_name(f"{platform}.expected.json")
+    if expected_path.exists():
+        (target / 'expected.json').write_bytes(expected_path.read_bytes())
+    return len(entries)
+
+
+# --- 합성 카탈로그 (요금제 N 개로 확장) ---
+
+def to_html(root):
+    """parse_html 문서를 HTML 문자열로 직렬화"""
+    return str(root.element)
+
+
+def _mark_href(value, mark):
+    if not value or value.startswith(('#', 'javascript:', 'mailto:', 'tel:')):
+        return value
+    match = re.match(r'([^?#]*)(.*)', value)
+    return match.group(1) + mark + match.group(2)
+
+
+class CatalogSynthesizer:
+    """
+    목록 응답을 요금제 count 개로 확장 (확장성 테스트용)
+    - HTML: 카드 셀렉터에 맞는 요소가 2개 이상인 페이지의 카드를 복제
+    - JSON: api.fields 의 요금제명 키를 가진 dict 리스트를 복제
+    복제본은 요금제명/링크 끝에 ~s<번호> 를 붙여 서로 다른 요금제로 수집되게 하고,
+    fixture 서버는 조회 시 이 표식을 제거해 원본 상세 응답을 돌려준다.
+    """
+
+    def __init__(self, selectors, count):
+        self.count = int(count)
+        extract = selectors.get('extract') or {}
+        listing = selectors.get('list') or {}
+        self.card = extract.get('card') or listing.get('item_card')
+        name_field = (extract.get('fields') or {}).get('plan_name')
+        if isinstance(name_field, dict):
+            name_field = name_field.get('selector')
+        self.name = name_field or listing.get('plan_name')
+        api_fields = (selectors.get('api') or {}).get('fields') or {}
+        self.json_name_keys = [k.split('.')[-1] for k in api_fields.get('plan_name') or []]
+        self.json_mark_keys = set(self.json_name_keys) | {
+            k.split('.')[-1] for name in ('id', 'url', 'plan_id') for k in api_fields.get(name) or []
+        }
+
+    def apply(self, body, content_type):
+        try:
+            if 'json' in content_type and self.json_name_keys:
+                return self._apply_json(body)
+            if 'html' in content_type and self.card:
+                return self._apply_html(body)
+        except Exception as e:
+            logger.warning(f"합성 실패 (원본 응답 사용): {e}")
+        return body
+
+    def _apply_html(self, body):
+        text = body.decode('utf-8', errors='replace')
+        root = parse_html(text)
+        cards = select(root, self.card)
+        if len(cards) < 2 or len(cards) >= self.count:
+            return body
+
+        clones = []
+        for k in range(len(cards), self.count):
+            clone = copy.copy(cards[k % len(cards)].element)  # 하위 요소까지 복사
+            mark = f'~s{k}'
+            for el in [clone, *clone.find_all(href=True)]:
+                if el.get('href') is not None:
+                    el['href'] = _mark_href(el['href'], mark)
+            name_el = clone.select_one(self.name) if self.name else None
+            if name_el is not None:
+                name_el.append(f' {mark}')
+            clones.append(clone)
+        cards[-1].element.insert_after(*clones)
+        return to_html(root).encode('utf-8')
+
+    def _apply_json(self, body):
+        data = json.loads(body)
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                stack.extend(node.values())
+                continue
+            if not isinstance(node, list):
+                continue
+            records = [x for x in node if isinstance(x, dict) and any(k in x for k in self.json_name_keys)]
+            if len(records) >= 2 and len(records) == len(node) and len(node) < self.count:
+                originals = list(node)
+                for k in range(len(originals), self.count):
+                    clone = copy.deepcopy(originals[k % len(originals)])
+                    for key in self.json_mark_keys:
+                        if isinstance(clone.get(key), str):
+                            clone[key] = f"{clone[key]}~s{k}"
+                    node.append(clone)
+                continue
+            stack.extend(node)
+        return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+# --- HTTP 서버 ---
+
+class FixtureServer:
+    """
+    로컬 fixture HTTP 서버 (별도 스레드)
+
+    Usage:
+        server = FixtureServer(FixtureStore(), synthesizers={'moyo': CatalogSynthesizer(selectors, 2000)})
+        server.start()
+        status, headers, body = server.fetch('moyo', 'https://www.moyoplan.com/plans')
+        server.stop()
+    """
+
+    def __init__(self, store, synthesizers=None, host='127.0.0.1', port=0):
+        self.store = store
+        self.synthesizers = synthesizers or {}
+        self.requests = 0
+        self.misses = 0
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url_for(self, platform, original_url):
+        parts = urlsplit(original_url)
+        path = quote(unquote(parts.path or '/'), safe='/~%')
+        query = f"?{parts.query}" if parts.query else ''
+        return f"{self.base_url}/{platform}/{parts.scheme}/{parts.netloc}{path}{query}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='fixture-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def fetch(self, platform, original_url, method='GET'):
+        """fixture 서버를 거쳐 응답 조회 (블로킹, 크롤러 route 에서 asyncio.to_thread 로 호출)"""
+        request = urllib.request.Request(self.url_for(platform, original_url), method='GET')
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                return response.status, dict(response.headers), response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, dict(e.headers), e.read()
+
+    def _serve(self, path):
+        """요청 경로 -> (status, headers, body)"""
+        self.requests += 1
+        try:
+            platform, scheme, rest = path.lstrip('/').split('/', 2)
+        except ValueError:
+            return 400, {}, b''
+        original_url = f"{scheme}://{rest}"
+        found = self.store.lookup(platform, original_url)
+        if found is None:
+            self.misses += 1
+            return 404, {'Content-Type': 'text/plain'}, b'fixture not found'
+
+        entry, body = found
+        headers = {'Content-Type': entry.get('content_type') or 'application/octet-stream'}
+        if entry.get('location'):
+            headers['Location'] = entry['location']
+        synthesizer = self.synthesizers.get(platform)
+        if synthesizer is not None and body:
+            body = synthesizer.apply(body, headers['Content-Type'])
+        return entry['status'], headers, body
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status, headers, body = server._serve(self.path)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_POST = do_GET
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def route_to_fixtures(server, platform):
+    """
+    크롤러 컨텍스트의 모든 요청을 fixture 서버 응답으로 대체하는 context hook
+    (BaseCrawler.context_hooks 에 추가, 네트워크 미사용 - 없는 응답은 404)
+    """
+    import asyncio
+
+    async def handle(route):
+        request = route.request
+        if request.url.startswith(server.base_url) or request.url.startswith('data:'):
+            await route.fallback()
+            return
+        status, headers, body = await asyncio.to_thread(server.fetch, platform, request.url, request.method)
+        fulfill_headers = {k: v for k, v in headers.items() if k.lower() in ('content-type', 'location')}
+        await route.fulfill(status=status, headers=fulfill_headers, body=body)
+
+    async def hook(context):
+        await context.route('**/*', handle)
+
+    return hook
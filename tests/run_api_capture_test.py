@@ -0,0 +1,116 @@
+import json
+import logging
+import re
+import sys
+import os
+from pathlib import Path
+
+# Project root setup
+try:
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'mvno_system')))
+    sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+except:
+    pass
+
+from core.platform_loader import PlatformLoader
+from core.html_doc import parse_html
+from core.network_capture import find_records
+from fixture_server import read_har
+
+# Configure logging
+logging.basicConfig(level=logging.ERROR)
+logger = logging.getLogger('api_capture_test')
+
+USAGE = "Usage: python tests/run_api_capture_test.py <platform> [har_path]"
+
+# 셀렉터 YAML 의 api 매핑(url_patterns / fields / required)을 기록된 실제 응답으로 확인
+# 크롤링 중 캡처와 같은 경로(extract_api_plans)로 변환하므로, 여기서 통과한 매핑만 DOM 수집을 대체한다.
+# HAR 기록: python tests/run_har_test.py <platform> --record
+
+
+def capture_records(responses, spec):
+    """HAR 응답 중 크롤링 중에 캡처됐을 JSON 응답 + 인라인 JSON (NetworkCapture 와 같은 형식)"""
+    patterns = [re.compile(p) for p in spec.get('url_patterns') or []]
+    records = []
+    for response in responses:
+        body = response['body']
+        if not body or response['status'] <= 0:
+            continue
+        if 'json' in response['content_type'] and any(p.search(response['url']) for p in patterns):
+            try:
+                records.append({'url': response['url'], 'status': response['status'], 'data': json.loads(body)})
+            except ValueError:
+                pass
+        elif 'html' in response['content_type'] and spec.get('inline_json'):
+            doc = parse_html(body.decode('utf-8', errors='replace'))
+            for selector in spec['inline_json']:
+                node = doc.select_one(selector)
+                if node is None:
+                    continue
+                try:
+                    records.append({'url': response['url'], 'status': response['status'], 'data': json.loads(node.text())})
+                except ValueError:
+                    pass
+    return records
+
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        print(USAGE)
+        return
+
+    platform_key = args[0]
+    crawler = PlatformLoader().get_crawler(platform_key)
+    if not crawler:
+        print(f"Failed to load {platform_key} crawler.")
+        return
+    spec = crawler.selectors.get('api') or {}
+    if not spec:
+        print(f"{platform_key}: 셀렉터 YAML 에 api 섹션이 없습니다.")
+        return
+
+    har_path = Path(args[1]) if len(args) > 1 else Path(__file__).resolve().parent.parent / 'mvno_system' / 'storage' / 'har' / f"{platform_key}.har.zip"
+    if not har_path.exists():
+        print(f"HAR 파일 없음 (먼저 python tests/run_har_test.py {platform_key} --record): {har_path}")
+        sys.exit(1)
+
+    records = capture_records(read_har(har_path), spec)
+    plans = crawler.extract_api_plans(records)
+    print(f"=== {platform_key}: 캡처 대상 응답 {len(records)}건, 요금제 {len(plans)}개 ===")
+    for record in records:
+        print(f"  - {record['url'][:120]}")
+
+    # 레코드가 나온 JSON 위치 - 요금제 목록 위치만 api.record_paths 로 고정 (배너/추천 위젯 제외)
+    where = {}
+    for record in records:
+        for path, _ in find_records(record['data'], spec.get('fields') or {}, spec.get('required'), spec.get('record_paths'), with_path=True):
+            where[path] = where.get(path, 0) + 1
+    for path, count in sorted(where.items(), key=lambda x: -x[1]):
+        print(f"  위치 {path or '(최상위)'}: {count}개")
+    if not spec.get('record_paths') and len(where) > 1:
+        print("  ! 여러 위치에서 레코드가 나옵니다. 요금제 목록 위치를 api.record_paths 로 지정하세요.")
+
+    fields = list((spec.get('fields') or {}).keys())
+    for field in fields:
+        filled = sum(1 for plan in plans if plan.get(field) not in (None, ''))
+        print(f"  {field}: {filled}/{len(plans)}")
+    for plan in plans[:5]:
+        print(f"  예) {plan}")
+
+    # run_har_test.py --record 가 남긴 DOM 수집 결과와 요금제명 대조
+    expected_path = har_path.with_name(f"{platform_key}.expected.json")
+    if expected_path.exists() and plans:
+        with open(expected_path, 'r', encoding='utf-8') as f:
+            expected = {' '.join(str(k[1] or '').split()) for k in json.load(f)}
+        names = {' '.join(str(plan.get('plan_name') or '').split()) for plan in plans}
+        print(f"DOM 수집 결과 요금제명 일치: {len(expected & names)}/{len(expected)}")
+        if expected and not expected & names:
+            sys.exit(1)
+
+    if not plans:
+        print("API 매핑으로 추출된 요금제가 없습니다 (url_patterns / fields 확인 필요).")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Project root setup
+try:
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'mvno_system')))
+    sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+except:
+    pass
+
+# Configure logging
+logging.basicConfig(level=logging.ERROR)
+logger = logging.getLogger('benchmark')
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# 로컬 fixture 서버 기반 크롤러 벤치마크
+#
+#   python tests/run_benchmark.py import-har moyo [mvno_system/storage/har/moyo.har.zip]
+#   python tests/run_benchmark.py run [moyo liivm ...] [--plans 2000] [--limit N]
+#                                     [--out bench.json] [--compare prev.json]
+#
+# 네트워크 없이 fixture 응답만으로 크롤링하고 플랫폼별 plans/sec, 단계별 wall time,
+# 브라우저 실행 횟수, 최대 메모리를 JSON 으로 남긴다 (커밋 간 비교용).
+# 결과도 확인한다 (check_result): 에러/수집 0건/필수 필드 누락/기록 당시 추출 결과(expected.json) 누락/
+# 합성 개수 미달이 있으면 플랫폼별 problems 에 남기고 종료 코드 1.
+
+
+def peak_rss_mb():
+    """현재 프로세스 + 자식 프로세스(브라우저) 최대 RSS (MB)"""
+    try:
+        import resource
+        own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+        return round(own / scale, 1), round(children / scale, 1)
+    except Exception:
+        return None, None
+
+
+def current_rss_mb():
+    """현재 RSS (브라우저 자식 프로세스 포함, psutil 이 있을 때만)"""
+    try:
+        import psutil
+    except ImportError:
+        return None
+    process = psutil.Process()
+    total = process.memory_info().rss
+    for child in process.children(recursive=True):
+        try:
+            total += child.memory_info().rss
+        except psutil.Error:
+            pass
+    return round(total / (1024 * 1024), 1)
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except Exception:
+        return None
+
+
+async def sample_memory(samples, interval=0.5):
+    while True:
+        value = await asyncio.to_thread(current_rss_mb)
+        if value is None:
+            return
+        samples.append(value)
+        await asyncio.sleep(interval)
+
+
+def check_result(result, items, expected=None, synthetic_plans=0, limit=0):
+    """벤치마크 1회 결과 확인 -> 문제 설명 리스트 (빈 리스트 = 통과)"""
+    from fixture_server import REQUIRED_FIELDS, result_key
+
+    problems = []
+    if result.get('error'):
+        problems.append(f"크롤링 에러: {result['error']}")
+    elif result.get('status') != 'success':
+        problems.append(f"크롤링 로그 상태: {result.get('status')}")
+    if not items:
+        problems.append("수집 0건")
+        return problems
+
+    for field in REQUIRED_FIELDS:
+        empty = sum(1 for item in items if item.get(field) in (None, ''))
+        if empty:
+            problems.append(f"{field} 비어 있음: {empty}/{len(items)}")
+
+    if expected:
+        # 기록(run_har_test.py --record)은 test_mode 일부만 수집하므로 기록된 키가 모두 있어야 함 (추가 수집은 허용)
+        missing = expected - {result_key(item) for item in items}
+        if missing:
+            problems.append(
+                f"기록 당시 결과 누락 {len(missing)}/{len(expected)}: " + ", ".join(str(k) for k in sorted(missing, key=str)[:3])
+            )
+    if synthetic_plans and not limit and len(items) < synthetic_plans:
+        problems.append(f"합성 목록 {synthetic_plans}개 중 {len(items)}개만 수집")
+    return problems
+
+
+async def bench_platform(platform_key, server, limit):
+    from core.platform_loader import PlatformLoader
+    from core.browser_pool import BrowserPool
+    from fixture_server import route_to_fixtures
+
+    crawler = PlatformLoader().get_crawler(platform_key)
+    if not crawler:
+        return {'platform': platform_key, 'error': 'crawler load failed'}
+
+    crawler.set_session(f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    crawler.force_full = True
+    # HttpClient 요청은 route 로 가로챌 수 없으므로 fixture 모드에서는 브라우저로 수집
+    if crawler.fetch_mode == 'http':
+        crawler.fetch_mode = 'browser'
+    crawler.context_hooks.append(route_to_fixtures(server, platform_key))
+
+    # 단계 구분: 첫 요금제 저장 / 요금제 수집 / 마무리(DB flush, export)
+    marks = {}
+    save_plan = crawler.save_plan
+    finish_crawl_log = crawler.finish_crawl_log
+
+    def timed_save_plan(plan_data):
+        marks.setdefault('first_plan', time.perf_counter())
+        return save_plan(plan_data)
+
+    async def timed_finish(*args, **kwargs):
+        marks.setdefault('finish_start', time.perf_counter())
+        # 크롤러가 예외를 잡고 failed 로 종료하는 경우도 실패로 확인
+        marks.setdefault('status', kwargs.get('status', args[0] if args else 'success'))
+        marks.setdefault('error', kwargs.get('error', args[1] if len(args) > 1 else None))
+        try:
+            return await finish_crawl_log(*args, **kwargs)
+        finally:
+            marks['finish_end'] = time.perf_counter()
+
+    crawler.save_plan = timed_save_plan
+    crawler.finish_crawl_log = timed_finish
+
+    launches_before = BrowserPool().launches
+    requests_before, misses_before = server.requests, server.misses
+    memory = []
+    sampler = asyncio.create_task(sample_memory(memory))
+
+    error = None
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    try:
+        await crawler.crawl(headless=True, test_mode=limit > 0, limit=limit)
+    except Exception as e:
+        error = str(e)
+    crawled = time.perf_counter()
+    sampler.cancel()
+
+    first = marks.get('first_plan', crawled)
+    finish_start = marks.get('finish_start', crawled)
+    count = len(crawler.results)
+    collect_sec = finish_start - started
+    return {
+        'platform': platform_key,
+        'plans': count,
+        'plans_per_sec': round(count / collect_sec, 2) if count and collect_sec > 0 else 0.0,
+        'wall_sec': round(crawled - started, 3),
+        'cpu_sec': round(time.process_time() - cpu_started, 3),
+        'phases': {
+            'to_first_plan': round(first - started, 3),
+            'collect': round(finish_start - first, 3),
+            'finish': round(marks.get('finish_end', crawled) - finish_start, 3)
+        },
+        'browser_launches': BrowserPool().launches - launches_before,
+        'fixture_requests': server.requests - requests_before,
+        'fixture_misses': server.misses - misses_before,
+        'peak_rss_mb': max(memory) if memory else None,
+        'metrics': crawler.metrics.summary(),
+        'status': marks.get('status'),
+        'error': error or (str(marks['error']) if marks.get('error') else None),
+        'items': crawler.results
+    }
+
+
+async def run(args):
+    # DB / 세션 산출물(storage/, screenshots)은 cwd 기준이므로 임시 작업 디렉토리에서 실행
+    workdir = Path(args.workdir or tempfile.mkdtemp(prefix='mvno_bench_'))
+    workdir.mkdir(parents=True, exist_ok=True)
+    (workdir / 'storage').mkdir(exist_ok=True)
+    os.chdir(workdir)
+
+    from core.platform_loader import PlatformLoader
+    from core.browser_pool import BrowserPool
+    from fixture_server import FixtureStore, FixtureServer, CatalogSynthesizer
+
+    store = FixtureStore(args.fixtures) if args.fixtures else FixtureStore()
+    available = store.platforms()
+    platforms = args.platforms or available
+    missing = [p for p in platforms if p not in available]
+    if missing:
+        print(f"fixture 없음 (import-har 로 먼저 가져오기): {', '.join(missing)}")
+    platforms = [p for p in platforms if p in available and p in PlatformLoader().platforms]
+    if not platforms:
+        print("벤치마크할 플랫폼이 없습니다.")
+        return 1
+
+    synthesizers = {}
+    if args.plans:
+        for platform_key in platforms:
+            crawler = PlatformLoader().get_crawler(platform_key)
+            if crawler:
+                synthesizers[platform_key] = CatalogSynthesizer(crawler.selectors, args.plans)
+
+    server = FixtureServer(store, synthesizers).start()
+    print(f"=== Benchmark (fixtures: {server.base_url}, workdir: {workdir}) ===")
+    results = []
+    total_started = time.perf_counter()
+    try:
+        for platform_key in platforms:
+            result = await bench_platform(platform_key, server, args.limit)
+            result['problems'] = check_result(
+                result, result.pop('items', []), store.expected(platform_key), args.plans, args.limit
+            )
+            results.append(result)
+            status = 'FAILED' if result['problems'] else 'ok'
+            print(
+                f"[{platform_key}] {result.get('plans', 0)} plans, {result.get('plans_per_sec', 0)} plans/s, "
+                f"{result.get('wall_sec', 0)}s, launches={result.get('browser_launches', 0)} ({status})"
+            )
+            for problem in result['problems']:
+                print(f"  ! {problem}")
+    finally:
+        await BrowserPool().shutdown()
+        server.stop()
+
+    own_rss, children_rss = peak_rss_mb()
+    report = {
+        'commit': git_commit(),
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'synthetic_plans': args.plans or None,
+        'limit': args.limit,
+        'total_wall_sec': round(time.perf_counter() - total_started, 3),
+        'browser_launches': BrowserPool().launches,
+        'peak_rss_mb': {'python': own_rss, 'browser': children_rss},
+        'platforms': {r['platform']: r for r in results}
+    }
+
+    out = Path(args.out) if args.out else REPO_ROOT / 'tests' / f"benchmark_{report['commit'] or 'local'}.json"
+    out.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+    print(f"Report saved to: {out}")
+
+    if args.compare:
+        compare(json.loads(Path(args.compare).read_text(encoding='utf-8')), report)
+    failed = [r['platform'] for r in results if r.get('problems')]
+    print(f"FAILED: {', '.join(failed)}" if failed else "OK")
+    return 1 if failed else 0
+
+
+def compare(previous, current):
+    """이전 리포트 대비 플랫폼별 plans/sec, wall time 변화 출력"""
+    print(f"\n=== {previous.get('commit')} -> {current.get('commit')} ===")
+    print(f"{'platform':<14}{'plans':>8}{'plans/s':>18}{'wall(s)':>20}")
+    for key, now in current['platforms'].items():
+        before = previous.get('platforms', {}).get(key)
+        if not before:
+            print(f"{key:<14}{now.get('plans', 0):>8}{now.get('plans_per_sec', 0):>18}{now.get('wall_sec', 0):>20}")
+            continue
+
+        def delta(name):
+            old, new = before.get(name) or 0, now.get(name) or 0
+            change = f" ({(new - old) / old * 100:+.0f}%)" if old else ''
+            return f"{old}->{new}{change}"
+
+        print(f"{key:<14}{now.get('plans', 0):>8}{delta('plans_per_sec'):>18}{delta('wall_sec'):>20}")
+
+
+def import_fixtures(args):
+    from fixture_server import import_har
+
+    har_path = Path(args.har or REPO_ROOT / 'mvno_system' / 'storage' / 'har' / f"{args.platform}.har.zip")
+    if not har_path.exists():
+        print(f"HAR 파일 없음 (먼저 main.py --record-har 로 기록): {har_path}")
+        return 1
+    count = import_har(har_path, args.platform, args.fixtures) if args.fixtures else import_har(har_path, args.platform)
+    print(f"{args.platform}: {count}개 응답을 fixture 로 저장")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='MVNO crawler benchmark (local fixtures)')
+    parser.add_argument('--fixtures', help='fixture 디렉토리 (기본: tests/fixtures)')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    importer = sub.add_parser('import-har', help='HAR 기록을 fixture 로 변환')
+    importer.add_argument('platform')
+    importer.add_argument('har', nargs='?')
+
+    runner = sub.add_parser('run', help='fixture 로 크롤러 벤치마크 실행')
+    runner.add_argument('platforms', nargs='*', help='플랫폼 키 (기본: fixture 가 있는 전체)')
+    runner.add_argument('--plans', type=int, default=0, help='목록을 N 개 요금제로 합성 확장')
+    runner.add_argument('--limit', type=int, default=0, help='플랫폼별 수집 개수 제한 (0 = 전체)')
+    runner.add_argument('--out', help='결과 JSON 경로')
+    runner.add_argument('--compare', help='비교할 이전 결과 JSON')
+    runner.add_argument('--workdir', help='DB/세션 산출물 작업 디렉토리 (기본: 임시 디렉토리)')
+
+    args = parser.parse_args()
+    if args.fixtures:
+        args.fixtures = os.path.abspath(args.fixtures)
+    if args.command == 'import-har':
+        return import_fixtures(args)
+    # run 은 작업 디렉토리로 이동하므로 경로 인자는 미리 절대경로로
+    for name in ('out', 'compare', 'workdir'):
+        if getattr(args, name):
+            setattr(args, name, os.path.abspath(getattr(args, name)))
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+import asyncio
+import json
+import logging
+import sys
+import os
+import time
+from datetime import datetime
+
+# Project root setup
+try:
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'mvno_system')))
+    sys.path.append(os.path.abspath(os.path.dirname(__file__)))
+except:
+    pass
+
+from core.platform_loader import PlatformLoader
+from fixture_server import result_key
+
+# Configure logging
+logging.basicConfig(level=logging.ERROR)
+logger = logging.getLogger('har_test')
+
+USAGE = "Usage: python tests/run_har_test.py <platform> --record|--replay [--limit N]"
+
+async def main():
+    args = sys.argv[1:]
+    if not args or args[0].startswith('--') or not ({'--record', '--replay'} & set(args)):
+        print(USAGE)
+        return
+
+    platform_key = args[0]
+    mode = 'record' if '--record' in args else 'replay'
+    limit = int(args[args.index('--limit') + 1]) if '--limit' in args else 3
+
+    loader = PlatformLoader()
+    crawler = loader.get_crawler(platform_key)
+    if not crawler:
+        print(f"Failed to load {platform_key} crawler.")
+        return
+
+    session_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+    print(f"=== HAR {mode} test: {platform_key} (Session: {session_id}) ===")
+    crawler.set_session(session_id)
+    crawler.set_har_mode(mode)
+    # 기록/재생이 같은 페이지를 방문하도록 증분 생략 없이 전체 수집
+    crawler.force_full = True
+    expected_path = crawler.har_path.with_name(f"{platform_key}.expected.json")
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        await crawler.crawl(headless=True, test_mode=True, limit=limit)
+    except Exception as e:
+        print(f"Exception during crawl: {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        await crawler.shutdown_browsers()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    print(f"Items: {len(crawler.results)}")
+    print(f"Wall time: {wall:.2f}s / Python CPU time: {cpu:.2f}s (브라우저 프로세스 제외)")
+    print(f"Metrics: {crawler.metrics.summary()}")
+
+    keys = sorted(result_key(item) for item in crawler.results)
+    if mode == 'record':
+        with open(expected_path, 'w', encoding='utf-8') as f:
+            json.dump(keys, f, ensure_ascii=False, indent=2)
+        print(f"HAR saved to: {crawler.har_path}")
+        print(f"Expected results saved to: {expected_path}")
+        return
+
+    # 재생 결과를 기록 당시 추출 결과와 비교 (추출 정확도 회귀 확인)
+    if not expected_path.exists():
+        print("No expected results to compare (record first).")
+        return
+    with open(expected_path, 'r', encoding='utf-8') as f:
+        expected = {tuple(k) for k in json.load(f)}
+    actual = set(keys)
+    missing = expected - actual
+    extra = actual - expected
+    print(f"Matched: {len(expected & actual)}/{len(expected)}, Missing: {len(missing)}, Extra: {len(extra)}")
+    for key in sorted(missing, key=str)[:10]:
+        print(f"  - missing: {key}")
+    for key in sorted(extra, key=str)[:10]:
+        print(f"  + extra:   {key}")
+    if missing or extra:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,122 @@
+import logging
+import sys
+import os
+from pathlib import Path
+
+# Project root setup
+try:
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'mvno_system')))
+except:
+    pass
+
+from core.html_doc import parse_html
+from core.platform_loader import PlatformLoader
+
+# Configure logging
+logging.basicConfig(level=logging.ERROR)
+logger = logging.getLogger('html_doc_test')
+
+USAGE = "Usage: python tests/run_html_doc_test.py [egmobile_html_path]"
+
+# fetch_mode: http 파싱 확인 (브라우저/네트워크 없음)
+# 저장된 이지모바일 요금표 HTML 을 크롤러의 parse_list 로 추출해 필드를 비교하고,
+# 셀렉터 YAML 에서 쓰는 문법 (속성/:nth-child/:not/결합자) 과 HTML 예외 처리 (닫히지 않은 태그, script/style, 엔티티) 를 확인한다.
+# 실제 페이지 저장본으로 확인: python tests/run_html_doc_test.py saved.html (행 수/빈 필드만 출력)
+
+HTML_DIR = Path(__file__).parent / 'html'
+
+EGMOBILE_EXPECTED = [
+    {'carrier': 'EG Mobile (KT)', 'plan_name': 'EG 데이터 11GB+ (일 2GB)', 'data': '11GB + 일 2GB\n소진 시 3Mbps', 'voice': '기본제공', 'price': '16,500원'},
+    {'carrier': 'EG Mobile (KT)', 'plan_name': 'EG 7GB & 통화', 'data': '7GB', 'voice': '100분', 'price': '19,800원'},
+    {'carrier': 'EG Mobile (KT)', 'plan_name': 'EG 안심 1.5GB\n가족결합 가능', 'data': '1.5GB', 'voice': '50분', 'price': '5,500원'},
+]
+
+SELECTOR_DOC = """
+<div id="list">
+  <ul class="plans">
+    <li class="card best" data-plan-id="p-1"><a href="/plans/1?ref=list">요금제 1</a>
+    <li class="card"><a href="/plans/2">요금제 2</a>
+    <li class="card ad"><a href="https://ad.example.com/x">광고</a>
+    <li class="card"><a href="/plans/search?q=1">검색</a>
+  </ul>
+  <h3>혜택</h3><p>첫 번째<p>두 번째
+  <div class="notes"><span class="note">A</span><span class="note">B</span></div>
+</div>
+"""
+
+# (셀렉터, 기대 텍스트 목록)
+SELECTOR_CASES = [
+    ('ul.plans > li', ['요금제 1', '요금제 2', '광고', '검색']),
+    ('li:nth-child(2n+1) a', ['요금제 1', '광고']),
+    ('li:nth-child(2)', ['요금제 2']),
+    ('li.card:not(.ad) > a[href^="/plans/"]:not([href*="search"])', ['요금제 1', '요금제 2']),
+    ('a[href$="ref=list"]', ['요금제 1']),
+    ('[data-plan-id="p-1"]', ['요금제 1']),
+    ('li.best + li', ['요금제 2']),
+    ('h3 ~ p', ['첫 번째', '두 번째']),   # 닫히지 않은 p 는 다음 p / div 앞에서 닫힘 (브라우저와 동일)
+    ('span.note:last-child', ['B']),
+    ('#list span:nth-of-type(1)', ['A']),
+]
+
+
+def check_egmobile(html_path, expected=None):
+    crawler = PlatformLoader().get_crawler('egmobile')
+    if not crawler:
+        print("Failed to load egmobile crawler.")
+        return False
+
+    items = crawler.parse_list(parse_html(html_path.read_text(encoding='utf-8')), 'KT')
+    print(f"=== egmobile: {html_path.name} -> {len(items)}개 ===")
+    for item in items:
+        print(f"  {item}")
+    if expected is None:
+        empty = [key for key in ('plan_name', 'price') if not all(item.get(key) for item in items)]
+        if empty:
+            print(f"  빈 필드: {empty}")
+        return bool(items) and not empty
+
+    ok = items == expected
+    if not ok:
+        for got, want in zip(items, expected):
+            if got != want:
+                print(f"  ! 기대값: {want}")
+    return ok and len(items) == len(expected)
+
+
+def check_selectors():
+    doc = parse_html(SELECTOR_DOC)
+    ok = True
+    print("=== selectors ===")
+    for selector, expected in SELECTOR_CASES:
+        got = [node.text() for node in doc.select(selector)]
+        status = "OK" if got == expected else "FAIL"
+        ok = ok and got == expected
+        print(f"  [{status}] {selector}: {got}" + ("" if got == expected else f" (기대: {expected})"))
+
+    first = doc.select_one('li a')
+    if first is None or first.get_attribute('href') != '/plans/1?ref=list' or first.get_attribute('target') is not None:
+        print(f"  [FAIL] get_attribute: {first}")
+        ok = False
+    if doc.select_one('table') is not None:
+        print("  [FAIL] select_one: 없는 요소")
+        ok = False
+    return ok
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] in ('-h', '--help'):
+        print(USAGE)
+        return
+
+    if args:
+        passed = check_egmobile(Path(args[0]))
+    else:
+        passed = check_egmobile(HTML_DIR / 'egmobile_list.html', EGMOBILE_EXPECTED)
+        passed = check_selectors() and passed
+    print("OK" if passed else "FAILED")
+    if not passed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
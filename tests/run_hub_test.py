@@ -27,6 +27,9 @@ async def main():
             print(f"Excel saved to: {saved_file}")
     else:
         print("No items found.")
-        
+
+    # 공유 브라우저 풀 정리
+    await crawler.shutdown_browsers()
+
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import sys
+import os
+import tempfile
+
+# Project root setup
+try:
+    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'mvno_system')))
+except:
+    pass
+
+# DB(storage/mvno.db)는 현재 디렉토리 기준이므로 임시 디렉토리에서 실행 (실제 DB 를 건드리지 않음)
+WORKDIR = tempfile.mkdtemp(prefix='mvno_incremental_')
+os.chdir(WORKDIR)
+
+from crawlers.base_crawler import BaseCrawler
+from storage.database import SessionLocal
+from storage.db_writer import DbWriter
+from storage.queries import current_plans
+
+# Configure logging
+logging.basicConfig(level=logging.ERROR)
+logger = logging.getLogger('incremental_test')
+
+# 증분 수집 확인 (브라우저/네트워크 없음)
+# 목록 카드가 그대로인 재실행에서는 상세 방문이 모두 생략되어야 한다.
+# 상세 워커는 모요처럼 목록 item dict 에 상세 값을 채워 넣는다 (fingerprint 는 그 전의 목록 카드 기준이어야 함).
+# 가격 없이 요금제명만 있는 목록 카드는 비교할 수 없으므로 증분 모드에서도 매번 상세를 방문해 가격 변경을 기록해야 한다.
+# 마지막 limit 실행(부분 실행)은 current_plans 에서 보지 못한 요금제를 지우면 안 된다.
+
+RUNS = 3
+LIST_CARDS = [
+    {'url': f"https://example.com/plans/{i}", 'carrier': 'TestMobile', 'plan_name': f"테스트 {i}GB", 'price': f"월 {i},000원"}
+    for i in range(1, 6)
+]
+
+# 요금제명/통신사만 있는 카드 (토스/허브/프리티/SK7 처럼 가격은 상세에만 있음)
+NAME_ONLY_CARDS = [
+    {'url': f"https://example.com/named/{i}", 'carrier': 'TestMobile', 'plan_name': f"이름만 {i}"}
+    for i in range(1, 6)
+]
+
+
+class ListCardCrawler(BaseCrawler):
+    def __init__(self):
+        super().__init__('moyo')
+        self.visited = 0
+
+    async def _detail(self, page, item):
+        self.visited += 1
+        item['network'] = 'SKT'
+        item['data_raw'] = item['plan_name'].split()[-1]
+        item['details'] = {'voice': '기본제공'}
+        item['screenshot_path'] = f"storage/screenshots/{self.visited}.png"
+        return item
+
+    async def crawl(self, headless=True, **kwargs):
+        await self.start_crawl_log(**kwargs)
+        items = self.limit_items([dict(card) for card in LIST_CARDS], kwargs)
+        await self.run_detail_workers(None, items, worker=self._detail, on_result=self.save_plan, page=object(), concurrency=1)
+        await self.finish_crawl_log(status='success')
+
+
+class NameOnlyCardCrawler(ListCardCrawler):
+    """상세 페이지의 가격이 실행마다 바뀜 (price_step)"""
+    def __init__(self, price_step):
+        super().__init__()
+        self.price_step = price_step
+
+    async def _detail(self, page, item):
+        item = await super()._detail(page, item)
+        item['price'] = f"월 {self.price_step},000원"
+        return item
+
+    async def crawl(self, headless=True, **kwargs):
+        await self.start_crawl_log(**kwargs)
+        items = [dict(card) for card in NAME_ONLY_CARDS]
+        await self.run_detail_workers(None, items, worker=self._detail, on_result=self.save_plan, page=object(), concurrency=1)
+        await self.finish_crawl_log(status='success')
+
+
+async def main():
+    print(f"=== Incremental skip test (workdir: {WORKDIR}) ===")
+    failed = False
+    for run in range(1, RUNS + 1):
+        crawler = ListCardCrawler()
+        await crawler.crawl()
+        skipped = int(crawler.metrics.get('incremental_skipped'))
+        print(f"Run {run}: mode={crawler.crawl_mode}, 상세 방문 {crawler.visited}, 생략 {skipped}, 결과 {len(crawler.results)}")
+        if run > 1 and (crawler.crawl_mode != 'incremental' or crawler.visited or skipped != len(LIST_CARDS)):
+            failed = True
+        if len(crawler.results) != len(LIST_CARDS):
+            failed = True
+
+    crawler = ListCardCrawler()
+    crawler.force_full = True
+    await crawler.crawl(limit=2)
+    db = SessionLocal()
+    try:
+        kept = sum(1 for _ in current_plans(db, 'moyo'))
+    finally:
+        db.close()
+    print(f"Partial run (limit=2): full_run={crawler.full_run}, 상세 방문 {crawler.visited}, current_plans {kept}개")
+    if crawler.full_run or crawler.visited != 2 or kept != len(LIST_CARDS):
+        failed = True
+
+    for run, price_step in enumerate([10, 20], start=1):
+        crawler = NameOnlyCardCrawler(price_step)
+        await crawler.crawl()
+        skipped = int(crawler.metrics.get('incremental_skipped'))
+        print(f"Name-only run {run}: mode={crawler.crawl_mode}, 상세 방문 {crawler.visited}, 생략 {skipped}, 변경 {crawler.plan_writer.changed}")
+        if crawler.visited != len(NAME_ONLY_CARDS) or skipped or crawler.plan_writer.changed != len(NAME_ONLY_CARDS):
+            failed = True
+
+    DbWriter().close()
+    print("FAILED" if failed else "OK")
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -41,6 +41,8 @@ async def main():
                print("Failed. No items found.")
         except Exception as e:
             print(f"Exception during crawl: {e}")
+        finally:
+            await crawler.shutdown_browsers()
     else:
         print("Failed to load Moyo crawler.")
 
@@ -13,6 +13,7 @@ except:
     pass
 
 from core.platform_loader import PlatformLoader
+from core.browser_pool import BrowserPool
 
 # Configure logging
 logging.basicConfig(level=logging.ERROR) # Helper logging
@@ -60,6 +61,9 @@ async def main():
         
     results_list = await asyncio.gather(*tasks)
     
+    # 모든 크롤러가 공유 브라우저 풀을 사용하므로 마지막에 한 번만 종료
+    await BrowserPool().shutdown()
+    
     # Filter empty results
     all_data = {name: res for name, res in results_list if res}
     
@@ -23,5 +23,8 @@ async def main():
     crawler.export_excel()
     print("Test finished.")
 
+    # 공유 브라우저 풀 정리
+    await crawler.shutdown_browsers()
+
 if __name__ == "__main__":
     asyncio.run(main())
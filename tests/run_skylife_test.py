@@ -45,6 +45,8 @@ async def main():
             print(f"Exception during crawl: {e}")
             import traceback
             traceback.print_exc()
+        finally:
+            await crawler.shutdown_browsers()
     else:
         print("Failed to load SkyLife crawler.")
 